@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import requests
+from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi_cloudauth.base import ScopedAuth
+from fastapi_cloudauth.cognito import JWKS, Cognito, CognitoExtraVerifier
+from jose import jwt
+from jose.backends.base import Key
+from utils.logger import logger
+
+
+class CachedJWKS(JWKS):
+    """The JSON Web Key Set of a user pool, loaded from a file instead of the network when possible.
+
+    The keys are read from the first cache file that exists, e.g. one bundled with the deployment package or one
+    written to /tmp by a previous invocation. The user pool is only queried when a token is signed with a key ID that is
+    not in the cache (the keys were rotated or the cache is missing), and the fetched keys are written back to the last
+    cache file.
+    """
+
+    REFRESH_INTERVAL_SECONDS = 60
+    REQUEST_TIMEOUT_SECONDS = 5
+
+    def __init__(self, url: str, cache_file_paths: List[str]) -> None:
+        # Fixed keys stop the base class from querying the user pool on creation
+        super().__init__(url=url, fixed_keys={})
+        self.__url = url
+        self.__cache_file_paths = cache_file_paths
+        self.__keys: Dict[str, Key] = {}
+        self.__last_refresh: Optional[float] = None
+        self.__refresh_lock = threading.Lock()
+
+        for cache_file_path in cache_file_paths:
+            self.__keys = self.__load_cache_file(cache_file_path)
+            if self.__keys:
+                break
+
+    async def get_publickey(self, kid: str) -> Optional[Key]:
+        """Get the public key of a key ID, querying the user pool once if it is not cached.
+
+        :param kid: The key ID from the token header.
+        :type kid: str
+
+        :return: The public key, or None if the user pool does not have it.
+        :rtype: Optional[Key]
+
+        """
+        public_key = self.__keys.get(kid)
+        if public_key is None:
+            self._refresh_keys()
+            public_key = self.__keys.get(kid)
+
+        return public_key
+
+    def _refresh_keys(self) -> None:
+        # Tokens with unknown key IDs must not make every request query the user pool
+        with self.__refresh_lock:
+            now = time.monotonic()
+            if self.__last_refresh is not None and now - self.__last_refresh < self.REFRESH_INTERVAL_SECONDS:
+                return
+
+            self.__last_refresh = now
+            try:
+                response = requests.get(self.__url, timeout=self.REQUEST_TIMEOUT_SECONDS)
+                response.raise_for_status()
+                jwks = response.json()
+                self.__keys = self._construct(jwks)
+            except (requests.RequestException, ValueError) as e:
+                logger.error(f'Failed to fetch JWKS from {self.__url}: {e}')
+                return
+
+            self.__write_cache_file(self.__cache_file_paths[-1], jwks)
+
+    def __load_cache_file(self, cache_file_path: str) -> Dict[str, Key]:
+        if not os.path.isfile(cache_file_path):
+            return {}
+
+        try:
+            with open(cache_file_path) as f:
+                return self._construct(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring JWKS cache file {cache_file_path}: {e}')
+            return {}
+
+    @staticmethod
+    def __write_cache_file(cache_file_path: str, jwks: Dict[str, Any]) -> None:
+        temporary_path = f'{cache_file_path}.{os.getpid()}.tmp'
+        try:
+            with open(temporary_path, 'w') as f:
+                json.dump(jwks, f)
+            os.replace(temporary_path, cache_file_path)
+        except OSError as e:
+            logger.warning(f'Failed to write JWKS cache file {cache_file_path}: {e}')
+
+
+class CachedCognito(Cognito):
+    """Verifies Cognito access tokens like Cognito, remembering the tokens it verified until they expire.
+
+    Repeated requests with the same token skip the signature and claims verification. Tokens are keyed by their
+    SHA-256 hash, so the cache never holds a usable token.
+    """
+
+    MAX_CACHED_TOKENS = 1024
+    __verified_tokens: Dict[tuple, Dict[str, Any]] = {}
+
+    def __init__(
+        self,
+        region: str,
+        user_pool_id: str,
+        client_id: str,
+        jwks_file_path: Optional[str] = None,
+        scope_key: Optional[str] = 'cognito:groups',
+        auto_error: bool = True,
+    ) -> None:
+        issuer = f'https://cognito-idp.{region}.amazonaws.com/{user_pool_id}'
+        cache_file_paths = [jwks_file_path] if jwks_file_path else []
+        cache_file_paths.append(os.path.join(tempfile.gettempdir(), f'cognito-jwks-{user_pool_id}.json'))
+
+        # Same as Cognito.__init__, which always queries the user pool for its keys
+        ScopedAuth.__init__(
+            self,
+            CachedJWKS(url=f'{issuer}/.well-known/jwks.json', cache_file_paths=cache_file_paths),
+            audience=client_id,
+            issuer=issuer,
+            scope_key=scope_key,
+            auto_error=auto_error,
+            extra=CognitoExtraVerifier(client_id=client_id, issuer=issuer, token_use={'access'}),
+        )
+
+    async def __call__(
+        self,
+        http_auth: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+    ) -> Any:
+        if http_auth is None:
+            return await super().__call__(http_auth)
+
+        # The scopes are part of the key, since clones of the verifier may require different ones
+        scope_name = self.verifier.scope_name
+        cache_key = (
+            hashlib.sha256(http_auth.credentials.encode()).hexdigest(),
+            frozenset(scope_name or ()),
+            self.verifier.op.value,
+        )
+        claims = self.__verified_tokens.get(cache_key)
+        if claims is not None and claims.get('exp', 0) > time.time():
+            return await self.call(http_auth)
+
+        current_user = await super().__call__(http_auth)
+        if current_user is not None:
+            self.__remember_token(cache_key, http_auth)
+
+        return current_user
+
+    @classmethod
+    def __remember_token(cls, cache_key: tuple, http_auth: HTTPAuthorizationCredentials) -> None:
+        claims = jwt.get_unverified_claims(http_auth.credentials)
+        if not claims.get('exp'):
+            return
+
+        if len(cls.__verified_tokens) >= cls.MAX_CACHED_TOKENS:
+            now = time.time()
+            for expired_key in [key for key, value in cls.__verified_tokens.items() if value['exp'] <= now]:
+                del cls.__verified_tokens[expired_key]
+
+            while len(cls.__verified_tokens) >= cls.MAX_CACHED_TOKENS:
+                del cls.__verified_tokens[next(iter(cls.__verified_tokens))]
+
+        cls.__verified_tokens[cache_key] = claims
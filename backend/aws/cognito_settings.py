@@ -1,8 +1,8 @@
 import os  # from the computer, it finds a .env file
 
+from aws.cognito_cache import CachedCognito
 from constants.common_constants import UserRoles
 from fastapi import Depends, HTTPException
-from fastapi_cloudauth import Cognito
 from pydantic import BaseModel, Field
 
 
@@ -12,10 +12,11 @@ class AccessUser(BaseModel):
     username: str = None
 
 
-__auth = Cognito(
+__auth = CachedCognito(
     region=os.environ['REGION'],
-    userPoolId=os.environ['USER_POOL_ID'],
+    user_pool_id=os.environ['USER_POOL_ID'],
     client_id=os.environ['USER_POOL_CLIENT_ID'],
+    jwks_file_path=os.getenv('COGNITO_JWKS_FILE', os.path.join(os.path.dirname(__file__), 'cognito_jwks.json')),
 )
 
 
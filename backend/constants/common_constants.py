@@ -52,6 +52,43 @@ class CommonConstants:
     PH_COUNTRY_CODE = 'PH'
     PH_DIAL_CODE = '+63'
 
+    # Pagination Constants
+    LIMIT = 'limit'
+    CURSOR = 'cursor'
+    NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+    MAX_PAGE_SIZE = 100
+
+    # Cache Constants
+    EVENT_CACHE_MAX_SIZE = 256
+    EVENT_CACHE_TTL_SECONDS = 30
+
+    # Scan Constants
+    PARALLEL_SCAN_TOTAL_SEGMENTS = 4
+    PARALLEL_SCAN_BUFFER_SIZE = 1000
+
+    # Bulk Update Constants
+    BULK_UPDATE_MAX_WORKERS = 16
+
+    # Metrics Constants
+    REPOSITORY_METRICS_NAMESPACE = 'TechTix/Repository'
+
+    # Queue Constants
+    SQS_MAX_MESSAGE_SIZE_BYTES = 256 * 1024
+    SQS_MAX_BATCH_SIZE_BYTES = 256 * 1024
+    SQS_MAX_BATCH_ENTRIES = 10
+    SQS_SEND_MAX_ATTEMPTS = 3
+    SQS_SEND_RETRY_BASE_DELAY_SECONDS = 0.2
+    EMAIL_QUEUE_GROUP_SHARDS = 10
+    CERTIFICATE_QUEUE_GROUP_SHARDS = 10
+
+    # Outbox Constants
+    OUTBOX_MAX_ATTEMPTS = 5
+    OUTBOX_LEASE_SECONDS = 120
+    OUTBOX_SWEEP_DELAY_SECONDS = 300
+    OUTBOX_SWEEP_LIMIT = 100
+    # A KonfHub capture takes up to about 18 seconds with its retry, an entry is only started with time to finish
+    OUTBOX_SWEEP_MIN_REMAINING_MS = 20000
+
 
 class EmailType(str, Enum):
     REGISTRATION_EMAIL = 'registrationEmail'
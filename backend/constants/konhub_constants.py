@@ -1,3 +1,18 @@
 class KonfHubConstants:
     ROOT_URL = 'https://api.konfhub.com'
     CAPTURE_URL = f'{ROOT_URL}/event/capture/v2'
+
+    # HTTP Constants
+    CONNECT_TIMEOUT_SECONDS = 3.05
+    READ_TIMEOUT_SECONDS = 6
+    # A capture is a non-idempotent POST, so it is only retried when KonfHub did not process it: connection failures
+    # and 429/503. One retry keeps the worst case at 2 x (connect + read) = about 18 seconds, within the Lambda timeout
+    MAX_RETRIES = 1
+    RETRY_BACKOFF_SECONDS = 0.5
+    RETRY_STATUS_CODES = (429, 503)
+    FAILURE_STATUS_CODES = (429, 500, 502, 503, 504)
+    POOL_MAX_SIZE = 10
+
+    # Circuit Breaker Constants
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_OPEN_SECONDS = 60
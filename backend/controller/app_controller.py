@@ -1,20 +1,88 @@
-def api_controller(app):
-    from controller.certificate_router import certificate_router
-    from controller.discount_router import discount_router
-    from controller.evaluation_router import evaluation_router
-    from controller.event_router import event_router
-    from controller.faqs_controller import faqs_router
-    from controller.payment_controller import payment_router
-    from controller.preregistration_router import preregistration_router
-    from controller.pycon_registration_controller import pycon_registration_router
-    from controller.registration_router import registration_router
-
-    app.include_router(event_router, prefix='/events', tags=['Events'])
-    app.include_router(registration_router, prefix='/registrations', tags=['Registrations'])
-    app.include_router(pycon_registration_router, prefix='/pycon/registrations', tags=['PyCon Registrations'])
-    app.include_router(preregistration_router, prefix='/preregistrations', tags=['PreRegistrations'])
-    app.include_router(certificate_router, prefix='/certificates', tags=['Certificates'])
-    app.include_router(evaluation_router, prefix='/evaluations', tags=['Evaluations'])
-    app.include_router(discount_router, prefix='/discounts', tags=['Discounts'])
-    app.include_router(faqs_router, prefix='/faqs', tags=['FAQs'])
-    app.include_router(payment_router, prefix='/payments', tags=['Payments'])
+import importlib
+import threading
+
+from fastapi import FastAPI, Request
+
+# prefix: (module, router, tags), the routers are imported on the first request to their prefix
+ROUTERS = {
+    '/events': ('controller.event_router', 'event_router', ['Events']),
+    '/registrations': ('controller.registration_router', 'registration_router', ['Registrations']),
+    '/pycon/registrations': (
+        'controller.pycon_registration_controller',
+        'pycon_registration_router',
+        ['PyCon Registrations'],
+    ),
+    '/preregistrations': ('controller.preregistration_router', 'preregistration_router', ['PreRegistrations']),
+    '/certificates': ('controller.certificate_router', 'certificate_router', ['Certificates']),
+    '/evaluations': ('controller.evaluation_router', 'evaluation_router', ['Evaluations']),
+    '/discounts': ('controller.discount_router', 'discount_router', ['Discounts']),
+    '/faqs': ('controller.faqs_controller', 'faqs_router', ['FAQs']),
+    '/payments': ('controller.payment_controller', 'payment_router', ['Payments']),
+}
+
+_included_prefixes = set()
+_include_lock = threading.Lock()
+
+
+def api_controller(app: FastAPI, lazy: bool = True) -> None:
+    """Register the API routers.
+
+    Each router pulls in its usecases, repositories and their dependencies, so importing all of them at once makes up
+    most of the Lambda cold start. When lazy, a router is only imported and included on the first request to its
+    prefix, and the documentation paths include all of them.
+
+    :param app: The FastAPI application.
+    :type app: FastAPI
+
+    :param lazy: Whether to include the routers on their first request instead of now.
+    :type lazy: bool
+
+    """
+    if not lazy:
+        include_routers(app, list(ROUTERS))
+        return
+
+    documentation_paths = {app.docs_url, app.redoc_url, app.openapi_url, app.swagger_ui_oauth2_redirect_url}
+
+    @app.middleware('http')
+    async def include_routers_lazily(request: Request, call_next):
+        path = request.scope['path']
+        root_path = request.scope.get('root_path', '').rstrip('/')
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :] or '/'
+
+        if path in documentation_paths:
+            include_routers(app, list(ROUTERS))
+        else:
+            prefix = next((prefix for prefix in ROUTERS if path == prefix or path.startswith(f'{prefix}/')), None)
+            if prefix is not None:
+                include_routers(app, [prefix])
+
+        return await call_next(request)
+
+
+def include_routers(app: FastAPI, prefixes: list) -> None:
+    """Import and include the routers of the given prefixes, skipping those already included.
+
+    :param app: The FastAPI application.
+    :type app: FastAPI
+
+    :param prefixes: The prefixes of the routers, keys of ROUTERS.
+    :type prefixes: list
+
+    """
+    if _included_prefixes.issuperset(prefixes):
+        return
+
+    with _include_lock:
+        for prefix in prefixes:
+            if prefix in _included_prefixes:
+                continue
+
+            module_name, router_name, tags = ROUTERS[prefix]
+            router = getattr(importlib.import_module(module_name), router_name)
+            app.include_router(router, prefix=prefix, tags=tags)
+            _included_prefixes.add(prefix)
+
+        # The schema is cached on the first request to the documentation, rebuild it with the new routes
+        app.openapi_schema = None
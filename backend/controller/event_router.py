@@ -5,10 +5,12 @@ from aws.cognito_settings import AccessUser, get_current_user
 from constants.common_constants import CommonConstants
 from fastapi import APIRouter, Depends, Path, Query
 from model.common import Message
-from model.events.event import EventAdminOut, EventIn, EventOut
+from model.event_aggregates.event_aggregate import EventAggregateOut
+from model.events.event import EventAdminOut, EventIn, EventOut, EventStatsOut
 from model.events.events_constants import EventUploadType
 from model.file_uploads.file_upload import FileDownloadOut, FileUploadIn, FileUploadOut
 from model.file_uploads.file_upload_constants import FileUploadConstants
+from usecase.event_aggregate_usecase import EventAggregateUsecase
 from usecase.event_usecase import EventUsecase
 from usecase.file_s3_usecase import FileS3Usecase
 
@@ -150,6 +152,80 @@ def get_admin_event(
     return events_uc.get_event(entry_id)
 
 
+@event_router.get(
+    '/{entryId}/stats',
+    response_model=EventStatsOut,
+    responses={
+        404: {'model': Message, 'description': 'Event not found'},
+        500: {'model': Message, 'description': 'Internal server error'},
+    },
+    summary='Get event stats',
+)
+@event_router.get(
+    '/{entryId}/stats/',
+    response_model=EventStatsOut,
+    response_model_exclude_none=True,
+    response_model_exclude_unset=True,
+    include_in_schema=False,
+)
+def get_event_stats(
+    entry_id: str = Path(..., title='Event Id', alias=CommonConstants.ENTRY_ID),
+    current_user: AccessUser = Depends(get_current_user),
+):
+    """Get the registration and pre-registration counts of an event
+
+    :param entry_id: The event ID. Defaults to Path(..., title='Event Id', alias=CommonConstants.ENTRY_ID).
+    :type entry_id: str, optional
+
+    :param current_user: The current user, defaults to Depends(get_current_user).
+    :type current_user: AccessUser, optional
+
+    :return: EventStatsOut object.
+    :rtype: EventStatsOut
+
+    """
+    _ = current_user
+    events_uc = EventUsecase()
+    return events_uc.get_event_stats(entry_id)
+
+
+@event_router.get(
+    '/{entryId}/aggregate',
+    response_model=EventAggregateOut,
+    responses={
+        404: {'model': Message, 'description': 'Event not found'},
+        500: {'model': Message, 'description': 'Internal server error'},
+    },
+    summary='Get event registration breakdowns',
+)
+@event_router.get(
+    '/{entryId}/aggregate/',
+    response_model=EventAggregateOut,
+    response_model_exclude_none=True,
+    response_model_exclude_unset=True,
+    include_in_schema=False,
+)
+def get_event_aggregate(
+    entry_id: str = Path(..., title='Event Id', alias=CommonConstants.ENTRY_ID),
+    current_user: AccessUser = Depends(get_current_user),
+):
+    """Get the registration breakdowns of an event, kept up to date by the event aggregates stream handler
+
+    :param entry_id: The event ID. Defaults to Path(..., title='Event Id', alias=CommonConstants.ENTRY_ID).
+    :type entry_id: str, optional
+
+    :param current_user: The current user, defaults to Depends(get_current_user).
+    :type current_user: AccessUser, optional
+
+    :return: EventAggregateOut object.
+    :rtype: EventAggregateOut
+
+    """
+    _ = current_user
+    event_aggregate_uc = EventAggregateUsecase()
+    return event_aggregate_uc.get_event_aggregate(entry_id)
+
+
 @event_router.post(
     '',
     response_model=EventAdminOut,
@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Body, Path, Query
+from typing import Optional
+
+from constants.common_constants import CommonConstants
+from fastapi import APIRouter, Body, Path, Query, Response
 from fastapi.responses import JSONResponse
 from model.common import Message
 from model.payments.payments import PaymentTransactionIn, PaymentTransactionOut
@@ -48,12 +51,20 @@ def create_payment_transaction(
     },
     summary='Get pending payment transactions',
 )
-def get_pending_payment_transactions():
+def get_pending_payment_transactions(
+    response: Response,
+    limit: Optional[int] = Query(
+        None, title='Page Size', ge=1, le=CommonConstants.MAX_PAGE_SIZE, alias=CommonConstants.LIMIT
+    ),
+    cursor: Optional[str] = Query(None, title='Page Cursor', alias=CommonConstants.CURSOR),
+):
     """
     Get Payment Transaction with pending Status
+
+    When the list is paginated, the cursor of the next page is returned in the X-Next-Cursor header.
     """
     payment_uc = PaymentUsecase()
-    return payment_uc.query_pending_payment_transactions()
+    return payment_uc.query_pending_payment_transactions(limit=limit, cursor=cursor, response=response)
 
 
 @payment_router.put(
@@ -1,9 +1,9 @@
 from http import HTTPStatus
-from typing import List
+from typing import List, Optional
 
 from aws.cognito_settings import AccessUser, get_current_user
 from constants.common_constants import CommonConstants
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Response
 from model.common import Message
 from model.file_uploads.file_upload import FileDownloadOut
 from model.preregistrations.preregistration import (
@@ -34,19 +34,32 @@ preregistration_router = APIRouter()
     include_in_schema=False,
 )
 def get_preregistrations(
+    response: Response,
     event_id: str = Query(None, title='Event Id', alias=CommonConstants.EVENT_ID),
+    limit: Optional[int] = Query(
+        None, title='Page Size', ge=1, le=CommonConstants.MAX_PAGE_SIZE, alias=CommonConstants.LIMIT
+    ),
+    cursor: Optional[str] = Query(None, title='Page Cursor', alias=CommonConstants.CURSOR),
 ):
     """Get a list of pre-registration entries
 
+    When the list is paginated, the cursor of the next page is returned in the X-Next-Cursor header.
+
     :param event_id: The event ID. Defaults to Query(None, title='Event Id', alias=CommonConstants.EVENT_ID).
     :type event_id: str, optional
 
+    :param limit: The maximum number of entries to return. Defaults to returning every entry.
+    :type limit: int, optional
+
+    :param cursor: The cursor of the page to return. Defaults to the first page.
+    :type cursor: str, optional
+
     :return: List of PreRegistrationOut objects.
     :rtype: List[PreRegistrationOut]
 
     """
     preregistrations_uc = PreRegistrationUsecase()
-    return preregistrations_uc.get_preregistrations(event_id=event_id)
+    return preregistrations_uc.get_preregistrations(event_id=event_id, limit=limit, cursor=cursor, response=response)
 
 
 @preregistration_router.get(
@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from aws.cognito_settings import AccessUser, get_current_user
 from constants.common_constants import CommonConstants
-from fastapi import APIRouter, Body, Depends, Path, Query
+from fastapi import APIRouter, Body, Depends, Path, Query, Response
 from model.common import Message
 from model.pycon_registrations.pycon_registration import (
     PyconRegistrationIn,
@@ -180,16 +180,25 @@ def get_registration_by_email(
     include_in_schema=False,
 )
 def get_registrations(
+    response: Response,
     event_id: str = Query(None, title='Event Id', alias=CommonConstants.EVENT_ID),
     is_deleted: Optional[bool] = Query(None, title='Include deleted entries', alias='isDeleted'),
+    limit: Optional[int] = Query(
+        None, title='Page Size', ge=1, le=CommonConstants.MAX_PAGE_SIZE, alias=CommonConstants.LIMIT
+    ),
+    cursor: Optional[str] = Query(None, title='Page Cursor', alias=CommonConstants.CURSOR),
     current_user: AccessUser = Depends(get_current_user),
 ):
     """
     Get a list of registration entries.
+
+    When the list is paginated, the cursor of the next page is returned in the X-Next-Cursor header.
     """
     _ = current_user
     registrations_uc = PyconRegistrationUsecase()
-    return registrations_uc.get_pycon_registrations(event_id=event_id, is_deleted=is_deleted)
+    return registrations_uc.get_pycon_registrations(
+        event_id=event_id, is_deleted=is_deleted, limit=limit, cursor=cursor, response=response
+    )
 
 
 @pycon_registration_router.get(
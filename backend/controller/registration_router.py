@@ -1,9 +1,9 @@
 from http import HTTPStatus
-from typing import List
+from typing import List, Optional
 
 from aws.cognito_settings import AccessUser, get_current_user
 from constants.common_constants import CommonConstants
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Response
 from model.common import Message
 from model.file_uploads.file_upload import FileDownloadOut
 from model.registrations.registration import (
@@ -34,13 +34,20 @@ registration_router = APIRouter()
     include_in_schema=False,
 )
 def get_registrations(
+    response: Response,
     event_id: str = Query(None, title='Event Id', alias=CommonConstants.EVENT_ID),
+    limit: Optional[int] = Query(
+        None, title='Page Size', ge=1, le=CommonConstants.MAX_PAGE_SIZE, alias=CommonConstants.LIMIT
+    ),
+    cursor: Optional[str] = Query(None, title='Page Cursor', alias=CommonConstants.CURSOR),
 ):
     """
     Get a list of registration entries.
+
+    When the list is paginated, the cursor of the next page is returned in the X-Next-Cursor header.
     """
     registrations_uc = RegistrationUsecase()
-    return registrations_uc.get_registrations(event_id=event_id)
+    return registrations_uc.get_registrations(event_id=event_id, limit=limit, cursor=cursor, response=response)
 
 
 @registration_router.get(
@@ -1,38 +1,142 @@
 import os
+import threading
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Tuple
 
 import requests
 from constants.konhub_constants import KonfHubConstants
 from model.konfhub.konfhub import KonfHubCaptureRegistrationIn
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.circuit_breaker import CircuitBreaker
 from utils.logger import logger
 
 
 class KonfHubGateway:
-    def __init__(self):
-        pass
+    """Client of the KonfHub API.
+
+    The HTTP session and the circuit breaker are shared by every gateway in the process, so warm Lambdas reuse the
+    keep-alive connections and keep failing fast while KonfHub is degraded.
+    """
+
+    circuit_breaker = CircuitBreaker(
+        name='KonfHub',
+        failure_threshold=KonfHubConstants.CIRCUIT_FAILURE_THRESHOLD,
+        open_seconds=KonfHubConstants.CIRCUIT_OPEN_SECONDS,
+    )
+    __session: Optional[requests.Session] = None
+    __session_lock = threading.Lock()
+
+    def __init__(self, capture_url: str = None):
+        self.__capture_url = capture_url or KonfHubConstants.CAPTURE_URL
 
     def capture_registration(
         self, konfhub_capture_registration_in: KonfHubCaptureRegistrationIn, api_key: Optional[str] = None
     ) -> Tuple[HTTPStatus, Optional[Dict[str, Any]], Optional[str]]:
+        """Capture a registration in KonfHub.
+
+        :param konfhub_capture_registration_in: The registration to capture.
+        :type konfhub_capture_registration_in: KonfHubCaptureRegistrationIn
+
+        :param api_key: The KonfHub API key of the event, defaults to the KONFHUB_API_KEY environment variable.
+        :type api_key: Optional[str]
+
+        :return: The status, the KonfHub response and an error message. The status is SERVICE_UNAVAILABLE when the
+            circuit is open and KonfHub was not called, the capture should be retried later.
+        :rtype: Tuple[HTTPStatus, Optional[Dict[str, Any]], Optional[str]]
+
+        """
+        if not self.circuit_breaker.allow_request():
+            error_message = 'KonfHub is unavailable, the registration was not captured'
+            logger.warning(error_message)
+            return HTTPStatus.SERVICE_UNAVAILABLE, None, error_message
+
+        api_key = api_key or os.getenv('KONFHUB_API_KEY')
+        headers = {'Content-Type': 'application/json', 'x-api-key': api_key}
+        payload = konfhub_capture_registration_in.dict()
         try:
-            url = KonfHubConstants.CAPTURE_URL
-            api_key = api_key or os.getenv('KONFHUB_API_KEY')
-            headers = {'Content-Type': 'application/json', 'x-api-key': api_key}
-            payload = konfhub_capture_registration_in.dict()
-            response = requests.post(url, headers=headers, json=payload, verify=False)
-            if response.status_code == 200:
-                logger.info(f'Captured registration: {response.json()}')
-                return HTTPStatus.OK, response.json(), None
-            else:
-                raise Exception(f'Failed to capture registration: {response.status_code} - {response.text}')
+            response = self.__get_session().post(
+                self.__capture_url,
+                headers=headers,
+                json=payload,
+                timeout=(KonfHubConstants.CONNECT_TIMEOUT_SECONDS, KonfHubConstants.READ_TIMEOUT_SECONDS),
+            )
 
         except requests.exceptions.SSLError as ssl_err:
+            self.circuit_breaker.record_failure()
             error_message = f'SSL certificate verification failed: {ssl_err}'
             logger.error(error_message)
             return HTTPStatus.BAD_GATEWAY, None, error_message
 
-        except Exception as e:
+        except requests.exceptions.Timeout as e:
+            self.circuit_breaker.record_failure()
+            error_message = f'Timed out capturing registration: {e}'
+            logger.error(error_message)
+            return HTTPStatus.GATEWAY_TIMEOUT, None, error_message
+
+        except requests.exceptions.RequestException as e:
+            self.circuit_breaker.record_failure()
             error_message = f'Failed to capture registration: {e}'
             logger.error(error_message)
+            return HTTPStatus.BAD_GATEWAY, None, error_message
+
+        if response.status_code in KonfHubConstants.FAILURE_STATUS_CODES:
+            self.circuit_breaker.record_failure()
+            error_message = f'Failed to capture registration: {response.status_code} - {response.text}'
+            logger.error(error_message)
+            return HTTPStatus.BAD_GATEWAY, None, error_message
+
+        # KonfHub answered, a refused registration does not count against the circuit
+        self.circuit_breaker.record_success()
+        if response.status_code != 200:
+            error_message = f'Failed to capture registration: {response.status_code} - {response.text}'
+            logger.error(error_message)
             return HTTPStatus.INTERNAL_SERVER_ERROR, None, error_message
+
+        try:
+            konfhub_response = response.json()
+        except ValueError as e:
+            error_message = f'Failed to capture registration: invalid response {e}'
+            logger.error(error_message)
+            return HTTPStatus.BAD_GATEWAY, None, error_message
+
+        logger.info(f'Captured registration: {konfhub_response}')
+        return HTTPStatus.OK, konfhub_response, None
+
+    @classmethod
+    def __get_session(cls) -> requests.Session:
+        """Get the HTTP session shared by the gateways, creating it on first use.
+
+        Connection failures and 429/503 responses are retried MAX_RETRIES times with exponential backoff. Read
+        timeouts and the other 5xx responses are not retried since KonfHub may have captured the registration already,
+        the outbox retries them later. Retry-After is ignored so the retries stay within the Lambda timeout.
+
+        :return: The HTTP session.
+        :rtype: requests.Session
+
+        """
+        if cls.__session is not None:
+            return cls.__session
+
+        with cls.__session_lock:
+            if cls.__session is None:
+                retry = Retry(
+                    total=KonfHubConstants.MAX_RETRIES,
+                    connect=KonfHubConstants.MAX_RETRIES,
+                    read=False,
+                    status=KonfHubConstants.MAX_RETRIES,
+                    status_forcelist=KonfHubConstants.RETRY_STATUS_CODES,
+                    allowed_methods=frozenset(['POST']),
+                    backoff_factor=KonfHubConstants.RETRY_BACKOFF_SECONDS,
+                    respect_retry_after_header=False,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_maxsize=KonfHubConstants.POOL_MAX_SIZE, max_retries=retry)
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                # Certificates were never verified for KonfHub, turning it on is left to a separate change
+                session.verify = False
+                cls.__session = session
+
+        return cls.__session
@@ -0,0 +1,23 @@
+from repository.repository_metrics import RepositoryMetrics
+from usecase.event_aggregate_usecase import EventAggregateUsecase
+
+
+def handler(event, context):
+    """Lambda handler for keeping the event aggregates in sync with the registrations and pre-registrations streams.
+
+    :param event: The event data, which includes the DynamoDB stream records to be processed.
+    :type event: dict
+
+    :param context: The context in which the event occurred. This is not used in this function.
+    :type context: object
+
+    :return: The batch item failures, so only the failed part of the batch is retried.
+    :rtype: dict
+    """
+    _ = context
+
+    with RepositoryMetrics.track('eventAggregatesHandler'):
+        event_aggregate_uc = EventAggregateUsecase()
+        batch_item_failures = event_aggregate_uc.process_stream_records(event.get('Records', []))
+
+    return {'batchItemFailures': batch_item_failures}
@@ -1,3 +1,4 @@
+from repository.repository_metrics import RepositoryMetrics
 from usecase.payment_tracking_sqs_usecase import PaymentTrackingSQSUsecase
 from utils.logger import logger
 
@@ -15,8 +16,9 @@ def handler(event, context):
     """
     _ = context
     try:
-        payment_sqs_usecase = PaymentTrackingSQSUsecase()
-        payment_sqs_usecase.process_payment_message(event)
+        with RepositoryMetrics.track('paymentHandler'):
+            payment_sqs_usecase = PaymentTrackingSQSUsecase()
+            payment_sqs_usecase.process_payment_message(event)
         logger.info('Finished processing all records in the event.')
     except Exception as e:
         logger.error(f'An error occurred in the handler: {e}')
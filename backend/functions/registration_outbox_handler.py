@@ -0,0 +1,31 @@
+from repository.repository_metrics import RepositoryMetrics
+from usecase.registration_outbox_usecase import RegistrationOutboxUsecase
+from utils.logger import logger
+
+
+def handler(event, context):
+    """Lambda handler for carrying out the registration side effects recorded in the outbox.
+
+    It is invoked by the entities stream when outbox entries are inserted, and on a schedule to pick up the entries
+    the stream gave up on.
+
+    :param event: The event data, the DynamoDB stream records of the outbox entries or the schedule event.
+    :type event: dict
+
+    :param context: The context in which the event occurred, the sweep stops before the invocation times out.
+    :type context: object
+
+    :return: The batch item failures of the stream records, so only the failed part of the batch is retried.
+    :rtype: dict
+    """
+    with RepositoryMetrics.track('registrationOutboxHandler'):
+        registration_outbox_uc = RegistrationOutboxUsecase()
+        if 'Records' in event:
+            batch_item_failures = registration_outbox_uc.process_stream_records(event['Records'])
+            return {'batchItemFailures': batch_item_failures}
+
+        processed_count, failed_count = registration_outbox_uc.process_pending_outbox_entries(
+            get_remaining_time_in_millis=context.get_remaining_time_in_millis
+        )
+        logger.info(f'Processed {processed_count} pending outbox entries, {failed_count} failed')
+        return {'processed': processed_count, 'failed': failed_count}
@@ -2,10 +2,11 @@ import os
 
 import lambdawarmer
 from controller.app_controller import api_controller
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse
 from lambda_decorators import cors_headers
 from mangum import Mangum
+from repository.repository_metrics import RepositoryMetrics
 
 STAGE = os.environ.get('STAGE')
 root_path = f'/{STAGE}' if STAGE else '/'
@@ -20,6 +21,20 @@ app = FastAPI(
 )
 
 
+@app.middleware('http')
+async def record_repository_metrics(request: Request, call_next):
+    # Named after the route template once it is matched, so requests for different IDs share the same metrics and
+    # unmatched paths do not each become an Endpoint dimension
+    with RepositoryMetrics.track(f'{request.method} unmatched') as repository_metrics:
+        response = await call_next(request)
+
+        route = request.scope.get('route')
+        if route is not None:
+            repository_metrics.name = f'{request.method} {route.path}'
+
+        return response
+
+
 @app.get('/', include_in_schema=False)
 def welcome():
     html_content = """
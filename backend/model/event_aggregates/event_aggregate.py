@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Dict
+
+from model.entities import Entities
+from pydantic import BaseModel, Extra, Field
+from pynamodb.attributes import MapAttribute, NumberAttribute, UnicodeAttribute
+
+
+class EventAggregate(Entities, discriminator='EventAggregate'):
+    # hk: EventAggregate#<eventId>
+    # rk: v0#<eventId>
+    # Maintained by the event aggregates stream handler, counters are only ever changed with atomic ADD updates
+
+    eventId = UnicodeAttribute(null=False)
+
+    registrationCount = NumberAttribute(default=0)
+    sprintDayRegistrationCount = NumberAttribute(default=0)
+    discountUsageCount = NumberAttribute(default=0)
+    preregistrationCount = NumberAttribute(default=0)
+
+    ticketTypeCounts = MapAttribute(default=dict)
+    shirtSizeCounts = MapAttribute(default=dict)
+    shirtTypeCounts = MapAttribute(default=dict)
+    careerStatusCounts = MapAttribute(default=dict)
+    acceptanceStatusCounts = MapAttribute(default=dict)
+
+
+class EventAggregateOut(BaseModel):
+    class Config:
+        extra = Extra.ignore
+
+    eventId: str = Field(..., title='Event ID')
+    registrationCount: int = Field(0, title='Registration Count')
+    sprintDayRegistrationCount: int = Field(0, title='Sprint Day Registration Count')
+    discountUsageCount: int = Field(0, title='Discount Usage Count')
+    preregistrationCount: int = Field(0, title='Pre-registration Count')
+    ticketTypeCounts: Dict[str, int] = Field({}, title='Registrations per Ticket Type')
+    shirtSizeCounts: Dict[str, int] = Field({}, title='Registrations per Shirt Size')
+    shirtTypeCounts: Dict[str, int] = Field({}, title='Registrations per Shirt Type')
+    careerStatusCounts: Dict[str, int] = Field({}, title='Registrations per Career Status')
+    acceptanceStatusCounts: Dict[str, int] = Field({}, title='Pre-registrations per Acceptance Status')
+    updateDate: datetime = Field(None, title='Updated At')
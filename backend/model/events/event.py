@@ -177,3 +177,14 @@ class EventOut(EventAdminOut):
 
     konfhubId: Optional[str] = Field(None, title='Konfhub ID', exclude=True)
     konfhubApiKey: Optional[str] = Field(None, title='Konfhub API Key', exclude=True)
+
+
+class EventStatsOut(BaseModel):
+    class Config:
+        extra = Extra.ignore
+
+    eventId: str = Field(..., title='ID')
+    registrationCount: int = Field(..., title='Registration Count')
+    sprintDayRegistrationCount: int = Field(..., title='Sprint Day Registration Count')
+    preregistrationCount: int = Field(..., title='Pre-registration Count')
+    acceptedPreregistrationCount: int = Field(..., title='Accepted Pre-registration Count')
@@ -0,0 +1,45 @@
+from enum import Enum
+
+from model.entities import Entities
+from pynamodb.attributes import NumberAttribute, UnicodeAttribute
+from pynamodb.indexes import AllProjection, GlobalSecondaryIndex
+
+
+class OutboxStatus(str, Enum):
+    PENDING = 'PENDING'
+    DONE = 'DONE'
+    FAILED = 'FAILED'
+
+
+class OutboxEffect(str, Enum):
+    REGISTRATION_EMAIL = 'registrationEmail'
+    KONFHUB_REGISTRATION = 'konfhubRegistration'
+
+
+class PendingOutboxIndex(GlobalSecondaryIndex):
+    # Shares the sparse PendingPaymentIndex, pending outbox entries use their own pendingStatus value
+    class Meta:
+        index_name = 'PendingPaymentIndex'
+        projection = AllProjection()
+        read_capacity_units = 1
+        write_capacity_units = 1
+
+    pendingStatus = UnicodeAttribute(hash_key=True)
+    createDate = UnicodeAttribute(range_key=True)
+
+
+class RegistrationOutbox(Entities, discriminator='RegistrationOutbox'):
+    # hk: RegistrationOutbox#<eventId>
+    # rk: v0#<registrationId>#<effect>
+    # Written in the same transaction as the registration, drained by the registration outbox handler
+
+    eventId = UnicodeAttribute(null=False)
+    registrationId = UnicodeAttribute(null=False)
+    effect = UnicodeAttribute(null=False)
+    outboxStatus = UnicodeAttribute(null=False)
+    pendingStatus = UnicodeAttribute(null=True)
+    attempts = NumberAttribute(default=0)
+    leaseExpiry = NumberAttribute(null=True)
+    lastError = UnicodeAttribute(null=True)
+
+    pendingOutboxIndex = PendingOutboxIndex()
@@ -8,6 +8,7 @@ from model.pycon_registrations.pycon_registration import (
 )
 from pydantic import BaseModel, Field
 from pynamodb.attributes import BooleanAttribute, NumberAttribute, UnicodeAttribute
+from pynamodb.indexes import AllProjection, GlobalSecondaryIndex
 
 
 class TransactionStatus(str, Enum):
@@ -16,6 +17,29 @@ class TransactionStatus(str, Enum):
     FAILED = 'FAILED'
 
 
+class PendingPaymentIndex(GlobalSecondaryIndex):
+    # Sparse index: only the latest version (v0) of PENDING transactions has pendingStatus set
+    class Meta:
+        index_name = 'PendingPaymentIndex'
+        projection = AllProjection()
+        read_capacity_units = 1
+        write_capacity_units = 1
+
+    pendingStatus = UnicodeAttribute(hash_key=True)
+    createDate = UnicodeAttribute(range_key=True)
+
+
+class PaymentTransactionIdIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = 'PaymentTransactionIdIndex'
+        projection = AllProjection()
+        read_capacity_units = 1
+        write_capacity_units = 1
+
+    paymentTransactionId = UnicodeAttribute(hash_key=True)
+    rangeKey = UnicodeAttribute(range_key=True)
+
+
 class PaymentTransaction(Entities, discriminator='PaymentTransaction'):
     # hk: PaymentTransaction#<eventId>
     # rk: v<version_number>#<entry_id>
@@ -23,6 +47,11 @@ class PaymentTransaction(Entities, discriminator='PaymentTransaction'):
     price = NumberAttribute(null=False)
     eventId = UnicodeAttribute(null=False)
     transactionStatus = UnicodeAttribute(null=False)
+    pendingStatus = UnicodeAttribute(null=True)
+    paymentTransactionId = UnicodeAttribute(null=True)
+
+    pendingPaymentIndex = PendingPaymentIndex()
+    paymentTransactionIdIndex = PaymentTransactionIdIndex()
 
     # registration data - core info
     firstName = UnicodeAttribute(null=True)
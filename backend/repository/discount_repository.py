@@ -1,31 +1,30 @@
 import os
 from copy import deepcopy
-from datetime import datetime
 from http import HTTPStatus
-from typing import List, Tuple
+from typing import List, Set, Tuple
 
-import pytz
 from constants.common_constants import EntryStatus
 from model.discount.discount import Discount, DiscountDBIn
-from pynamodb.connection import Connection
 from pynamodb.exceptions import (
+    GetError,
     PutError,
     PynamoDBConnectionError,
     QueryError,
     TableDoesNotExist,
     TransactWriteError,
+    UpdateError,
 )
 from pynamodb.transactions import TransactWrite
 from repository.repository_utils import RepositoryUtils
 from utils.logger import logger
+from utils.registry import Registry
 
 
 class DiscountsRepository:
     def __init__(self) -> None:
         self.core_obj = 'Discount'
-        self.current_date = datetime.now(tz=pytz.timezone('Asia/Manila')).isoformat()
         self.latest_version = 0
-        self.conn = Connection(region=os.getenv('REGION'))
+        self.conn = Registry.get_connection()
 
     def store_discount(self, discount_in: DiscountDBIn) -> Tuple[HTTPStatus, Discount, str]:
         """Store a new discount.
@@ -37,6 +36,7 @@ class DiscountsRepository:
         :rtype: Tuple[HTTPStatus, Discount, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         data = RepositoryUtils.load_data(pydantic_schema_in=discount_in)
         entry_id = discount_in.entryId
         event_id = discount_in.eventId
@@ -45,8 +45,8 @@ class DiscountsRepository:
             discount_entry = Discount(
                 hashKey=self.core_obj,
                 rangeKey=range_key,
-                createDate=self.current_date,
-                updateDate=self.current_date,
+                createDate=current_date,
+                updateDate=current_date,
                 createdBy=os.getenv('CURRENT_USER'),
                 updatedBy=os.getenv('CURRENT_USER'),
                 latestVersion=self.latest_version,
@@ -71,6 +71,97 @@ class DiscountsRepository:
             logger.info(f'[{self.core_obj} = {entry_id}]: Save Discounts strategy data successful')
             return HTTPStatus.OK, discount_entry, None
 
+    def store_discounts(self, discounts_in: List[DiscountDBIn]) -> Tuple[HTTPStatus, List[Discount], str]:
+        """Store new discounts using BatchWriteItem.
+
+        The puts are sent 25 at a time and PynamoDB re-sends any unprocessed items. BatchWriteItem puts
+        are unconditional, so the discount codes should be checked with query_existing_discount_codes first.
+
+        This leaves an accepted race: a discount with the same code created for the same event between that check
+        and the batch write is overwritten. Generated codes are 8 random characters out of 36, so this needs two
+        concurrent requests to draw the same code, which is too rare to pay for one conditional PutItem per code.
+
+        :param discounts_in: The discount data to store.
+        :type discounts_in: List[DiscountDBIn]
+
+        :return: The HTTP status, the stored discounts or None, and a message.
+        :rtype: Tuple[HTTPStatus, List[Discount], str]
+
+        """
+        current_date = RepositoryUtils.get_current_date()
+        discount_entries = []
+        for discount_in in discounts_in:
+            data = RepositoryUtils.load_data(pydantic_schema_in=discount_in)
+            discount_entries.append(
+                Discount(
+                    hashKey=self.core_obj,
+                    rangeKey=f'v{self.latest_version}#{discount_in.eventId}#{discount_in.entryId}',
+                    createDate=current_date,
+                    updateDate=current_date,
+                    createdBy=os.getenv('CURRENT_USER'),
+                    updatedBy=os.getenv('CURRENT_USER'),
+                    latestVersion=self.latest_version,
+                    entryStatus=EntryStatus.ACTIVE.value,
+                    **data,
+                )
+            )
+
+        try:
+            with Discount.batch_write() as batch:
+                for discount_entry in discount_entries:
+                    batch.save(discount_entry)
+
+        except PutError as e:
+            message = f'Failed to batch save discounts: {str(e)}'
+            logger.error(f'[{self.core_obj}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+        else:
+            logger.info(f'[{self.core_obj}]: Batch save {len(discount_entries)} discounts successful')
+            return HTTPStatus.OK, discount_entries, None
+
+    def query_existing_discount_codes(self, event_id: str, entry_ids: List[str]) -> Tuple[HTTPStatus, Set[str], str]:
+        """Get which of the given discount codes are already taken for an event using BatchGetItem.
+
+        Deleted discounts are included since their keys still exist.
+
+        :param event_id: The ID of the event the discount codes belong to.
+        :type event_id: str
+
+        :param entry_ids: The discount codes to check.
+        :type entry_ids: List[str]
+
+        :return: The HTTP status, the discount codes that already exist or None, and a message.
+        :rtype: Tuple[HTTPStatus, Set[str], str]
+
+        """
+        keys = [(self.core_obj, f'v{self.latest_version}#{event_id}#{entry_id}') for entry_id in set(entry_ids)]
+        try:
+            existing_entries = Discount.batch_get(keys, attributes_to_get=['cls', 'entryId'])
+            existing_codes = {discount_entry.entryId for discount_entry in existing_entries}
+
+        except GetError as e:
+            message = f'Failed to batch get discounts: {str(e)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+        else:
+            return HTTPStatus.OK, existing_codes, None
+
     def query_discounts(self, event_id: str) -> Tuple[HTTPStatus, List[Discount], str]:
         """Query discounts by event.
 
@@ -177,6 +268,7 @@ class DiscountsRepository:
         :rtype: Tuple[HTTPStatus, Discount, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         current_version = discount_entry.latestVersion
         new_version = current_version + 1
 
@@ -191,11 +283,11 @@ class DiscountsRepository:
                 # Update Entry -----------------------------------------------------------------------------
                 # check if there's update or none
                 updated_data.update(
-                    updateDate=self.current_date,
+                    updateDate=current_date,
                     updatedBy=os.getenv('CURRENT_USER'),
                     latestVersion=new_version,
                 )
-                actions = [getattr(Discount, k).set(v) for k, v in updated_data.items()]
+                actions = RepositoryUtils.get_update_actions(Discount, updated_data)
                 transaction.update(discount_entry, actions=actions)
 
                 # Store Old Entry --------------------------------------------------------------------------
@@ -205,7 +297,7 @@ class DiscountsRepository:
                 old_discount_entry.updatedBy = old_discount_entry.updatedBy or os.getenv('CURRENT_USER')
                 transaction.save(old_discount_entry)
 
-            discount_entry.refresh()
+            RepositoryUtils.apply_update(discount_entry, updated_data)
             logger.info(f'[{discount_entry.rangeKey}] Update discount data successful')
             return HTTPStatus.OK, discount_entry, ''
 
@@ -225,6 +317,7 @@ class DiscountsRepository:
         :rtype: Tuple[HTTPStatus, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         try:
             # create new entry with old data
             current_version = discount_entry.latestVersion
@@ -235,7 +328,7 @@ class DiscountsRepository:
             old_discount_entry.save()
 
             # set entry status to deleted
-            discount_entry.updateDate = self.current_date
+            discount_entry.updateDate = current_date
             discount_entry.updatedBy = os.getenv('CURRENT_USER')
             discount_entry.latestVersion = new_version
             discount_entry.entryStatus = EntryStatus.DELETED.value
@@ -265,14 +358,11 @@ class DiscountsRepository:
             if discount_entry.remainingUses is not None and discount_entry.remainingUses <= 0:
                 return HTTPStatus.BAD_REQUEST, None, 'No remaining uses available for this discount'
 
-            with TransactWrite(connection=self.conn) as transaction:
-                actions = [
-                    Discount.currentDiscountUses.add(append_count),
-                    Discount.remainingUses.set(Discount.remainingUses - append_count),
-                ]
-                transaction.update(discount_entry, actions=actions)
-
-            discount_entry.refresh()
+            actions = [
+                Discount.currentDiscountUses.add(append_count),
+                Discount.remainingUses.set(Discount.remainingUses - append_count),
+            ]
+            discount_entry.update(actions=actions)
 
             logger.info(
                 f'[{discount_entry.rangeKey}] Update discount uses successful. '
@@ -280,7 +370,7 @@ class DiscountsRepository:
             )
             return HTTPStatus.OK, discount_entry, ''
 
-        except TransactWriteError as e:
+        except UpdateError as e:
             message = f'Failed to update discount uses: {str(e)}'
             logger.error(f'[{discount_entry.rangeKey}] {message}')
             return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
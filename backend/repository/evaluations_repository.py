@@ -1,28 +1,23 @@
-import os
-from datetime import datetime
 from http import HTTPStatus
 from typing import List, Tuple
 
-import pytz
 from model.evaluations.evaluation import Evaluation, EvaluationListIn, EvaluationPatch
-from pynamodb.connection import Connection
 from pynamodb.exceptions import (
     PutError,
     PynamoDBConnectionError,
     QueryError,
     TableDoesNotExist,
-    TransactWriteError,
+    UpdateError,
 )
-from pynamodb.transactions import TransactWrite
 from repository.repository_utils import RepositoryUtils
 from utils.logger import logger
+from utils.registry import Registry
 
 
 class EvaluationRepository:
     def __init__(self) -> None:
         self.core_obj = 'Evaluation'
-        self.current_date = datetime.now(tz=pytz.timezone('Asia/Manila')).isoformat()
-        self.conn = Connection(region=os.getenv('REGION'))
+        self.conn = Registry.get_connection()
 
     def store_evaluation(self, evaluation_list_in: EvaluationListIn) -> Tuple[HTTPStatus, List[Evaluation], str]:
         """Store a new evaluation.
@@ -34,6 +29,7 @@ class EvaluationRepository:
         :rtype: Tuple[HTTPStatus, List[Evaluation], str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         hash_key = event_id = evaluation_list_in.eventId
         registration_id = evaluation_list_in.registrationId
 
@@ -45,8 +41,8 @@ class EvaluationRepository:
                 evaluation_entry = Evaluation(
                     hashKey=hash_key,
                     rangeKey=range_key,
-                    createDate=self.current_date,
-                    updateDate=self.current_date,
+                    createDate=current_date,
+                    updateDate=current_date,
                     registrationId=registration_id,
                     eventId=event_id,
                     **data,
@@ -106,7 +102,7 @@ class EvaluationRepository:
                 evaluation_entries = list(Evaluation.query(hash_key=event_id, range_key_condition=range_key_condition))
 
             else:
-                evaluation_entries = list(Evaluation.scan())
+                evaluation_entries = list(RepositoryUtils.parallel_scan(Evaluation))
 
             if not evaluation_entries:
                 if event_id and registration_id and question:
@@ -139,6 +135,49 @@ class EvaluationRepository:
                 logger.info(f'[{self.core_obj}] Fetch Evaluation data successful')
                 return HTTPStatus.OK, evaluation_entries, None
 
+    def query_evaluations_page(
+        self, event_id: str = None, limit: int = None, last_evaluated_key: dict = None
+    ) -> Tuple[HTTPStatus, List[Evaluation], dict, str]:
+        """Query a single page of evaluations.
+
+        :param event_id: The event ID (optional).
+        :type event_id: str
+
+        :param limit: The maximum number of evaluations to return (optional).
+        :type limit: int
+
+        :param last_evaluated_key: The key to resume from, as returned by the previous page (optional).
+        :type last_evaluated_key: dict
+
+        :return: Tuple containing the HTTP status, a list of Evaluation objects, the key of the next page, and a message.
+        :rtype: Tuple[HTTPStatus, List[Evaluation], dict, str]
+
+        """
+        try:
+            if event_id:
+                results = Evaluation.query(hash_key=event_id, limit=limit, last_evaluated_key=last_evaluated_key)
+            else:
+                results = Evaluation.scan(limit=limit, last_evaluated_key=last_evaluated_key)
+
+            evaluation_entries = list(results)
+            next_key = results.last_evaluated_key if limit else None
+
+        except QueryError as e:
+            message = f'Failed to query evaluation: {str(e)}'
+            logger.error(f'[{self.core_obj}={event_id}] {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, None, message
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj}={event_id}] {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, None, message
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj}={event_id}] {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, None, message
+        else:
+            logger.info(f'[{self.core_obj}={event_id}] Fetch Evaluation page successful')
+            return HTTPStatus.OK, evaluation_entries, next_key, None
+
     def query_evaluations_by_question(self, event_id: str, question: str) -> Tuple[HTTPStatus, List[Evaluation], str]:
         """Query evaluations by question.
 
@@ -196,6 +235,7 @@ class EvaluationRepository:
         :rtype: Tuple[HTTPStatus, Evaluation, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         data = RepositoryUtils.load_data(pydantic_schema_in=evaluation_in, exclude_unset=True)
         has_update, updated_data = RepositoryUtils.get_update(
             old_data=RepositoryUtils.db_model_to_dict(evaluation_entry), new_data=data
@@ -204,19 +244,17 @@ class EvaluationRepository:
         if not has_update:
             return HTTPStatus.OK, evaluation_entry, 'no update'
         try:
-            with TransactWrite(connection=self.conn) as transaction:
-                # update entry
-                updated_data.update(
-                    updateDate=self.current_date,
-                )
-                actions = [getattr(Evaluation, k).set(v) for k, v in updated_data.items()]
-                transaction.update(evaluation_entry, actions=actions)
+            # update entry
+            updated_data.update(
+                updateDate=current_date,
+            )
+            actions = RepositoryUtils.get_update_actions(Evaluation, updated_data)
+            evaluation_entry.update(actions=actions)
 
-            evaluation_entry.refresh()
             logger.info(f'[{evaluation_entry.rangeKey}] Update evaluation data successful')
             return HTTPStatus.OK, evaluation_entry, None
 
-        except TransactWriteError as e:
+        except UpdateError as e:
             message = f'Failed to update evaluation data: {str(e)}'
             logger.error(f'[{self.core_obj}={evaluation_entry.rangeKey}] {message}')
             return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
@@ -0,0 +1,200 @@
+from http import HTTPStatus
+from typing import Tuple
+
+from constants.common_constants import EntryStatus
+from model.event_aggregates.event_aggregate import EventAggregate
+from pynamodb.exceptions import (
+    DoesNotExist,
+    GetError,
+    PutError,
+    PynamoDBConnectionError,
+    TableDoesNotExist,
+    UpdateError,
+)
+from repository.repository_utils import RepositoryUtils
+from utils.logger import logger
+from utils.registry import Registry
+
+
+class EventAggregatesRepository:
+    COUNTER_ATTRIBUTES = (
+        'registrationCount',
+        'sprintDayRegistrationCount',
+        'discountUsageCount',
+        'preregistrationCount',
+    )
+    BREAKDOWN_ATTRIBUTES = (
+        'ticketTypeCounts',
+        'shirtSizeCounts',
+        'shirtTypeCounts',
+        'careerStatusCounts',
+        'acceptanceStatusCounts',
+    )
+
+    def __init__(self) -> None:
+        self.core_obj = 'EventAggregate'
+        self.latest_version = 0
+        self.conn = Registry.get_connection()
+
+    def query_event_aggregate(self, event_id: str) -> Tuple[HTTPStatus, EventAggregate, str]:
+        """Get the aggregate of an event with a single GetItem.
+
+        :param event_id: The event ID of the aggregate.
+        :type event_id: str
+
+        :return: The HTTP status, the event aggregate or None, and a message.
+        :rtype: Tuple[HTTPStatus, EventAggregate, str]
+
+        """
+        try:
+            event_aggregate_entry = EventAggregate.get(
+                hash_key=f'{self.core_obj}#{event_id}',
+                range_key=f'v{self.latest_version}#{event_id}',
+            )
+
+        except DoesNotExist:
+            message = f'Aggregate of event with ID={event_id} not found'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.NOT_FOUND, None, message
+
+        except GetError as e:
+            message = f'Failed to get event aggregate: {str(e)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        else:
+            logger.info(f'[{self.core_obj} = {event_id}]: Fetch EventAggregate data successful')
+            return HTTPStatus.OK, event_aggregate_entry, None
+
+    def apply_event_aggregate_delta(self, event_id: str, delta: dict) -> Tuple[HTTPStatus, EventAggregate, str]:
+        """Add a delta to the counters of an event aggregate, creating the aggregate if it does not exist yet.
+
+        The delta is applied in a single UpdateItem with ADD actions, so concurrent updates never overwrite each other.
+
+        :param event_id: The event ID of the aggregate.
+        :type event_id: str
+
+        :param delta: The counter deltas, breakdown attributes map each key to its own delta.
+        :type delta: dict
+
+        :return: The HTTP status, the updated event aggregate or None, and a message.
+        :rtype: Tuple[HTTPStatus, EventAggregate, str]
+
+        """
+        event_aggregate_entry = EventAggregate(
+            hashKey=f'{self.core_obj}#{event_id}',
+            rangeKey=f'v{self.latest_version}#{event_id}',
+        )
+        actions = [EventAggregate.updateDate.set(RepositoryUtils.get_current_date())]
+        for attribute_name in self.COUNTER_ATTRIBUTES:
+            if delta.get(attribute_name):
+                actions.append(getattr(EventAggregate, attribute_name).add(delta[attribute_name]))
+
+        for attribute_name in self.BREAKDOWN_ATTRIBUTES:
+            breakdown_attribute = getattr(EventAggregate, attribute_name)
+            for key, value in delta.get(attribute_name, {}).items():
+                if value:
+                    actions.append(breakdown_attribute[key].add(value))
+
+        try:
+            try:
+                event_aggregate_entry.update(actions=actions, condition=EventAggregate.hashKey.exists())
+            except UpdateError as e:
+                if e.cause_response_code != 'ConditionalCheckFailedException':
+                    raise
+
+                # The breakdown maps must exist before keys can be added to them
+                self.__initialize_event_aggregate(event_aggregate_entry=event_aggregate_entry, event_id=event_id)
+                event_aggregate_entry.update(actions=actions)
+
+        except UpdateError as e:
+            message = f'Failed to update event aggregate: {str(e)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        else:
+            logger.info(f'[{self.core_obj} = {event_id}]: Update EventAggregate data successful')
+            return HTTPStatus.OK, event_aggregate_entry, None
+
+    def store_event_aggregate(self, event_id: str, counts: dict) -> Tuple[HTTPStatus, EventAggregate, str]:
+        """Overwrite the aggregate of an event, used to rebuild it from the source tables.
+
+        :param event_id: The event ID of the aggregate.
+        :type event_id: str
+
+        :param counts: The counters and breakdowns of the event.
+        :type counts: dict
+
+        :return: The HTTP status, the stored event aggregate or None, and a message.
+        :rtype: Tuple[HTTPStatus, EventAggregate, str]
+
+        """
+        current_date = RepositoryUtils.get_current_date()
+        try:
+            event_aggregate_entry = EventAggregate(
+                hashKey=f'{self.core_obj}#{event_id}',
+                rangeKey=f'v{self.latest_version}#{event_id}',
+                createDate=current_date,
+                updateDate=current_date,
+                latestVersion=self.latest_version,
+                entryStatus=EntryStatus.ACTIVE.value,
+                entryId=event_id,
+                eventId=event_id,
+                **counts,
+            )
+            event_aggregate_entry.save()
+
+        except PutError as e:
+            message = f'Failed to save event aggregate: {str(e)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        else:
+            logger.info(f'[{self.core_obj} = {event_id}]: Save EventAggregate data successful')
+            return HTTPStatus.OK, event_aggregate_entry, None
+
+    def __initialize_event_aggregate(self, event_aggregate_entry: EventAggregate, event_id: str) -> None:
+        # if_not_exists keeps this safe when another invocation creates the aggregate at the same time
+        actions = [
+            EventAggregate.cls.set(EventAggregate),
+            EventAggregate.createDate.set(EventAggregate.createDate | RepositoryUtils.get_current_date()),
+            EventAggregate.latestVersion.set(EventAggregate.latestVersion | self.latest_version),
+            EventAggregate.entryStatus.set(EventAggregate.entryStatus | EntryStatus.ACTIVE.value),
+            EventAggregate.entryId.set(EventAggregate.entryId | event_id),
+            EventAggregate.eventId.set(EventAggregate.eventId | event_id),
+        ]
+        for attribute_name in self.BREAKDOWN_ATTRIBUTES:
+            breakdown_attribute = getattr(EventAggregate, attribute_name)
+            actions.append(breakdown_attribute.set(breakdown_attribute | {}))
+
+        event_aggregate_entry.update(actions=actions)
@@ -1,32 +1,34 @@
 import os
 from copy import deepcopy
-from datetime import datetime
 from http import HTTPStatus
 from typing import List, Tuple, Union
 
-import pytz
-from constants.common_constants import EntryStatus
+from constants.common_constants import CommonConstants, EntryStatus
 from model.events.event import Event, EventDBIn, EventIn
-from pynamodb.connection import Connection
 from pynamodb.exceptions import (
     PutError,
     PynamoDBConnectionError,
     QueryError,
     TableDoesNotExist,
     TransactWriteError,
+    UpdateError,
 )
 from pynamodb.transactions import TransactWrite
 from repository.repository_utils import RepositoryUtils
 from utils.logger import logger
+from utils.registry import Registry
+from utils.ttl_cache import TTLCache
 from utils.utils import Utils
 
 
 class EventsRepository:
     def __init__(self) -> None:
         self.core_obj = 'Event'
-        self.current_date = datetime.now(tz=pytz.timezone('Asia/Manila')).isoformat()
         self.latest_version = 0
-        self.conn = Connection(region=os.getenv('REGION'))
+        self.conn = Registry.get_connection()
+        self.event_cache = TTLCache(
+            max_size=CommonConstants.EVENT_CACHE_MAX_SIZE, ttl_seconds=CommonConstants.EVENT_CACHE_TTL_SECONDS
+        )
 
     def store_event(self, event_in: EventIn) -> Tuple[HTTPStatus, Event, str]:
         """Store a new event.
@@ -38,6 +40,7 @@ class EventsRepository:
         :rtype: Tuple[HTTPStatus, Event, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         data = RepositoryUtils.load_data(pydantic_schema_in=event_in)
         db_in = EventDBIn(**data)
         db_in_data = RepositoryUtils.load_data(pydantic_schema_in=db_in)
@@ -49,14 +52,14 @@ class EventsRepository:
             event_entry = Event(
                 hashKey=f'v{self.latest_version}',
                 rangeKey=range_key,
-                createDate=self.current_date,
-                updateDate=self.current_date,
+                createDate=current_date,
+                updateDate=current_date,
                 createdBy=current_user,
                 updatedBy=current_user,
                 latestVersion=self.latest_version,
                 entryStatus=EntryStatus.ACTIVE.value,
                 eventId=entry_id,
-                lastEmailSent=self.current_date,
+                lastEmailSent=current_date,
                 dailyEmailCount=0,
                 **db_in_data,
             )
@@ -134,16 +137,30 @@ class EventsRepository:
             logger.info(f'[{self.core_obj}={event_id}] Fetch Event data successful')
             return HTTPStatus.OK, event_entries, None
 
-    def query_events(self, event_id: str = None) -> Tuple[HTTPStatus, Union[Event, List[Event]], str]:
+    def query_events(
+        self, event_id: str = None, use_cache: bool = True
+    ) -> Tuple[HTTPStatus, Union[Event, List[Event]], str]:
         """Query events.
 
+        A single event is served from the in-process event cache when possible. The cache is refreshed
+        by every write in this repository, but writes from other containers are only seen once the
+        cached entry expires, so reads that are written back should pass use_cache=False.
+
         :param event_id: The event ID (optional).
         :type event_id: str
 
+        :param use_cache: Whether a single event may be served from the event cache (default is True).
+        :type use_cache: bool
+
         :return: Tuple containing the HTTP status, a list of Event objects, and a message.
         :rtype: Tuple[HTTPStatus, List[Event], str]
 
         """
+        if event_id and use_cache:
+            event_entry = self.event_cache.get(event_id)
+            if event_entry is not None:
+                return HTTPStatus.OK, event_entry, None
+
         try:
             range_key_condition = Event.eventId == event_id if event_id else None
             event_entries = list(
@@ -179,12 +196,22 @@ class EventsRepository:
             return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
         else:
             if event_id:
+                self.event_cache.set(event_id, event_entries[0])
                 logger.info(f'[{self.core_obj}={event_id}] Fetch Event data successful')
                 return HTTPStatus.OK, event_entries[0], None
 
             logger.info(f'[{self.core_obj}={event_id}] Fetch Event data successful')
             return HTTPStatus.OK, event_entries, None
 
+    def cache_event(self, event_entry: Event) -> None:
+        """Replace the cached copy of an event after it was written outside of this repository.
+
+        :param event_entry: The Event object as it was written.
+        :type event_entry: Event
+
+        """
+        self.event_cache.set(event_entry.eventId, event_entry)
+
     def update_event(self, event_entry: Event, event_in: EventIn) -> Tuple[HTTPStatus, Event, str]:
         """Update an existing event.
 
@@ -198,6 +225,7 @@ class EventsRepository:
         :rtype: Tuple[HTTPStatus, Event, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         current_version = event_entry.latestVersion
         new_version = current_version + 1
 
@@ -214,17 +242,17 @@ class EventsRepository:
                 # Update Entry -----------------------------------------------------------------------------
                 # check if there's update or none
                 updated_data.update(
-                    updateDate=self.current_date,
+                    updateDate=current_date,
                     updatedBy=os.getenv('CURRENT_USER'),
                     latestVersion=new_version,
                 )
-                if updated_data.get('lastEmailSent') is None:
-                    updated_data['lastEmailSent'] = self.current_date
+                if updated_data.get('lastEmailSent', event_entry.lastEmailSent) is None:
+                    updated_data['lastEmailSent'] = current_date
 
-                if updated_data.get('dailyEmailCount') is None:
+                if updated_data.get('dailyEmailCount', event_entry.dailyEmailCount) is None:
                     updated_data['dailyEmailCount'] = 0
 
-                actions = [getattr(Event, k).set(v) for k, v in updated_data.items()]
+                actions = RepositoryUtils.get_update_actions(Event, updated_data)
                 transaction.update(event_entry, actions=actions)
 
                 # Store Old Entry --------------------------------------------------------------------------
@@ -234,7 +262,8 @@ class EventsRepository:
                 old_event_entry.updatedBy = old_event_entry.updatedBy or os.getenv('CURRENT_USER')
                 transaction.save(old_event_entry)
 
-            event_entry.refresh()
+            RepositoryUtils.apply_update(event_entry, updated_data)
+            self.event_cache.set(event_entry.eventId, event_entry)
             logger.info(f'[{event_entry.rangeKey}] Update event data successful')
             return HTTPStatus.OK, event_entry, ''
 
@@ -254,6 +283,7 @@ class EventsRepository:
         :rtype: Tuple[HTTPStatus, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         try:
             # create new entry with old data
             current_version = event_entry.latestVersion
@@ -264,11 +294,12 @@ class EventsRepository:
             old_event_entry.save()
 
             # set entry status to deleted
-            event_entry.updateDate = self.current_date
+            event_entry.updateDate = current_date
             event_entry.updatedBy = os.getenv('CURRENT_USER')
             event_entry.latestVersion = new_version
             event_entry.entryStatus = EntryStatus.DELETED.value
             event_entry.save()
+            self.event_cache.invalidate(event_entry.eventId)
 
             logger.info(f'[{event_entry.rangeKey}] Delete event data successful')
             return HTTPStatus.OK, None
@@ -296,20 +327,21 @@ class EventsRepository:
         data = RepositoryUtils.load_data(pydantic_schema_in=event_in, exclude_unset=True)
         db_in = EventDBIn(**data)
         db_in_data = RepositoryUtils.load_data(pydantic_schema_in=db_in)
-        _, updated_data = RepositoryUtils.get_update(
+        has_update, updated_data = RepositoryUtils.get_update(
             old_data=RepositoryUtils.db_model_to_dict(event_entry), new_data=db_in_data
         )
+        if not has_update:
+            return HTTPStatus.OK, event_entry, 'no update'
 
         try:
-            with TransactWrite(connection=self.conn) as transaction:
-                actions = [getattr(Event, k).set(v) for k, v in updated_data.items()]
-                transaction.update(event_entry, actions=actions)
+            actions = RepositoryUtils.get_update_actions(Event, updated_data)
+            event_entry.update(actions=actions)
 
-            event_entry.refresh()
+            self.event_cache.set(event_entry.eventId, event_entry)
             logger.info(f'[{event_entry.rangeKey}] Update event data successful')
             return HTTPStatus.OK, event_entry, ''
 
-        except TransactWriteError as e:
+        except UpdateError as e:
             message = f'Failed to update event data: {str(e)}'
             logger.error(f'[{event_entry.rangeKey}] {message}')
 
@@ -339,14 +371,13 @@ class EventsRepository:
             ]
             if registration_sprint_day:
                 actions.append(Event.sprintDayRegistrationCount.add(append_count))
-            with TransactWrite(connection=self.conn) as transaction:
-                transaction.update(event_entry, actions=actions)
+            event_entry.update(actions=actions)
 
-            event_entry.refresh()
+            self.event_cache.set(event_entry.eventId, event_entry)
             logger.info(f'[{event_entry.rangeKey}] Update event data successful')
             return HTTPStatus.OK, event_entry, ''
 
-        except TransactWriteError as e:
+        except UpdateError as e:
             message = f'Failed to append event registration count: {str(e)}'
             logger.error(f'[{event_entry.rangeKey}] {message}')
             return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
@@ -365,15 +396,14 @@ class EventsRepository:
 
         """
         try:
-            with TransactWrite(connection=self.conn) as transaction:
-                actions = [Event.dailyEmailCount.add(append_count)]
-                transaction.update(event_entry, actions=actions)
+            actions = [Event.dailyEmailCount.add(append_count)]
+            event_entry.update(actions=actions)
 
-            event_entry.refresh()
+            self.event_cache.set(event_entry.eventId, event_entry)
             logger.info(f'[{event_entry.rangeKey}] Update event data successful')
             return HTTPStatus.OK, event_entry, ''
 
-        except TransactWriteError as e:
+        except UpdateError as e:
             message = f'Failed to append event daily email sent count: {str(e)}'
             logger.error(f'[{event_entry.rangeKey}] {message}')
             return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
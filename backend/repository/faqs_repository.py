@@ -1,13 +1,10 @@
 import os
 from copy import deepcopy
-from datetime import datetime
 from http import HTTPStatus
 from typing import Tuple
 
-import pytz
 from constants.common_constants import EntryStatus
 from model.faqs.faqs import FAQs, FAQsIn
-from pynamodb.connection import Connection
 from pynamodb.exceptions import (
     PutError,
     PynamoDBConnectionError,
@@ -18,14 +15,14 @@ from pynamodb.exceptions import (
 from pynamodb.transactions import TransactWrite
 from repository.repository_utils import RepositoryUtils
 from utils.logger import logger
+from utils.registry import Registry
 
 
 class FAQsRepository:
     def __init__(self) -> None:
         self.core_obj = 'FAQs'
-        self.current_date = datetime.now(tz=pytz.timezone('Asia/Manila')).isoformat()
         self.latest_version = 0
-        self.conn = Connection(region=os.getenv('REGION'))
+        self.conn = Registry.get_connection()
 
     def store_faqs(self, event_id: str, faqs_in: FAQsIn) -> Tuple[HTTPStatus, FAQs, str]:
         """Store a new FAQs entry.
@@ -40,6 +37,7 @@ class FAQsRepository:
         :rtype: Tuple[HTTPStatus, FAQs, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         entry_id = event_id
         data = RepositoryUtils.load_data(pydantic_schema_in=faqs_in)
         range_key = f'v{self.latest_version}#{event_id}'
@@ -47,8 +45,8 @@ class FAQsRepository:
             faqs_entry = FAQs(
                 hashKey=self.core_obj,
                 rangeKey=range_key,
-                createDate=self.current_date,
-                updateDate=self.current_date,
+                createDate=current_date,
+                updateDate=current_date,
                 createdBy=os.getenv('CURRENT_USER'),
                 updatedBy=os.getenv('CURRENT_USER'),
                 latestVersion=self.latest_version,
@@ -133,6 +131,7 @@ class FAQsRepository:
         :rtype: Tuple[HTTPStatus, FAQs, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
 
         current_version = faqs_entry.latestVersion
         new_version = current_version + 1
@@ -148,11 +147,11 @@ class FAQsRepository:
                 # Update Entry -----------------------------------------------------------------------------
                 # check if there's update or none
                 updated_data.update(
-                    updateDate=self.current_date,
+                    updateDate=current_date,
                     updatedBy=os.getenv('CURRENT_USER'),
                     latestVersion=new_version,
                 )
-                actions = [getattr(FAQs, k).set(v) for k, v in updated_data.items()]
+                actions = RepositoryUtils.get_update_actions(FAQs, updated_data)
                 transaction.update(faqs_entry, actions=actions)
 
                 # Store Old Entry --------------------------------------------------------------------------
@@ -162,7 +161,7 @@ class FAQsRepository:
                 old_faqs_entry.updatedBy = old_faqs_entry.updatedBy or os.getenv('CURRENT_USER')
                 transaction.save(old_faqs_entry)
 
-            faqs_entry.refresh()
+            RepositoryUtils.apply_update(faqs_entry, updated_data)
             logger.info(f'[{faqs_entry.rangeKey}] Update faqs data successful')
             return HTTPStatus.OK, faqs_entry, ''
 
@@ -182,6 +181,7 @@ class FAQsRepository:
         :rtype: Tuple[HTTPStatus, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         try:
             # create new entry with old data
             current_version = faqs_entry.latestVersion
@@ -192,7 +192,7 @@ class FAQsRepository:
             old_faqs_entry.save()
 
             # set entry status to deleted
-            faqs_entry.updateDate = self.current_date
+            faqs_entry.updateDate = current_date
             faqs_entry.updatedBy = os.getenv('CURRENT_USER')
             faqs_entry.latestVersion = new_version
             faqs_entry.entryStatus = EntryStatus.DELETED.value
@@ -1,38 +1,35 @@
 import os
 from copy import deepcopy
-from datetime import datetime
 from http import HTTPStatus
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-import pytz
 from constants.common_constants import EntryStatus
 from model.payments.payments import (
     PaymentTransaction,
     PaymentTransactionIn,
     TransactionStatus,
 )
-from pynamodb.connection import Connection
 from pynamodb.exceptions import (
     DoesNotExist,
     PutError,
     PynamoDBConnectionError,
     QueryError,
-    ScanError,
     TableDoesNotExist,
     TransactWriteError,
 )
+from pynamodb.expressions.update import Action
 from pynamodb.transactions import TransactWrite
 from repository.repository_utils import RepositoryUtils
 from ulid import ulid
 from utils.logger import logger
+from utils.registry import Registry
 
 
 class PaymentTransactionRepository:
     def __init__(self):
         self.core_obj = 'PaymentTransaction'
-        self.current_date = datetime.now(tz=pytz.timezone('Asia/Manila')).isoformat()
         self.latest_version = 0
-        self.conn = Connection(region=os.getenv('REGION'))
+        self.conn = Registry.get_connection()
 
     def store_payment_transaction(
         self, payment_transaction_in: PaymentTransactionIn
@@ -46,6 +43,7 @@ class PaymentTransactionRepository:
         :rtype: Tuple[HTTPStatus, PaymentTransaction, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         data = RepositoryUtils.load_data(pydantic_schema_in=payment_transaction_in)
         registration_data = data.pop('registrationData', {}) or {}
         data.pop('eventId')
@@ -58,13 +56,15 @@ class PaymentTransactionRepository:
             payment_transaction_entry = PaymentTransaction(
                 hashKey=hash_key,
                 rangeKey=range_key,
-                createDate=self.current_date,
-                updateDate=self.current_date,
+                createDate=current_date,
+                updateDate=current_date,
                 createdBy=os.getenv('CURRENT_USER'),
                 updatedBy=os.getenv('CURRENT_USER'),
                 latestVersion=self.latest_version,
                 entryStatus=EntryStatus.ACTIVE.value,
                 entryId=entry_id,
+                paymentTransactionId=entry_id,
+                pendingStatus=self.__get_pending_status(payment_transaction_in.transactionStatus),
                 **data,
                 **registration_data,
             )
@@ -188,7 +188,7 @@ class PaymentTransactionRepository:
     def query_payment_transaction_by_id_only(
         self, payment_transaction_id: str
     ) -> Tuple[HTTPStatus, PaymentTransaction, str]:
-        """Query payment_transaction by payment_transaction ID only (using scan).
+        """Query payment_transaction by payment_transaction ID only (using the PaymentTransactionIdIndex).
 
         :param payment_transaction_id: The ID of the payment_transaction to query.
         :type payment_transaction_id: str
@@ -198,16 +198,12 @@ class PaymentTransactionRepository:
 
         """
         try:
-            # Use scan to find payment transaction by ID across all events
-            range_key_suffix = f'#{payment_transaction_id}'
-
-            filter_condition = PaymentTransaction.rangeKey.contains(range_key_suffix)
-            filter_condition &= PaymentTransaction.entryStatus == EntryStatus.ACTIVE.value
-            filter_condition &= PaymentTransaction.rangeKey.startswith(f'v{self.latest_version}#')
-
+            range_key = f'v{self.latest_version}#{payment_transaction_id}'
             payment_transaction_entries = list(
-                PaymentTransaction.scan(
-                    filter_condition=filter_condition,
+                PaymentTransaction.paymentTransactionIdIndex.query(
+                    hash_key=payment_transaction_id,
+                    range_key_condition=PaymentTransaction.rangeKey == range_key,
+                    filter_condition=PaymentTransaction.entryStatus == EntryStatus.ACTIVE.value,
                 )
             )
             if not payment_transaction_entries:
@@ -215,8 +211,8 @@ class PaymentTransactionRepository:
                 logger.error(f'[{self.core_obj} = {payment_transaction_id}] {message}')
                 return HTTPStatus.NOT_FOUND, None, message
 
-        except ScanError as e:
-            message = f'Failed to scan payment_transaction: {str(e)}'
+        except QueryError as e:
+            message = f'Failed to query payment_transaction: {str(e)}'
             logger.error(f'[{self.core_obj}={payment_transaction_id}] {message}')
             return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
 
@@ -269,8 +265,7 @@ class PaymentTransactionRepository:
             current_user = os.getenv('CURRENT_USER') or 'system'
             logger.info(f'[{payment_transaction_id}] Updating with user: {current_user}')
 
-            # Refresh the current_date to avoid stale timestamps
-            current_date = datetime.now(tz=pytz.timezone('Asia/Manila')).isoformat()
+            current_date = RepositoryUtils.get_current_date()
 
             # Implement proper TransactWrite pattern with versioning like other repositories
             current_version = payment_transaction.latestVersion
@@ -285,6 +280,7 @@ class PaymentTransactionRepository:
                         PaymentTransaction.updateDate.set(current_date),
                         PaymentTransaction.updatedBy.set(current_user),
                         PaymentTransaction.latestVersion.set(new_version),
+                        self.__get_pending_status_action(status),
                     ],
                 )
 
@@ -293,10 +289,19 @@ class PaymentTransactionRepository:
                 old_payment_transaction.rangeKey = payment_transaction.rangeKey.replace('v0#', f'v{new_version}#')
                 old_payment_transaction.latestVersion = current_version
                 old_payment_transaction.updatedBy = old_payment_transaction.updatedBy or current_user
+                old_payment_transaction.pendingStatus = None
                 transaction.save(old_payment_transaction)
 
-            # Refresh the entry after transaction (like other repositories)
-            payment_transaction.refresh()
+            RepositoryUtils.apply_update(
+                payment_transaction,
+                {
+                    'transactionStatus': status.value,
+                    'updateDate': current_date,
+                    'updatedBy': current_user,
+                    'latestVersion': new_version,
+                    'pendingStatus': self.__get_pending_status(status.value),
+                },
+            )
 
             logger.info(f'[{payment_transaction_id}] Update payment transaction status successful')
             return HTTPStatus.OK, payment_transaction, ''
@@ -341,6 +346,7 @@ class PaymentTransactionRepository:
         :rtype: Tuple[HTTPStatus, PaymentTransaction, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         current_version = payment_transaction.latestVersion
         new_version = current_version + 1
 
@@ -359,11 +365,15 @@ class PaymentTransactionRepository:
                 # Update Entry -----------------------------------------------------------------------------
                 # check if there's update or none
                 updated_data.update(
-                    updateDate=self.current_date,
+                    updateDate=current_date,
                     updatedBy=os.getenv('CURRENT_USER'),
                     latestVersion=new_version,
                 )
-                actions = [getattr(PaymentTransaction, k).set(v) for k, v in updated_data.items()]
+                # pendingStatus is derived from the transaction status to keep the PendingPaymentIndex in sync
+                updated_data.pop('pendingStatus', None)
+                transaction_status = updated_data.get('transactionStatus', payment_transaction.transactionStatus)
+                actions = RepositoryUtils.get_update_actions(PaymentTransaction, updated_data)
+                actions.append(self.__get_pending_status_action(transaction_status))
                 transaction.update(payment_transaction, actions=actions)
 
                 # Store Old Entry --------------------------------------------------------------------------
@@ -371,9 +381,11 @@ class PaymentTransactionRepository:
                 old_payment_transaction.rangeKey = payment_transaction.rangeKey.replace('v0#', f'v{new_version}#')
                 old_payment_transaction.latestVersion = current_version
                 old_payment_transaction.updatedBy = old_payment_transaction.updatedBy or os.getenv('CURRENT_USER')
+                old_payment_transaction.pendingStatus = None
                 transaction.save(old_payment_transaction)
 
-            payment_transaction.refresh()
+            updated_data['pendingStatus'] = self.__get_pending_status(transaction_status)
+            RepositoryUtils.apply_update(payment_transaction, updated_data)
             logger.info(f'[{payment_transaction.rangeKey}] Update payment_transaction data successful')
             return HTTPStatus.OK, payment_transaction, ''
 
@@ -383,48 +395,83 @@ class PaymentTransactionRepository:
 
             return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
 
-    def query_pending_payment_transactions(self) -> Tuple[HTTPStatus, List[PaymentTransaction], str]:
-        """Scan for PENDING payment_transactions across all events.
+    def query_pending_payment_transactions(
+        self, limit: int = None, last_evaluated_key: dict = None
+    ) -> Tuple[HTTPStatus, List[PaymentTransaction], dict, str]:
+        """Query PENDING payment_transactions across all events, oldest first.
 
+        Uses the sparse PendingPaymentIndex, which only holds the latest version of PENDING transactions.
 
-        :return: The HTTP status, the queried payment_transactions or None, and a message.
-        :rtype: Tuple[HTTPStatus, List[PaymentTransaction], str]
+        :param limit: The maximum number of payment_transactions to return, defaults to None for all.
+        :type limit: int
 
-        """
-        try:
-            # Use scan with filters instead of query
-            range_key_prefix = f'v{self.latest_version}#'
+        :param last_evaluated_key: The key to resume from, as returned by the previous page.
+        :type last_evaluated_key: dict
 
-            filter_condition = PaymentTransaction.transactionStatus == TransactionStatus.PENDING.value
-            filter_condition &= PaymentTransaction.entryStatus == EntryStatus.ACTIVE.value
-            filter_condition &= PaymentTransaction.rangeKey.startswith(range_key_prefix)
+        :return: The HTTP status, the queried payment_transactions or None, the key of the next page, and a message.
+        :rtype: Tuple[HTTPStatus, List[PaymentTransaction], dict, str]
 
-            payment_transaction_entries = list(
-                PaymentTransaction.scan(
-                    filter_condition=filter_condition,
-                )
+        """
+        try:
+            results = PaymentTransaction.pendingPaymentIndex.query(
+                hash_key=TransactionStatus.PENDING.value,
+                filter_condition=PaymentTransaction.entryStatus == EntryStatus.ACTIVE.value,
+                limit=limit,
+                last_evaluated_key=last_evaluated_key,
             )
+            payment_transaction_entries = list(results)
+            next_key = results.last_evaluated_key if limit else None
 
-            if not payment_transaction_entries:
+            if not payment_transaction_entries and not last_evaluated_key:
                 message = 'No pending payment_transactions found'
                 logger.info(f'[{self.core_obj}] {message}')
-                return HTTPStatus.NOT_FOUND, [], message
+                return HTTPStatus.NOT_FOUND, [], None, message
 
-        except ScanError as e:
-            message = f'Failed to scan payment_transactions: {str(e)}'
+        except QueryError as e:
+            message = f'Failed to query pending payment_transactions: {str(e)}'
             logger.error(f'[{self.core_obj}] {message}')
-            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, None, message
 
         except TableDoesNotExist as db_error:
             message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
             logger.error(f'[{self.core_obj}] {message}')
-            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, None, message
 
         except PynamoDBConnectionError as db_error:
             message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
             logger.error(f'[{self.core_obj}] {message}')
-            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, None, message
 
         else:
             logger.info(f'[{self.core_obj}] Fetch PaymentTransaction data successful')
-            return HTTPStatus.OK, payment_transaction_entries, None
+            return HTTPStatus.OK, payment_transaction_entries, next_key, None
+
+    @staticmethod
+    def __get_pending_status(transaction_status: str) -> Optional[str]:
+        """Get the pendingStatus value that keeps the PendingPaymentIndex sparse.
+
+        :param transaction_status: The transaction status of the latest version.
+        :type transaction_status: str
+
+        :return: PENDING if the transaction is pending, otherwise None so it is left out of the index.
+        :rtype: Optional[str]
+
+        """
+        if transaction_status == TransactionStatus.PENDING.value:
+            return TransactionStatus.PENDING.value
+        return None
+
+    def __get_pending_status_action(self, transaction_status: str) -> Action:
+        """Get the update action that adds or drops a transaction from the PendingPaymentIndex.
+
+        :param transaction_status: The new transaction status.
+        :type transaction_status: str
+
+        :return: The update action for the pendingStatus attribute.
+        :rtype: Action
+
+        """
+        pending_status = self.__get_pending_status(transaction_status)
+        if pending_status:
+            return PaymentTransaction.pendingStatus.set(pending_status)
+        return PaymentTransaction.pendingStatus.remove()
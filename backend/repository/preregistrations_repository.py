@@ -1,29 +1,27 @@
-import os
-from datetime import datetime
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from typing import List, Tuple
 
-import pytz
 import ulid
-from constants.common_constants import EntryStatus
+from constants.common_constants import CommonConstants, EntryStatus
 from model.preregistrations.preregistration import (
     PreRegistration,
     PreRegistrationIn,
     PreRegistrationPatch,
 )
 from model.preregistrations.preregistrations_constants import AcceptanceStatus
-from pynamodb.connection import Connection
 from pynamodb.exceptions import (
     DeleteError,
     PutError,
     PynamoDBConnectionError,
     QueryError,
     TableDoesNotExist,
-    TransactWriteError,
+    UpdateError,
 )
-from pynamodb.transactions import TransactWrite
 from repository.repository_utils import RepositoryUtils
 from utils.logger import logger
+from utils.registry import Registry
 
 
 class PreRegistrationsRepository:
@@ -34,14 +32,12 @@ class PreRegistrationsRepository:
 
     Attributes:
         core_obj (str): The core object name for pre-registration records.
-        current_date (str): The current date and time in ISO format.
         conn (Connection): The PynamoDB connection for database operations.
     """
 
     def __init__(self) -> None:
         self.core_obj = 'PreRegistration'
-        self.current_date = datetime.now(tz=pytz.timezone('Asia/Manila')).isoformat()
-        self.conn = Connection(region=os.getenv('REGION'))
+        self.conn = Registry.get_connection()
 
     def store_preregistration(
         self, preregistration_in: PreRegistrationIn, preregistration_id: str = None
@@ -58,6 +54,7 @@ class PreRegistrationsRepository:
         :rtype: Tuple[HTTPStatus, PreRegistration, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         data = RepositoryUtils.load_data(pydantic_schema_in=preregistration_in)  # load data from pydantic schema
         preregistration_id = preregistration_id or ulid.ulid()
 
@@ -65,8 +62,8 @@ class PreRegistrationsRepository:
             preregistration_entry = PreRegistration(
                 hashKey=preregistration_in.eventId,
                 rangeKey=preregistration_id,
-                createDate=self.current_date,
-                updateDate=self.current_date,
+                createDate=current_date,
+                updateDate=current_date,
                 entryStatus=EntryStatus.ACTIVE.value,
                 preRegistrationId=preregistration_id,
                 acceptanceStatus=AcceptanceStatus.PENDING.value,
@@ -104,7 +101,8 @@ class PreRegistrationsRepository:
         try:
             if event_id is None:
                 preregistration_entries = list(
-                    PreRegistration.scan(
+                    RepositoryUtils.parallel_scan(
+                        PreRegistration,
                         filter_condition=PreRegistration.entryStatus == EntryStatus.ACTIVE.value,
                     )
                 )
@@ -139,6 +137,59 @@ class PreRegistrationsRepository:
             logger.info(f'[{self.core_obj}]: Fetch Pre-registration data successful')
             return HTTPStatus.OK, preregistration_entries, None
 
+    def query_preregistrations_page(
+        self, event_id: str = None, limit: int = None, last_evaluated_key: dict = None
+    ) -> Tuple[HTTPStatus, List[PreRegistration], dict, str]:
+        """Query a single page of pre-registration records from the database.
+
+        :param event_id: The event ID to query (default is None to query all records).
+        :type event_id: str
+
+        :param limit: The maximum number of records to return (default is None to return all records).
+        :type limit: int
+
+        :param last_evaluated_key: The key to resume from, as returned by the previous page.
+        :type last_evaluated_key: dict
+
+        :return: A tuple containing HTTP status, a list of pre-registration records, the key of the next page, and an optional error message.
+        :rtype: Tuple[HTTPStatus, List[PreRegistration], dict, str]
+
+        """
+        try:
+            condition = PreRegistration.entryStatus == EntryStatus.ACTIVE.value
+            if event_id is None:
+                results = PreRegistration.scan(
+                    filter_condition=condition,
+                    limit=limit,
+                    last_evaluated_key=last_evaluated_key,
+                )
+            else:
+                results = PreRegistration.query(
+                    hash_key=event_id,
+                    filter_condition=condition,
+                    limit=limit,
+                    last_evaluated_key=last_evaluated_key,
+                )
+
+            preregistration_entries = list(results)
+            next_key = results.last_evaluated_key if limit else None
+
+        except QueryError as e:
+            message = f'Failed to query pre-registration: {str(e)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, None, message
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, None, message
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, None, message
+        else:
+            logger.info(f'[{self.core_obj} = {event_id}]: Fetch Pre-registration page successful')
+            return HTTPStatus.OK, preregistration_entries, next_key, None
+
     def query_preregistration_with_preregistration_id(
         self, preregistration_id: str, event_id: str
     ) -> Tuple[HTTPStatus, PreRegistration, str]:
@@ -186,6 +237,100 @@ class PreRegistrationsRepository:
             logger.info(f'[{self.core_obj} = {preregistration_id}]: Fetch Pre-registration data successful')
             return HTTPStatus.OK, preregistration_entries[0], None
 
+    def count_preregistrations(
+        self, event_id: str, acceptance_status: AcceptanceStatus = None
+    ) -> Tuple[HTTPStatus, int, str]:
+        """Count the active pre-registrations of an event without fetching them.
+
+        DynamoDB only returns the number of matching items per page, the pages are summed up.
+
+        :param event_id: The event ID to count.
+        :type event_id: str
+
+        :param acceptance_status: Only count pre-registrations with this status (default is None to count all records).
+        :type acceptance_status: AcceptanceStatus
+
+        :return: A tuple containing HTTP status, the number of pre-registrations, and an optional error message.
+        :rtype: Tuple[HTTPStatus, int, str]
+
+        """
+        try:
+            filter_condition = PreRegistration.entryStatus == EntryStatus.ACTIVE.value
+            if acceptance_status is not None:
+                filter_condition &= PreRegistration.acceptanceStatus == acceptance_status.value
+
+            preregistration_count = PreRegistration.count(hash_key=event_id, filter_condition=filter_condition)
+
+        except QueryError as e:
+            message = f'Failed to count pre-registrations: {str(e)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        else:
+            return HTTPStatus.OK, preregistration_count, None
+
+    def exists_by_email(
+        self, event_id: str, email: str, exclude_preregistration_id: str = None
+    ) -> Tuple[HTTPStatus, bool, str]:
+        """Check if an active pre-registration with the email exists, without fetching it.
+
+        The query asks for one item at a time and only projects the keys, it stops at the first match.
+
+        :param event_id: The event ID to check.
+        :type event_id: str
+
+        :param email: The email to check.
+        :type email: str
+
+        :param exclude_preregistration_id: The pre-registration ID to exclude (default is None to check all records).
+        :type exclude_preregistration_id: str
+
+        :return: A tuple containing HTTP status, whether the pre-registration exists, and an optional error message.
+        :rtype: Tuple[HTTPStatus, bool, str]
+
+        """
+        try:
+            filter_condition = PreRegistration.entryStatus == EntryStatus.ACTIVE.value
+            if exclude_preregistration_id:
+                filter_condition &= PreRegistration.preRegistrationId != exclude_preregistration_id
+
+            preregistration_entries = PreRegistration.emailLSI.query(
+                hash_key=event_id,
+                range_key_condition=PreRegistration.email == email,
+                filter_condition=filter_condition,
+                attributes_to_get=['hashKey', 'rangeKey'],
+                limit=1,
+            )
+            exists = next(iter(preregistration_entries), None) is not None
+
+        except QueryError as e:
+            message = f'Failed to query pre-registrations: {str(e)}'
+            logger.error(f'[{self.core_obj} = {email}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {email}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {email}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        else:
+            return HTTPStatus.OK, exists, None
+
     def query_preregistrations_with_email(
         self, event_id: str, email: str, exclude_preregistration_id: str = None
     ) -> Tuple[HTTPStatus, List[PreRegistration], str]:
@@ -256,6 +401,7 @@ class PreRegistrationsRepository:
         :rtype: Tuple[HTTPStatus, PreRegistration, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         data = RepositoryUtils.load_data(pydantic_schema_in=preregistration_in, exclude_unset=True)
         has_update, updated_data = RepositoryUtils.get_update(
             old_data=RepositoryUtils.db_model_to_dict(preregistration_entry), new_data=data
@@ -264,23 +410,71 @@ class PreRegistrationsRepository:
             return HTTPStatus.OK, preregistration_entry, 'No update'
 
         try:
-            with TransactWrite(connection=self.conn) as transaction:
-                # Update Entry
-                updated_data.update(
-                    updateDate=self.current_date,
-                )
-                actions = [getattr(PreRegistration, k).set(v) for k, v in updated_data.items()]
-                transaction.update(preregistration_entry, actions=actions)
+            # Update Entry
+            updated_data.update(
+                updateDate=current_date,
+            )
+            actions = RepositoryUtils.get_update_actions(PreRegistration, updated_data)
+            preregistration_entry.update(actions=actions)
 
-            preregistration_entry.refresh()
             logger.info(f'[{preregistration_entry.rangeKey}] Update event data succesful')
             return HTTPStatus.OK, preregistration_entry, ''
 
-        except TransactWriteError as e:
+        except UpdateError as e:
             message = f'Failed to update event data: {str(e)}'
             logger.error(f'[{preregistration_entry.rangeKey}] {message}')
             return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
 
+    def update_preregistrations(
+        self, preregistration_entries: List[PreRegistration], preregistration_in: PreRegistrationPatch
+    ) -> Tuple[HTTPStatus, List[PreRegistration], str]:
+        """Apply the same update to many pre-registration records in parallel.
+
+        DynamoDB has no batch update and BatchWriteItem replaces whole items, so each record gets its own UpdateItem
+        call. The calls are spread over BULK_UPDATE_MAX_WORKERS threads.
+
+        :param preregistration_entries: The existing pre-registration records to be updated.
+        :type preregistration_entries: List[PreRegistration]
+
+        :param preregistration_in: The new pre-registration data.
+        :type preregistration_in: PreRegistrationPatch
+
+        :return: A tuple containing HTTP status, the updated pre-registration records, and an optional error message.
+            If some records failed to update, the status is an error and only the updated records are returned.
+        :rtype: Tuple[HTTPStatus, List[PreRegistration], str]
+
+        """
+        if not preregistration_entries:
+            return HTTPStatus.OK, [], 'No update'
+
+        def update_entry(preregistration_entry: PreRegistration) -> bool:
+            status, _, _ = self.update_preregistration(
+                preregistration_entry=preregistration_entry, preregistration_in=preregistration_in
+            )
+            return status == HTTPStatus.OK
+
+        max_workers = min(CommonConstants.BULK_UPDATE_MAX_WORKERS, len(preregistration_entries))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Each thread gets a copy of the caller's context so its calls are still recorded in the request metrics
+            futures = [
+                executor.submit(contextvars.copy_context().run, update_entry, preregistration_entry)
+                for preregistration_entry in preregistration_entries
+            ]
+            updated_entries = [
+                preregistration_entry
+                for preregistration_entry, future in zip(preregistration_entries, futures)
+                if future.result()
+            ]
+
+        failed_count = len(preregistration_entries) - len(updated_entries)
+        if failed_count:
+            message = f'Failed to update {failed_count} of {len(preregistration_entries)} preregistrations'
+            logger.error(f'[{self.core_obj}] {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, updated_entries, message
+
+        logger.info(f'[{self.core_obj}] Update {len(updated_entries)} preregistrations successful')
+        return HTTPStatus.OK, updated_entries, ''
+
     def delete_preregistration(self, preregistration_entry: PreRegistration) -> HTTPStatus:
         """Delete a preregistration record from the database.
 
@@ -0,0 +1,286 @@
+import time
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from typing import List, Tuple
+
+import pytz
+from constants.common_constants import CommonConstants, EntryStatus
+from model.outbox.registration_outbox import (
+    OutboxEffect,
+    OutboxStatus,
+    RegistrationOutbox,
+)
+from pynamodb.exceptions import (
+    PynamoDBConnectionError,
+    QueryError,
+    TableDoesNotExist,
+    UpdateError,
+)
+from repository.repository_utils import RepositoryUtils
+from utils.logger import logger
+from utils.registry import Registry
+
+
+class RegistrationOutboxRepository:
+    """
+    A repository class for the side effects of registrations that are carried out after they are committed.
+
+    The entries are written together with the registration by RegistrationsRepository.commit_registration. A worker
+    claims each entry with a lease before carrying out its side effect, so concurrent workers never run the same one.
+
+    Attributes:
+        core_obj (str): The core object name for outbox records.
+        conn (Connection): The PynamoDB connection for database operations.
+    """
+
+    def __init__(self) -> None:
+        self.core_obj = 'RegistrationOutbox'
+        self.latest_version = 0
+        self.conn = Registry.get_connection()
+
+    def build_outbox_entries(
+        self, event_id: str, registration_id: str, effects: List[OutboxEffect]
+    ) -> List[RegistrationOutbox]:
+        """Build the pending outbox entries of a registration, to be saved in the transaction that stores it.
+
+        :param event_id: The event ID of the registration.
+        :type event_id: str
+
+        :param registration_id: The registration ID.
+        :type registration_id: str
+
+        :param effects: The side effects to carry out for the registration.
+        :type effects: List[OutboxEffect]
+
+        :return: The unsaved outbox entries.
+        :rtype: List[RegistrationOutbox]
+
+        """
+        current_date = RepositoryUtils.get_current_date()
+        return [
+            RegistrationOutbox(
+                hashKey=f'{self.core_obj}#{event_id}',
+                rangeKey=f'v{self.latest_version}#{registration_id}#{effect.value}',
+                createDate=current_date,
+                updateDate=current_date,
+                latestVersion=self.latest_version,
+                entryStatus=EntryStatus.ACTIVE.value,
+                entryId=f'{registration_id}#{effect.value}',
+                eventId=event_id,
+                registrationId=registration_id,
+                effect=effect.value,
+                outboxStatus=OutboxStatus.PENDING.value,
+                pendingStatus=self.core_obj,
+                attempts=0,
+            )
+            for effect in effects
+        ]
+
+    def query_pending_outbox_entries(
+        self, older_than_seconds: int, limit: int
+    ) -> Tuple[HTTPStatus, List[RegistrationOutbox], str]:
+        """Query the pending outbox entries of all events that can be claimed now, oldest first.
+
+        Uses the sparse PendingPaymentIndex, which only holds pending entries. Entries that are still leased, including
+        the ones deferred while an external service is unavailable, are filtered out so they do not hold back the
+        newer entries.
+
+        :param older_than_seconds: Only entries created at least this many seconds ago are returned.
+        :type older_than_seconds: int
+
+        :param limit: The maximum number of entries to return.
+        :type limit: int
+
+        :return: The HTTP status, the pending outbox entries or None, and a message.
+        :rtype: Tuple[HTTPStatus, List[RegistrationOutbox], str]
+
+        """
+        created_before = datetime.now(tz=pytz.timezone('Asia/Manila')) - timedelta(seconds=older_than_seconds)
+        claimable = RegistrationOutbox.leaseExpiry.does_not_exist() | (RegistrationOutbox.leaseExpiry < time.time())
+        try:
+            outbox_entries = list(
+                RegistrationOutbox.pendingOutboxIndex.query(
+                    hash_key=self.core_obj,
+                    range_key_condition=RegistrationOutbox.createDate < created_before.isoformat(),
+                    filter_condition=claimable,
+                    limit=limit,
+                )
+            )
+
+        except QueryError as e:
+            message = f'Failed to query pending outbox entries: {str(e)}'
+            logger.error(f'[{self.core_obj}] {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj}] {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj}] {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        else:
+            logger.info(f'[{self.core_obj}] Fetch {len(outbox_entries)} pending outbox entries successful')
+            return HTTPStatus.OK, outbox_entries, None
+
+    def claim_outbox_entry(self, hash_key: str, range_key: str) -> Tuple[HTTPStatus, RegistrationOutbox, str]:
+        """Lease a pending outbox entry for OUTBOX_LEASE_SECONDS and count the attempt.
+
+        The lease is taken with a conditional update, so only one worker gets it. A worker that stops before releasing
+        the lease lets the entry be claimed again once it expires.
+
+        :param hash_key: The hash key of the outbox entry.
+        :type hash_key: str
+
+        :param range_key: The range key of the outbox entry.
+        :type range_key: str
+
+        :return: The HTTP status, the claimed outbox entry or None, and a message. The status is CONFLICT if the entry
+            is leased by another worker, or no longer pending.
+        :rtype: Tuple[HTTPStatus, RegistrationOutbox, str]
+
+        """
+        now = time.time()
+        outbox_entry = RegistrationOutbox(hashKey=hash_key, rangeKey=range_key)
+        condition = RegistrationOutbox.outboxStatus == OutboxStatus.PENDING.value
+        condition &= RegistrationOutbox.leaseExpiry.does_not_exist() | (RegistrationOutbox.leaseExpiry < now)
+        actions = [
+            RegistrationOutbox.attempts.add(1),
+            RegistrationOutbox.leaseExpiry.set(now + CommonConstants.OUTBOX_LEASE_SECONDS),
+            RegistrationOutbox.updateDate.set(RepositoryUtils.get_current_date()),
+        ]
+
+        try:
+            outbox_entry.update(actions=actions, condition=condition)
+
+        except UpdateError as e:
+            if e.cause_response_code == 'ConditionalCheckFailedException':
+                message = 'Outbox entry is leased by another worker or no longer pending'
+                logger.info(f'[{self.core_obj} = {range_key}]: {message}')
+                return HTTPStatus.CONFLICT, None, message
+
+            message = f'Failed to claim outbox entry: {str(e)}'
+            logger.error(f'[{self.core_obj} = {range_key}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {range_key}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {range_key}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        else:
+            logger.info(f'[{self.core_obj} = {range_key}]: Claim outbox entry successful')
+            return HTTPStatus.OK, outbox_entry, None
+
+    def defer_outbox_entry(
+        self, outbox_entry: RegistrationOutbox, delay_seconds: float, reason: str
+    ) -> Tuple[HTTPStatus, RegistrationOutbox, str]:
+        """Keep a claimed outbox entry leased for a while without counting the attempt.
+
+        Used when the side effect was not tried at all, e.g. while the circuit of an external service is open.
+
+        :param outbox_entry: The claimed outbox entry.
+        :type outbox_entry: RegistrationOutbox
+
+        :param delay_seconds: How long the entry cannot be claimed again.
+        :type delay_seconds: float
+
+        :param reason: Why the side effect was deferred.
+        :type reason: str
+
+        :return: The HTTP status, the deferred outbox entry or None, and a message.
+        :rtype: Tuple[HTTPStatus, RegistrationOutbox, str]
+
+        """
+        actions = [
+            RegistrationOutbox.attempts.add(-1),
+            RegistrationOutbox.leaseExpiry.set(time.time() + delay_seconds),
+            RegistrationOutbox.lastError.set(reason),
+            RegistrationOutbox.updateDate.set(RepositoryUtils.get_current_date()),
+        ]
+
+        try:
+            outbox_entry.update(actions=actions)
+
+        except UpdateError as e:
+            message = f'Failed to defer outbox entry: {str(e)}'
+            logger.error(f'[{self.core_obj} = {outbox_entry.rangeKey}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {outbox_entry.rangeKey}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {outbox_entry.rangeKey}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        else:
+            logger.info(f'[{self.core_obj} = {outbox_entry.rangeKey}]: Defer outbox entry for {delay_seconds}s')
+            return HTTPStatus.OK, outbox_entry, None
+
+    def release_outbox_entry(
+        self, outbox_entry: RegistrationOutbox, error: str = None
+    ) -> Tuple[HTTPStatus, RegistrationOutbox, str]:
+        """Release the lease of a claimed outbox entry once its side effect was carried out or failed.
+
+        A successful entry becomes DONE. A failed entry stays PENDING to be claimed again, until it has been attempted
+        OUTBOX_MAX_ATTEMPTS times and becomes FAILED. DONE and FAILED entries are dropped from the pending index.
+
+        :param outbox_entry: The claimed outbox entry.
+        :type outbox_entry: RegistrationOutbox
+
+        :param error: The error of the side effect, None if it succeeded.
+        :type error: str
+
+        :return: The HTTP status, the released outbox entry or None, and a message.
+        :rtype: Tuple[HTTPStatus, RegistrationOutbox, str]
+
+        """
+        if error is None:
+            outbox_status = OutboxStatus.DONE
+        elif outbox_entry.attempts >= CommonConstants.OUTBOX_MAX_ATTEMPTS:
+            outbox_status = OutboxStatus.FAILED
+        else:
+            outbox_status = OutboxStatus.PENDING
+
+        actions = [
+            RegistrationOutbox.outboxStatus.set(outbox_status.value),
+            RegistrationOutbox.leaseExpiry.remove(),
+            RegistrationOutbox.updateDate.set(RepositoryUtils.get_current_date()),
+        ]
+        actions.append(RegistrationOutbox.lastError.set(error) if error else RegistrationOutbox.lastError.remove())
+        if outbox_status != OutboxStatus.PENDING:
+            actions.append(RegistrationOutbox.pendingStatus.remove())
+
+        try:
+            outbox_entry.update(actions=actions)
+
+        except UpdateError as e:
+            message = f'Failed to release outbox entry: {str(e)}'
+            logger.error(f'[{self.core_obj} = {outbox_entry.rangeKey}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {outbox_entry.rangeKey}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {outbox_entry.rangeKey}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        else:
+            logger.info(f'[{self.core_obj} = {outbox_entry.rangeKey}]: Release outbox entry as {outbox_status.value}')
+            return HTTPStatus.OK, outbox_entry, None
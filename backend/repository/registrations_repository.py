@@ -1,24 +1,33 @@
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from http import HTTPStatus
 from typing import List, Tuple, Union
 
-import pytz
 import ulid
 from constants.common_constants import EntryStatus
+from model.discount.discount import Discount
+from model.events.event import Event
+from model.outbox.registration_outbox import RegistrationOutbox
 from model.pycon_registrations.pycon_registration import PyconRegistrationIn
 from model.registrations.registration import Registration, RegistrationIn
-from pynamodb.connection import Connection
+from model.ticket_types.ticket_types import TicketType
+from pynamodb.constants import ALL_OLD, BATCH_GET_PAGE_LIMIT
 from pynamodb.exceptions import (
+    GetError,
     PutError,
     PynamoDBConnectionError,
     QueryError,
     TableDoesNotExist,
     TransactWriteError,
+    UpdateError,
 )
+from pynamodb.expressions.condition import Condition
+from pynamodb.expressions.update import Action
 from pynamodb.transactions import TransactWrite
 from repository.repository_utils import RepositoryUtils
 from utils.logger import logger
+from utils.registry import Registry
 
 
 class RegistrationsRepository:
@@ -29,14 +38,13 @@ class RegistrationsRepository:
 
     Attributes:
         core_obj (str): The core object name for registration records.
-        current_date (str): The current date and time in ISO format.
         conn (Connection): The PynamoDB connection for database operations.
     """
 
     def __init__(self) -> None:
         self.core_obj = 'Registration'
-        self.current_date = datetime.now(tz=pytz.timezone('Asia/Manila')).isoformat()
-        self.conn = Connection(region=os.getenv('REGION'))
+        self.conn = Registry.get_connection()
+        self.batch_get_max_workers = 4
 
     def store_registration(
         self, registration_in: Union[PyconRegistrationIn, RegistrationIn], registration_id: str = None
@@ -53,6 +61,7 @@ class RegistrationsRepository:
         :rtype: Tuple[HTTPStatus, Registration, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         data = RepositoryUtils.load_data(pydantic_schema_in=registration_in)  # load data from pydantic schema
         registration_id = registration_id or ulid.ulid()
 
@@ -60,8 +69,8 @@ class RegistrationsRepository:
             registration_entry = Registration(
                 hashKey=registration_in.eventId,
                 rangeKey=registration_id,
-                createDate=self.current_date,
-                updateDate=self.current_date,
+                createDate=current_date,
+                updateDate=current_date,
                 entryStatus=EntryStatus.ACTIVE.value,
                 registrationId=registration_id,
                 **data,
@@ -88,6 +97,243 @@ class RegistrationsRepository:
             logger.info(f'[{self.core_obj} = {registration_id}]: Successfully saved registration strategy form')
             return HTTPStatus.OK, registration_entry, None
 
+    def commit_registration(
+        self,
+        registration_in: Union[PyconRegistrationIn, RegistrationIn],
+        registration_id: str,
+        event_entry: Event,
+        registration_sprint_day: bool = False,
+        ticket_type_entry: TicketType = None,
+        discount_entry: Discount = None,
+        outbox_entries: List[RegistrationOutbox] = None,
+    ) -> Tuple[HTTPStatus, Registration, str]:
+        """Store a registration together with its event counters, ticket sales, discount claim and outbox entries.
+
+        Everything is written in a single conditional TransactWrite, so slots, tickets and single-use
+        discounts cannot be oversold by concurrent registrations, and the side effects in the outbox are
+        recorded if and only if the registration is. When a condition fails nothing is written
+        and the returned message says which one. On success the given event, ticket type and discount
+        entries are updated in place to match what was written.
+
+        :param registration_in: The registration data to be stored.
+        :type registration_in: Union[PyconRegistrationIn, RegistrationIn]
+
+        :param registration_id: The registration ID to be stored.
+        :type registration_id: str
+
+        :param event_entry: The event the registration belongs to.
+        :type event_entry: Event
+
+        :param registration_sprint_day: Flag to indicate if the registration is for a sprint day (default is False).
+        :type registration_sprint_day: bool
+
+        :param ticket_type_entry: The ticket type bought by the registration (optional).
+        :type ticket_type_entry: TicketType
+
+        :param discount_entry: The discount claimed by the registration (optional).
+        :type discount_entry: Discount
+
+        :param outbox_entries: The side effects to carry out once the registration is stored (optional).
+        :type outbox_entries: List[RegistrationOutbox]
+
+        :return: A tuple containing HTTP status, the stored registration record, and an optional error message.
+        :rtype: Tuple[HTTPStatus, Registration, str]
+
+        """
+        current_date = RepositoryUtils.get_current_date()
+        data = RepositoryUtils.load_data(pydantic_schema_in=registration_in)
+        registration_entry = Registration(
+            hashKey=registration_in.eventId,
+            rangeKey=registration_id,
+            createDate=current_date,
+            updateDate=current_date,
+            entryStatus=EntryStatus.ACTIVE.value,
+            registrationId=registration_id,
+            **data,
+        )
+        registration_entry.certificateGenerated = False
+
+        event_actions = [Event.registrationCount.add(1)]
+        event_condition = Event.rangeKey.exists()
+        if event_entry.isLimitedSlot and event_entry.maximumSlots is not None:
+            event_condition &= Event.registrationCount < Event.maximumSlots
+        if registration_sprint_day:
+            event_actions.append(Event.sprintDayRegistrationCount.add(1))
+            if event_entry.maximumSprintDaySlots:
+                event_condition &= Event.sprintDayRegistrationCount < Event.maximumSprintDaySlots
+
+        if discount_entry:
+            discount_actions, discount_condition, old_discount_entry = self.__get_discount_claim(
+                discount_entry=discount_entry, registration_id=registration_id, current_date=current_date
+            )
+
+        # PynamoDB sends every put before the updates, the errors are listed in that order so that they
+        # line up with the cancellation reasons. None means the event condition, see __get_event_full_message
+        condition_errors = []
+        try:
+            with TransactWrite(connection=self.conn) as transaction:
+                transaction.save(registration_entry, condition=Registration.rangeKey.does_not_exist())
+                condition_errors.append((HTTPStatus.CONFLICT, 'Registration already exists'))
+
+                if discount_entry:
+                    transaction.save(old_discount_entry)
+                    condition_errors.append((HTTPStatus.INTERNAL_SERVER_ERROR, 'Failed to save discount history'))
+
+                for outbox_entry in outbox_entries or []:
+                    transaction.save(outbox_entry, condition=RegistrationOutbox.rangeKey.does_not_exist())
+                    condition_errors.append((HTTPStatus.CONFLICT, 'Registration side effects already exist'))
+
+                transaction.update(event_entry, actions=event_actions, condition=event_condition, return_values=ALL_OLD)
+                condition_errors.append(None)
+
+                if ticket_type_entry:
+                    transaction.update(
+                        ticket_type_entry,
+                        actions=[
+                            TicketType.currentSales.add(1),
+                            TicketType.updateDate.set(current_date),
+                            TicketType.updatedBy.set(os.getenv('CURRENT_USER')),
+                        ],
+                        condition=TicketType.currentSales < TicketType.maximumQuantity,
+                    )
+                    condition_errors.append(
+                        (HTTPStatus.BAD_REQUEST, f'Ticket type {ticket_type_entry.name} is sold out')
+                    )
+
+                if discount_entry:
+                    transaction.update(discount_entry, actions=discount_actions, condition=discount_condition)
+                    if discount_entry.isReusable:
+                        condition_errors.append((HTTPStatus.BAD_REQUEST, 'Discount has no remaining uses'))
+                    else:
+                        condition_errors.append((HTTPStatus.BAD_REQUEST, 'Discount already claimed'))
+
+        except TransactWriteError as e:
+            for index, reason in enumerate(e.cancellation_reasons):
+                if not reason or reason.code != 'ConditionalCheckFailed':
+                    continue
+
+                status, message = condition_errors[index] or (
+                    HTTPStatus.BAD_REQUEST,
+                    self.__get_event_full_message(event_entry, reason.raw_item, registration_sprint_day),
+                )
+                logger.error(f'[{self.core_obj} = {registration_id}]: {message}')
+                return status, None, message
+
+            message = f'Failed to save registration: {str(e)}'
+            logger.error(f'[{self.core_obj} = {registration_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {registration_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {registration_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        event_entry.registrationCount = (event_entry.registrationCount or 0) + 1
+        if registration_sprint_day:
+            event_entry.sprintDayRegistrationCount = (event_entry.sprintDayRegistrationCount or 0) + 1
+        if ticket_type_entry:
+            ticket_type_entry.currentSales = (ticket_type_entry.currentSales or 0) + 1
+            ticket_type_entry.updateDate = current_date
+        if discount_entry:
+            discount_entry.registrationId = registration_id
+            discount_entry.updateDate = current_date
+            discount_entry.latestVersion = old_discount_entry.latestVersion + 1
+            if discount_entry.isReusable:
+                discount_entry.currentDiscountUses = (discount_entry.currentDiscountUses or 0) + 1
+                discount_entry.remainingUses = (discount_entry.remainingUses or 0) - 1
+            else:
+                discount_entry.claimed = True
+
+        logger.info(f'[{self.core_obj} = {registration_id}]: Successfully committed registration')
+        return HTTPStatus.OK, registration_entry, None
+
+    @staticmethod
+    def __get_discount_claim(
+        discount_entry: Discount, registration_id: str, current_date: str
+    ) -> Tuple[List[Action], Condition, Discount]:
+        """Build the transaction items that claim a discount for a registration.
+
+        Single-use discounts are guarded by their version so only one registration can claim them,
+        reusable discounts are guarded by their remaining uses.
+
+        :param discount_entry: The discount to claim.
+        :type discount_entry: Discount
+
+        :param registration_id: The registration claiming the discount.
+        :type registration_id: str
+
+        :param current_date: The date of the claim.
+        :type current_date: str
+
+        :return: The update actions, the update condition and the history entry of the discount.
+        :rtype: Tuple[List[Action], Condition, Discount]
+
+        """
+        current_version = discount_entry.latestVersion
+        new_version = current_version + 1
+
+        actions = [
+            Discount.registrationId.set(registration_id),
+            Discount.updateDate.set(current_date),
+            Discount.updatedBy.set(os.getenv('CURRENT_USER')),
+            Discount.latestVersion.set(new_version),
+        ]
+        condition = Discount.entryStatus == EntryStatus.ACTIVE.value
+        if discount_entry.isReusable:
+            actions.extend(
+                [
+                    Discount.currentDiscountUses.add(1),
+                    Discount.remainingUses.set(Discount.remainingUses - 1),
+                ]
+            )
+            if discount_entry.maxDiscountUses is not None:
+                condition &= Discount.remainingUses > 0
+        else:
+            actions.append(Discount.claimed.set(True))
+            condition &= Discount.latestVersion == current_version
+            condition &= Discount.claimed.does_not_exist() | (Discount.claimed == False)  # noqa: E712
+
+        old_discount_entry = deepcopy(discount_entry)
+        old_discount_entry.rangeKey = discount_entry.rangeKey.replace('v0#', f'v{new_version}#')
+        old_discount_entry.latestVersion = current_version
+        old_discount_entry.updatedBy = old_discount_entry.updatedBy or os.getenv('CURRENT_USER')
+
+        return actions, condition, old_discount_entry
+
+    @staticmethod
+    def __get_event_full_message(event_entry: Event, raw_item: dict, registration_sprint_day: bool) -> str:
+        """Build the error message of a registration rejected by the event slot condition.
+
+        :param event_entry: The event the registration belongs to.
+        :type event_entry: Event
+
+        :param raw_item: The event item at the time of the failed condition, if returned by DynamoDB.
+        :type raw_item: dict
+
+        :param registration_sprint_day: Flag to indicate if the registration is for a sprint day.
+        :type registration_sprint_day: bool
+
+        :return: The error message.
+        :rtype: str
+
+        """
+        if raw_item:
+            event_entry = Event.from_raw_data(raw_item)
+
+        if (
+            registration_sprint_day
+            and event_entry.maximumSprintDaySlots
+            and (event_entry.sprintDayRegistrationCount or 0) >= event_entry.maximumSprintDaySlots
+        ):
+            return 'Sprint Day is already full.'
+
+        return f'Event registration is full. Maximum slots: {event_entry.maximumSlots}'
+
     def query_registrations(
         self, event_id: str = None, is_deleted: bool = False
     ) -> Tuple[HTTPStatus, List[Registration], str]:
@@ -110,7 +356,8 @@ class RegistrationsRepository:
 
             if event_id is None:
                 registration_entries = list(
-                    Registration.scan(
+                    RepositoryUtils.parallel_scan(
+                        Registration,
                         filter_condition=condition,
                     )
                 )
@@ -144,6 +391,105 @@ class RegistrationsRepository:
             logger.info(f'[{self.core_obj}]: Fetch Registration data successful')
             return HTTPStatus.OK, registration_entries, None
 
+    def count_registrations(self, event_id: str, sprint_day: bool = None) -> Tuple[HTTPStatus, int, str]:
+        """Count the active registrations of an event without fetching them.
+
+        DynamoDB only returns the number of matching items per page, the pages are summed up.
+
+        :param event_id: The event ID to count.
+        :type event_id: str
+
+        :param sprint_day: Only count registrations with this sprint day flag (default is None to count all records).
+        :type sprint_day: bool
+
+        :return: A tuple containing HTTP status, the number of registrations, and an optional error message.
+        :rtype: Tuple[HTTPStatus, int, str]
+
+        """
+        try:
+            filter_condition = Registration.entryStatus == EntryStatus.ACTIVE.value
+            if sprint_day is not None:
+                filter_condition &= Registration.sprintDay == sprint_day
+
+            registration_count = Registration.count(hash_key=event_id, filter_condition=filter_condition)
+
+        except QueryError as e:
+            message = f'Failed to count registrations: {str(e)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        else:
+            return HTTPStatus.OK, registration_count, None
+
+    def query_registrations_page(
+        self, event_id: str = None, limit: int = None, last_evaluated_key: dict = None, is_deleted: bool = False
+    ) -> Tuple[HTTPStatus, List[Registration], dict, str]:
+        """Query a single page of registration records from the database.
+
+        :param event_id: The event ID to query (default is None to query all records).
+        :type event_id: str
+
+        :param limit: The maximum number of records to return (default is None to return all records).
+        :type limit: int
+
+        :param last_evaluated_key: The key to resume from, as returned by the previous page.
+        :type last_evaluated_key: dict
+
+        :param is_deleted: Flag to include deleted records in the query (default is False).
+        :type is_deleted: bool
+
+        :return: A tuple containing HTTP status, a list of registration records, the key of the next page, and an optional error message.
+        :rtype: Tuple[HTTPStatus, List[Registration], dict, str]
+
+        """
+        try:
+            condition = None
+            if not is_deleted:
+                condition = Registration.entryStatus == EntryStatus.ACTIVE.value
+
+            if event_id is None:
+                results = Registration.scan(
+                    filter_condition=condition,
+                    limit=limit,
+                    last_evaluated_key=last_evaluated_key,
+                )
+            else:
+                results = Registration.query(
+                    hash_key=event_id,
+                    filter_condition=condition,
+                    limit=limit,
+                    last_evaluated_key=last_evaluated_key,
+                )
+
+            registration_entries = list(results)
+            next_key = results.last_evaluated_key if limit else None
+
+        except QueryError as e:
+            message = f'Failed to query registration: {str(e)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, None, message
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, None, message
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, None, message
+        else:
+            logger.info(f'[{self.core_obj} = {event_id}]: Fetch Registration page successful')
+            return HTTPStatus.OK, registration_entries, next_key, None
+
     def query_registration_with_registration_id(
         self, registration_id: str, event_id: str
     ) -> Tuple[HTTPStatus, Registration, str]:
@@ -191,6 +537,112 @@ class RegistrationsRepository:
             logger.info(f'[{self.core_obj} = {registration_id}]: Fetch Registration data successful')
             return HTTPStatus.OK, registration_entries[0], None
 
+    def batch_get_registrations(
+        self, event_id: str, registration_ids: List[str], attributes_to_get: List[str] = None
+    ) -> Tuple[HTTPStatus, List[Registration], str]:
+        """Get registration records by ID using BatchGetItem.
+
+        The keys are split into pages of 100 which are read in parallel. PynamoDB re-requests any
+        unprocessed keys. Registrations that are deleted or do not exist are left out of the result.
+
+        :param event_id: The event ID of the registrations.
+        :type event_id: str
+
+        :param registration_ids: The registration IDs to get.
+        :type registration_ids: List[str]
+
+        :param attributes_to_get: The attributes to project (default is None to get every attribute).
+        :type attributes_to_get: List[str]
+
+        :return: A tuple containing HTTP status, a list of registration records, and an optional error message.
+        :rtype: Tuple[HTTPStatus, List[Registration], str]
+
+        """
+        if attributes_to_get is not None:
+            attributes_to_get = list({*attributes_to_get, 'entryStatus'})
+
+        keys = [(event_id, registration_id) for registration_id in set(registration_ids)]
+        key_pages = [keys[i : i + BATCH_GET_PAGE_LIMIT] for i in range(0, len(keys), BATCH_GET_PAGE_LIMIT)]
+
+        def get_page(key_page: List[Tuple[str, str]]) -> List[Registration]:
+            return list(Registration.batch_get(key_page, attributes_to_get=attributes_to_get))
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.batch_get_max_workers) as executor:
+                pages = list(executor.map(get_page, key_pages))
+
+            registration_entries = [
+                entry for page in pages for entry in page if entry.entryStatus == EntryStatus.ACTIVE.value
+            ]
+
+        except GetError as e:
+            message = f'Failed to batch get registrations: {str(e)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {event_id}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+        else:
+            logger.info(f'[{self.core_obj} = {event_id}]: Batch get registrations successful')
+            return HTTPStatus.OK, registration_entries, None
+
+    def exists_by_email(
+        self, event_id: str, email: str, exclude_registration_id: str = None
+    ) -> Tuple[HTTPStatus, bool, str]:
+        """Check if an active registration with the email exists, without fetching it.
+
+        The query asks for one item at a time and only projects the keys, it stops at the first match.
+
+        :param event_id: The event ID to check.
+        :type event_id: str
+
+        :param email: The email to check.
+        :type email: str
+
+        :param exclude_registration_id: The registration ID to exclude (default is None to check all records).
+        :type exclude_registration_id: str
+
+        :return: A tuple containing HTTP status, whether the registration exists, and an optional error message.
+        :rtype: Tuple[HTTPStatus, bool, str]
+
+        """
+        try:
+            filter_condition = Registration.entryStatus == EntryStatus.ACTIVE.value
+            if exclude_registration_id:
+                filter_condition &= Registration.registrationId != exclude_registration_id
+
+            registration_entries = Registration.emailLSI.query(
+                hash_key=event_id,
+                range_key_condition=Registration.email == email,
+                filter_condition=filter_condition,
+                attributes_to_get=['hashKey', 'rangeKey'],
+                limit=1,
+            )
+            exists = next(iter(registration_entries), None) is not None
+
+        except QueryError as e:
+            message = f'Failed to query registrations: {str(e)}'
+            logger.error(f'[{self.core_obj} = {email}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except TableDoesNotExist as db_error:
+            message = f'Error on Table, Please check config to make sure table is created: {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {email}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        except PynamoDBConnectionError as db_error:
+            message = f'Connection error occurred, Please check config(region, table name, etc): {str(db_error)}'
+            logger.error(f'[{self.core_obj} = {email}]: {message}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
+
+        else:
+            return HTTPStatus.OK, exists, None
+
     def query_registrations_with_email(
         self, event_id: str, email: str, exclude_registration_id: str = None
     ) -> Tuple[HTTPStatus, List[Registration], str]:
@@ -261,6 +713,7 @@ class RegistrationsRepository:
         :rtype: Tuple[HTTPStatus, Registration, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         data = RepositoryUtils.load_data(pydantic_schema_in=registration_in, exclude_unset=True)
         has_update, updated_data = RepositoryUtils.get_update(
             old_data=RepositoryUtils.db_model_to_dict(registration_entry), new_data=data
@@ -269,19 +722,17 @@ class RegistrationsRepository:
             return HTTPStatus.OK, registration_entry, 'No update'
 
         try:
-            with TransactWrite(connection=self.conn) as transaction:
-                # Update Entry
-                updated_data.update(
-                    updateDate=self.current_date,
-                )
-                actions = [getattr(Registration, k).set(v) for k, v in updated_data.items()]
-                transaction.update(registration_entry, actions=actions)
+            # Update Entry
+            updated_data.update(
+                updateDate=current_date,
+            )
+            actions = RepositoryUtils.get_update_actions(Registration, updated_data)
+            registration_entry.update(actions=actions)
 
-            registration_entry.refresh()
             logger.info(f'[{registration_entry.rangeKey}] Update event data succesful')
             return HTTPStatus.OK, registration_entry, ''
 
-        except TransactWriteError as e:
+        except UpdateError as e:
             message = f'Failed to update event data: {str(e)}'
             logger.error(f'[{registration_entry.rangeKey}] {message}')
             return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
@@ -296,10 +747,11 @@ class RegistrationsRepository:
         :rtype: HTTPStatus
 
         """
+        current_date = RepositoryUtils.get_current_date()
         try:
             # soft delete
             update_data = {
-                'deletedAt': self.current_date,
+                'deletedAt': current_date,
                 'entryStatus': EntryStatus.DELETED.value,
             }
             with TransactWrite(connection=self.conn) as transaction:
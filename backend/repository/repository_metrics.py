@@ -0,0 +1,225 @@
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Tuple
+
+from constants.common_constants import CommonConstants
+from pynamodb.connection.base import Connection
+
+
+class RepositoryMetrics:
+    """Collects every DynamoDB call made through PynamoDB during a request and emits them when the request ends.
+
+    The calls are grouped per operation and table (or table/index). Each group is written to stdout as one CloudWatch
+    embedded metric format (EMF) line, which CloudWatch turns into metrics without extra API calls.
+    """
+
+    __current: ContextVar[Optional['RepositoryMetrics']] = ContextVar('repository_metrics', default=None)
+    __install_lock = threading.Lock()
+    __installed = False
+    # The operations that accept ReturnConsumedCapacity
+    __consumed_capacity_operations = frozenset(
+        [
+            'BatchGetItem',
+            'BatchWriteItem',
+            'DeleteItem',
+            'GetItem',
+            'PutItem',
+            'Query',
+            'Scan',
+            'TransactGetItems',
+            'TransactWriteItems',
+            'UpdateItem',
+        ]
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.__lock = threading.Lock()
+        self.__operations = {}
+
+    @classmethod
+    @contextmanager
+    def track(cls, name: str) -> Iterator['RepositoryMetrics']:
+        """Record the DynamoDB calls made inside the block, emitting them on exit.
+
+        Threads started inside the block must copy the current context (contextvars.copy_context) to be recorded.
+
+        :param name: The name of the request (e.g. the endpoint), can be changed until the block exits.
+        :type name: str
+
+        :return: The metrics of the block.
+        :rtype: Iterator[RepositoryMetrics]
+
+        """
+        cls.__install()
+        repository_metrics = cls(name)
+        token = cls.__current.set(repository_metrics)
+        try:
+            yield repository_metrics
+        finally:
+            cls.__current.reset(token)
+            repository_metrics.emit()
+
+    def record(self, operation_name: str, operation_kwargs: dict, data: Optional[dict], latency_ms: float) -> None:
+        """Add a DynamoDB call to the metrics.
+
+        :param operation_name: The DynamoDB operation (e.g. Query).
+        :type operation_name: str
+
+        :param operation_kwargs: The parameters of the call.
+        :type operation_kwargs: dict
+
+        :param data: The response of the call, None if it failed.
+        :type data: Optional[dict]
+
+        :param latency_ms: How long the call took in milliseconds.
+        :type latency_ms: float
+
+        """
+        table_name = self.__get_table_name(operation_kwargs)
+        index_name = operation_kwargs.get('IndexName')
+        key = (operation_name, f'{table_name}/{index_name}' if index_name else table_name)
+        items, scanned_items = self.__get_item_counts(operation_name, operation_kwargs, data or {})
+        with self.__lock:
+            operation = self.__operations.setdefault(
+                key,
+                {
+                    'Latency': 0.0,
+                    'Pages': 0,
+                    'Items': 0,
+                    'ScannedItems': 0,
+                    'ConsumedCapacity': 0.0,
+                    'Errors': 0,
+                },
+            )
+            operation['Latency'] += latency_ms
+            operation['Pages'] += 1
+            operation['Items'] += items
+            operation['ScannedItems'] += scanned_items
+            operation['ConsumedCapacity'] += self.__get_consumed_capacity(data or {})
+            operation['Errors'] += 0 if data is not None else 1
+
+    def get_operations(self) -> Dict[Tuple[str, str], dict]:
+        """Get a copy of the metrics collected so far.
+
+        :return: The metrics keyed by operation and table.
+        :rtype: Dict[Tuple[str, str], dict]
+
+        """
+        with self.__lock:
+            return {key: dict(values) for key, values in self.__operations.items()}
+
+    def emit(self) -> None:
+        """Write the collected metrics to stdout, one EMF line per operation and table."""
+        with self.__lock:
+            operations = list(self.__operations.items())
+            self.__operations.clear()
+
+        timestamp = int(time.time() * 1000)
+        for (operation_name, table_name), values in operations:
+            metric_line = {
+                '_aws': {
+                    'Timestamp': timestamp,
+                    'CloudWatchMetrics': [
+                        {
+                            'Namespace': CommonConstants.REPOSITORY_METRICS_NAMESPACE,
+                            'Dimensions': [['Endpoint', 'Operation', 'Table']],
+                            'Metrics': [
+                                {'Name': 'Latency', 'Unit': 'Milliseconds'},
+                                {'Name': 'Pages', 'Unit': 'Count'},
+                                {'Name': 'Items', 'Unit': 'Count'},
+                                {'Name': 'ScannedItems', 'Unit': 'Count'},
+                                {'Name': 'ConsumedCapacity', 'Unit': 'Count'},
+                                {'Name': 'Errors', 'Unit': 'Count'},
+                            ],
+                        }
+                    ],
+                },
+                'Endpoint': self.name,
+                'Operation': operation_name,
+                'Table': table_name,
+                **{name: round(value, 2) if isinstance(value, float) else value for name, value in values.items()},
+            }
+            sys.stdout.write(json.dumps(metric_line) + '\n')
+
+        sys.stdout.flush()
+
+    @classmethod
+    def __install(cls) -> None:
+        # Every PynamoDB call, including each page of a query or scan, goes through Connection.dispatch
+        with cls.__install_lock:
+            if cls.__installed:
+                return
+
+            dispatch = Connection.dispatch
+            current = cls.__current
+            consumed_capacity_operations = cls.__consumed_capacity_operations
+
+            def instrumented_dispatch(connection: Connection, operation_name: str, operation_kwargs: dict) -> dict:
+                repository_metrics = current.get()
+                if repository_metrics is None:
+                    return dispatch(connection, operation_name, operation_kwargs)
+
+                # PynamoDB does not ask for the consumed capacity of every operation, e.g. TransactWriteItems
+                if operation_name in consumed_capacity_operations and 'ReturnConsumedCapacity' not in operation_kwargs:
+                    operation_kwargs = {**operation_kwargs, 'ReturnConsumedCapacity': 'TOTAL'}
+
+                data = None
+                start = time.perf_counter()
+                try:
+                    data = dispatch(connection, operation_name, operation_kwargs)
+                    return data
+                finally:
+                    latency_ms = (time.perf_counter() - start) * 1000
+                    repository_metrics.record(operation_name, operation_kwargs, data, latency_ms)
+
+            Connection.dispatch = instrumented_dispatch
+            cls.__installed = True
+
+    @staticmethod
+    def __get_table_name(operation_kwargs: dict) -> str:
+        if 'RequestItems' in operation_kwargs:
+            return ','.join(sorted(operation_kwargs['RequestItems']))
+
+        if 'TransactItems' in operation_kwargs:
+            table_names = {
+                operation['TableName']
+                for transact_item in operation_kwargs['TransactItems']
+                for operation in transact_item.values()
+            }
+            return ','.join(sorted(table_names))
+
+        return operation_kwargs.get('TableName', '')
+
+    @staticmethod
+    def __get_item_counts(operation_name: str, operation_kwargs: dict, data: dict) -> tuple:
+        if operation_name in ('Query', 'Scan'):
+            return data.get('Count', 0), data.get('ScannedCount', 0)
+
+        if operation_name == 'GetItem':
+            return (1, 1) if 'Item' in data else (0, 0)
+
+        if operation_name == 'BatchGetItem':
+            items = sum(len(table_items) for table_items in data.get('Responses', {}).values())
+            return items, items
+
+        if operation_name == 'BatchWriteItem':
+            items = sum(len(requests) for requests in operation_kwargs.get('RequestItems', {}).values())
+            return items, 0
+
+        if operation_name in ('TransactWriteItems', 'TransactGetItems'):
+            return len(operation_kwargs.get('TransactItems', [])), 0
+
+        return 1, 0
+
+    @staticmethod
+    def __get_consumed_capacity(data: dict) -> float:
+        consumed_capacity = data.get('ConsumedCapacity', [])
+        if isinstance(consumed_capacity, dict):
+            consumed_capacity = [consumed_capacity]
+
+        return sum(capacity.get('CapacityUnits', 0) for capacity in consumed_capacity)
@@ -1,16 +1,27 @@
+import contextvars
 import json
-from copy import deepcopy
-from typing import Tuple
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Iterator, List, Tuple, Type
 
+import pytz
 from constants.common_constants import CommonConstants
-from pynamodb.attributes import MapAttribute
+from pynamodb.expressions.condition import Condition
+from pynamodb.expressions.update import Action
 from pynamodb.models import Model
 
 
 class RepositoryUtils:
     @staticmethod
     def get_update(old_data: dict, new_data: dict) -> Tuple[bool, dict]:
-        """Get the updated data and check if there's an update.
+        """Get the attributes changed by the new data and check if there's an update.
+
+        Only the changed leaves are returned. Nested dicts are compared key by key, so a change inside a map
+        is keyed by its path as a tuple (e.g. ('address', 'city')) instead of replacing the whole map.
+        A value of None means the attribute is removed. Keys in EXCLUDE_COMPARISON_KEYS are ignored, those are
+        maintained by the repositories.
 
         :param old_data: The old data to be compared with the new data.
         :type old_data: dict
@@ -18,72 +29,75 @@ class RepositoryUtils:
         :param new_data: The new data to be that will be used as basis for comparison.
         :type new_data: dict
 
-        :return: A tuple containing a boolean value indicating if there's an update and the updated data.
+        :return: A tuple containing a boolean value indicating if there's an update and the changed attributes.
         :rtype: Tuple[bool, dict]
 
         """
-        excluded_comparison_keys = deepcopy(CommonConstants.EXCLUDE_COMPARISON_KEYS)
-
-        # copy old_data
-        old_data_copy = deepcopy(old_data)
-        for key in excluded_comparison_keys:
-            old_data_copy.pop(key, None)
-
-        # set updated_data
-        updated_data = deepcopy(old_data_copy)
-        RepositoryUtils.update_nested_dict(updated_data, new_data)
-        has_update = updated_data != old_data_copy
+        excluded_comparison_keys = set(CommonConstants.EXCLUDE_COMPARISON_KEYS)
+        new_data = {key: val for key, val in new_data.items() if key not in excluded_comparison_keys}
 
-        # Change to MapAttribute
-        updated_data = RepositoryUtils.items_to_map_attr(updated_data)
-
-        return has_update, updated_data
+        updated_data = {}
+        RepositoryUtils.__collect_changes(old_data=old_data, new_data=new_data, path=(), updated_data=updated_data)
+        return bool(updated_data), updated_data
 
     @staticmethod
-    def update_nested_dict(old_dict: dict, new_data: dict):
-        """Update nested dictionary with new data
+    def get_update_actions(model_cls: Type[Model], updated_data: dict) -> List[Action]:
+        """Build the SET and REMOVE actions of the changes returned by get_update.
 
-        :param old_dict: The old dictionary to be updated with new data.
-        :type old_dict: dict
+        :param model_cls: The model class being updated.
+        :type model_cls: Type[Model]
 
-        :param new_data: The new data to be added or changed in the old dictionary.
-        :type new_data: dict
+        :param updated_data: The changed attributes, keyed by name or by tuple path for nested map values.
+        :type updated_data: dict
 
-        :return: The updated dictionary.
-        :rtype: dict
+        :return: One update action per changed attribute.
+        :rtype: List[Action]
 
         """
-        for key, val in new_data.items():
-            if isinstance(val, dict):
-                try:
-                    RepositoryUtils.update_nested_dict(old_dict[key], val)
-                except KeyError:
-                    old_dict[key] = {}
-                    RepositoryUtils.update_nested_dict(old_dict[key], val)
-            elif val is not None or key in old_dict:
-                old_dict[key] = val
+        actions = []
+        for key, val in updated_data.items():
+            path = key if isinstance(key, tuple) else (key,)
+            attribute = getattr(model_cls, path[0])
+            for map_key in path[1:]:
+                attribute = attribute[map_key]
+
+            actions.append(attribute.remove() if val is None else attribute.set(val))
 
-        return old_dict
+        return actions
 
     @staticmethod
-    def items_to_map_attr(hub_dict: dict) -> dict:
-        """Convert a dictionary to a map attribute.
+    def apply_update(model: Model, updated_data: dict) -> None:
+        """Apply the changes written by SET and REMOVE update actions to a model in memory.
 
-        :param hub_dict: The dictionary to be converted to a map attribute.
-        :type hub_dict: dict
+        TransactWrite cannot return the updated item, so this replaces the refresh() read after a
+        transaction. Only use it when every action of the update comes from the given changes.
 
-        :return: The map attribute representation of the dictionary.
-        :rtype: dict
+        :param model: The model that was updated.
+        :type model: Model
+
+        :param updated_data: The changed attributes, keyed by name or by tuple path for nested map values.
+        :type updated_data: dict
 
         """
-        tmp_dict = {}
-        for key, val in hub_dict.items():
-            if isinstance(val, dict):
-                new_dict = RepositoryUtils.items_to_map_attr(val)
-                tmp_dict[key] = MapAttribute(**new_dict)
+        model_data = None
+        for key, val in updated_data.items():
+            if not isinstance(key, tuple):
+                setattr(model, key, val)
+                continue
+
+            model_data = model_data or RepositoryUtils.db_model_to_dict(model)
+            container = model_data.setdefault(key[0], {})
+            for map_key in key[1:-1]:
+                container = container.setdefault(map_key, {})
+
+            if val is None:
+                container.pop(key[-1], None)
             else:
-                tmp_dict[key] = val
-        return tmp_dict
+                container[key[-1]] = val
+            setattr(model, key[0], model_data[key[0]])
+
+        # Round trip through the DynamoDB format so the attributes look the same as after a read
+        model.deserialize(model.serialize(null_check=False))
 
     @staticmethod
     def db_model_to_dict(model: Model) -> dict:
@@ -114,3 +128,101 @@ class RepositoryUtils:
 
         """
         return json.loads(pydantic_schema_in.json(exclude_unset=exclude_unset))
+
+    @staticmethod
+    def parallel_scan(
+        model_cls: Type[Model], filter_condition: Condition = None, total_segments: int = None
+    ) -> Iterator[Model]:
+        """Scan a whole table with one thread per segment, yielding items as the segments return them.
+
+        Items are not yielded in table order. The scanning threads stop as soon as the generator is closed.
+
+        :param model_cls: The model class of the table to scan.
+        :type model_cls: Type[Model]
+
+        :param filter_condition: The filter condition of the scan. Defaults to None.
+        :type filter_condition: Condition
+
+        :param total_segments: The number of segments scanned in parallel.
+            Defaults to CommonConstants.PARALLEL_SCAN_TOTAL_SEGMENTS.
+        :type total_segments: int
+
+        :return: The scanned items.
+        :rtype: Iterator[Model]
+
+        """
+        total_segments = total_segments or CommonConstants.PARALLEL_SCAN_TOTAL_SEGMENTS
+        results = queue.Queue(maxsize=CommonConstants.PARALLEL_SCAN_BUFFER_SIZE)
+        stop_event = threading.Event()
+        segment_done = object()
+
+        def put_result(result) -> bool:
+            while not stop_event.is_set():
+                try:
+                    results.put(result, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+
+            return False
+
+        def scan_segment(segment: int) -> None:
+            try:
+                items = model_cls.scan(
+                    filter_condition=filter_condition, segment=segment, total_segments=total_segments
+                )
+                for item in items:
+                    if not put_result(item):
+                        return
+            except Exception as e:
+                put_result(e)
+            finally:
+                put_result(segment_done)
+
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            for segment in range(total_segments):
+                # Each thread gets a copy of the caller's context so its calls are still recorded in the request metrics
+                executor.submit(contextvars.copy_context().run, scan_segment, segment)
+
+            try:
+                remaining_segments = total_segments
+                while remaining_segments:
+                    result = results.get()
+                    if result is segment_done:
+                        remaining_segments -= 1
+                    elif isinstance(result, Exception):
+                        raise result
+                    else:
+                        yield result
+            finally:
+                stop_event.set()
+
+    @staticmethod
+    def get_current_date() -> str:
+        """Get the current date and time in ISO format.
+
+        Repositories are shared across requests, so this must be called per operation
+        instead of being stored on the repository.
+
+        :return: The current date and time in the Asia/Manila timezone.
+        :rtype: str
+
+        """
+        return datetime.now(tz=pytz.timezone('Asia/Manila')).isoformat()
+
+    @staticmethod
+    def __collect_changes(old_data: dict, new_data: dict, path: tuple, updated_data: dict) -> None:
+        for key, val in new_data.items():
+            old_val = old_data.get(key)
+            if isinstance(val, dict) and isinstance(old_val, dict):
+                RepositoryUtils.__collect_changes(
+                    old_data=old_val, new_data=val, path=path + (key,), updated_data=updated_data
+                )
+                continue
+
+            if isinstance(val, dict):
+                # A new map only keeps the keys that have a value
+                val = {map_key: map_val for map_key, map_val in val.items() if map_val is not None}
+
+            if val != old_val:
+                updated_data[path + (key,) if path else key] = val
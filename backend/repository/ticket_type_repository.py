@@ -1,32 +1,30 @@
 import os
 from copy import deepcopy
-from datetime import datetime
 from http import HTTPStatus
 from typing import List, Tuple
 
-import pytz
 from constants.common_constants import EntryStatus
 from model.ticket_types.ticket_types import TicketType, TicketTypeIn
-from pynamodb.connection import Connection
 from pynamodb.exceptions import (
     PutError,
     PynamoDBConnectionError,
     QueryError,
     TableDoesNotExist,
     TransactWriteError,
+    UpdateError,
 )
 from pynamodb.transactions import TransactWrite
 from repository.repository_utils import RepositoryUtils
 from utils.logger import logger
+from utils.registry import Registry
 from utils.utils import Utils
 
 
 class TicketTypeRepository:
     def __init__(self) -> None:
         self.core_obj = 'TicketType'
-        self.current_date = datetime.now(tz=pytz.timezone('Asia/Manila')).isoformat()
         self.latest_version = 0
-        self.conn = Connection(region=os.getenv('REGION'))
+        self.conn = Registry.get_connection()
 
     def store_ticket_type(self, ticket_type_in: TicketTypeIn) -> Tuple[HTTPStatus, TicketType, str]:
         """Store a new ticket_type.
@@ -38,6 +36,7 @@ class TicketTypeRepository:
         :rtype: Tuple[HTTPStatus, TicketType, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         data = RepositoryUtils.load_data(pydantic_schema_in=ticket_type_in)
         entry_id = Utils.convert_to_slug(ticket_type_in.name)
         event_id = ticket_type_in.eventId
@@ -47,8 +46,8 @@ class TicketTypeRepository:
             ticket_type_entry = TicketType(
                 hashKey=hash_key,
                 rangeKey=range_key,
-                createDate=self.current_date,
-                updateDate=self.current_date,
+                createDate=current_date,
+                updateDate=current_date,
                 createdBy=os.getenv('CURRENT_USER'),
                 updatedBy=os.getenv('CURRENT_USER'),
                 latestVersion=self.latest_version,
@@ -189,6 +188,7 @@ class TicketTypeRepository:
         :rtype: Tuple[HTTPStatus, TicketType, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         current_version = ticket_type_entry.latestVersion
         new_version = current_version + 1
 
@@ -203,11 +203,11 @@ class TicketTypeRepository:
                 # Update Entry -----------------------------------------------------------------------------
                 # check if there's update or none
                 updated_data.update(
-                    updateDate=self.current_date,
+                    updateDate=current_date,
                     updatedBy=os.getenv('CURRENT_USER'),
                     latestVersion=new_version,
                 )
-                actions = [getattr(TicketType, k).set(v) for k, v in updated_data.items()]
+                actions = RepositoryUtils.get_update_actions(TicketType, updated_data)
                 transaction.update(ticket_type_entry, actions=actions)
 
                 # Store Old Entry --------------------------------------------------------------------------
@@ -217,7 +217,7 @@ class TicketTypeRepository:
                 old_ticket_type_entry.updatedBy = old_ticket_type_entry.updatedBy or os.getenv('CURRENT_USER')
                 transaction.save(old_ticket_type_entry)
 
-            ticket_type_entry.refresh()
+            RepositoryUtils.apply_update(ticket_type_entry, updated_data)
             logger.info(f'[{ticket_type_entry.rangeKey}] Update ticket_type data successful')
             return HTTPStatus.OK, ticket_type_entry, ''
 
@@ -237,6 +237,7 @@ class TicketTypeRepository:
         :rtype: Tuple[HTTPStatus, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         try:
             # create new entry with old data
             current_version = ticket_type_entry.latestVersion
@@ -247,7 +248,7 @@ class TicketTypeRepository:
             old_ticket_type_entry.save()
 
             # set entry status to deleted
-            ticket_type_entry.updateDate = self.current_date
+            ticket_type_entry.updateDate = current_date
             ticket_type_entry.updatedBy = os.getenv('CURRENT_USER')
             ticket_type_entry.latestVersion = new_version
             ticket_type_entry.entryStatus = EntryStatus.DELETED.value
@@ -273,21 +274,20 @@ class TicketTypeRepository:
         :rtype: Tuple[HTTPStatus, TicketType, str]
 
         """
+        current_date = RepositoryUtils.get_current_date()
         try:
-            with TransactWrite(connection=self.conn) as transaction:
-                condition = TicketType.rangeKey == ticket_type_entry.rangeKey
-                actions = [
-                    TicketType.currentSales.add(append_count),
-                    TicketType.updateDate.set(self.current_date),
-                    TicketType.updatedBy.set(os.getenv('CURRENT_USER')),
-                ]
-                transaction.update(ticket_type_entry, actions=actions, condition=condition)
-
-            ticket_type_entry.refresh()
+            condition = TicketType.rangeKey == ticket_type_entry.rangeKey
+            actions = [
+                TicketType.currentSales.add(append_count),
+                TicketType.updateDate.set(current_date),
+                TicketType.updatedBy.set(os.getenv('CURRENT_USER')),
+            ]
+            ticket_type_entry.update(actions=actions, condition=condition)
+
             logger.info(f'[{ticket_type_entry.rangeKey}] Append ticket_type sales count successful')
             return HTTPStatus.OK, ticket_type_entry, ''
 
-        except TransactWriteError as e:
+        except UpdateError as e:
             message = f'Failed to append ticket_type sales count: {str(e)}'
             logger.error(f'[{ticket_type_entry.rangeKey}] {message}')
             return HTTPStatus.INTERNAL_SERVER_ERROR, None, message
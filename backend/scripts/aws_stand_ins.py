@@ -0,0 +1,213 @@
+"""In-memory AWS stand-ins shared by the benchmark and load test scripts.
+
+The environment must be configured before any application module is imported, since the models read their table
+names when they are defined. Application modules are therefore imported inside the functions.
+"""
+
+import math
+import os
+import threading
+
+REGION = 'ap-southeast-1'
+
+
+def configure_environment(prefix: str) -> None:
+    """
+    Points the application at the stand-ins. Every AWS call must stay in memory, so this always replaces the .env
+    values.
+
+    Args:
+        prefix (str): Prefix of the table, bucket and queue names.
+    """
+    os.environ.update(
+        AWS_ACCESS_KEY_ID='testing',
+        AWS_SECRET_ACCESS_KEY='testing',
+        AWS_SESSION_TOKEN='testing',
+        AWS_DEFAULT_REGION=REGION,
+        REGION=REGION,
+        ENTITIES_TABLE=f'{prefix}-entities',
+        EVENTS_TABLE=f'{prefix}-events',
+        REGISTRATIONS_TABLE=f'{prefix}-registrations',
+        PREREGISTRATIONS_TABLE=f'{prefix}-preregistrations',
+        EVALUATIONS_TABLE=f'{prefix}-evaluations',
+        S3_BUCKET=f'{prefix}-file-bucket',
+        USER_POOL_ID=f'{REGION}_{prefix}',
+        USER_POOL_CLIENT_ID=prefix,
+        FRONTEND_URL='http://localhost:3000',
+        PAGINATION_SECRET=prefix,
+        LOG_LEVEL='WARNING',
+        # Set by the admin authentication in the API, the seeded entries are created as this user
+        CURRENT_USER=f'{prefix}-admin',
+    )
+    os.environ.pop('STAGE', None)
+
+
+def start_aws_stand_ins(prefix: str) -> list:
+    """
+    Starts the moto stand-ins for DynamoDB, S3 and SQS, then creates the queues, bucket and tables of the application.
+
+    Args:
+        prefix (str): Prefix of the queue names, the same one given to configure_environment.
+
+    Returns:
+        list: The started mocks, stop them when done.
+    """
+    try:
+        from moto import mock_aws
+
+        aws_mocks = [mock_aws()]
+    except ImportError:  # moto < 5 has one mock per service
+        from moto import mock_dynamodb, mock_s3, mock_sqs
+
+        aws_mocks = [mock_dynamodb(), mock_s3(), mock_sqs()]
+
+    for aws_mock in aws_mocks:
+        aws_mock.start()
+
+    import boto3
+    from pynamodb.connection.base import Connection
+
+    # moto does not make conditional writes atomic across threads, serializing its calls restores DynamoDB's guarantees
+    moto_lock = threading.Lock()
+    make_api_call = Connection._make_api_call
+
+    def serialized_make_api_call(connection, operation_name, operation_kwargs):
+        with moto_lock:
+            return make_api_call(connection, operation_name, operation_kwargs)
+
+    Connection._make_api_call = serialized_make_api_call
+
+    sqs_client = boto3.client('sqs', region_name=REGION)
+    for queue_env, queue_name in (
+        ('EMAIL_QUEUE', f'{prefix}-email-queue.fifo'),
+        ('CERTIFICATE_QUEUE', f'{prefix}-certificate-queue.fifo'),
+        ('PAYMENT_QUEUE', f'{prefix}-payment-queue.fifo'),
+    ):
+        queue = sqs_client.create_queue(
+            QueueName=queue_name, Attributes={'FifoQueue': 'true', 'ContentBasedDeduplication': 'true'}
+        )
+        os.environ[queue_env] = queue['QueueUrl']
+
+    boto3.client('s3', region_name=REGION).create_bucket(
+        Bucket=os.environ['S3_BUCKET'], CreateBucketConfiguration={'LocationConstraint': REGION}
+    )
+
+    from model.events.event import Event
+    from model.payments.payments import PaymentTransaction
+    from model.preregistrations.preregistration import PreRegistration
+    from model.registrations.registration import Registration
+
+    # PaymentTransaction declares the GSIs of the Entities table, so it is used to create it
+    for model_cls in (Event, Registration, PreRegistration, PaymentTransaction):
+        model_cls.create_table(wait=True)
+
+    return aws_mocks
+
+
+def seed_event(name: str, maximum_slots: int, ticket_types: list = None, **event_fields):
+    """
+    Stores an open event with limited slots.
+
+    Args:
+        name (str): The name of the event, its slug becomes the event ID.
+        maximum_slots (int): The maximum slots of the event.
+        ticket_types (list): The names and maximum quantities of the ticket types of the event.
+        **event_fields: Additional EventIn fields.
+
+    Returns:
+        Event: The stored event.
+    """
+    from model.events.event import EventIn
+    from model.events.events_constants import EventStatus
+    from model.ticket_types.ticket_types import TicketTypeIn
+    from repository.events_repository import EventsRepository
+    from repository.ticket_type_repository import TicketTypeRepository
+    from utils.registry import Registry
+
+    event_in = EventIn(
+        name=name,
+        email='load-test@example.com',
+        status=EventStatus.OPEN,
+        isLimitedSlot=True,
+        maximumSlots=maximum_slots,
+        hasMultipleTicketTypes=bool(ticket_types),
+        sprintDayRegistrationCount=0,
+        **event_fields,
+    )
+    _, event, message = Registry.get_repository(EventsRepository).store_event(event_in)
+    if event is None:
+        raise RuntimeError(f'Failed to seed event {name}: {message}')
+
+    for ticket_type_name, maximum_quantity in ticket_types or []:
+        Registry.get_repository(TicketTypeRepository).store_ticket_type(
+            TicketTypeIn(
+                name=ticket_type_name,
+                description=ticket_type_name,
+                tier=ticket_type_name,
+                price=event_fields.get('price') or 0,
+                maximumQuantity=maximum_quantity,
+                eventId=event.eventId,
+            )
+        )
+
+    return event
+
+
+def get_slot_consistency(event) -> dict:
+    """
+    Compares the stored registrations of an event with its limits and its registration counter.
+
+    Args:
+        event (Event): The event to check.
+
+    Returns:
+        dict: The registrations, oversold slots, tickets and sprint day slots, and the registration counter drift.
+    """
+    from constants.common_constants import EntryStatus
+    from model.registrations.registration import Registration
+    from repository.events_repository import EventsRepository
+    from repository.ticket_type_repository import TicketTypeRepository
+    from utils.registry import Registry
+
+    registrations = list(
+        Registration.query(event.eventId, filter_condition=Registration.entryStatus == EntryStatus.ACTIVE.value)
+    )
+    _, event_entry, _ = Registry.get_repository(EventsRepository).query_events(event.eventId, use_cache=False)
+
+    oversold_tickets = 0
+    _, ticket_types, _ = Registry.get_repository(TicketTypeRepository).query_ticket_types(event_id=event.eventId)
+    for ticket_type in ticket_types or []:
+        sold = len([r for r in registrations if ticket_type.entryId in (r.ticketTypeId, r.ticketType)])
+        oversold_tickets += max(0, sold - ticket_type.maximumQuantity)
+
+    oversold_sprint_day = 0
+    if event.maximumSprintDaySlots:
+        sprint_day_registrations = len([r for r in registrations if r.sprintDay])
+        oversold_sprint_day = max(0, sprint_day_registrations - event.maximumSprintDaySlots)
+
+    return {
+        'registered': len(registrations),
+        'registrationCount': event_entry.registrationCount,
+        'oversoldSlots': max(0, len(registrations) - event.maximumSlots),
+        'oversoldTickets': oversold_tickets,
+        'oversoldSprintDay': oversold_sprint_day,
+        'counterDrift': event_entry.registrationCount - len(registrations),
+    }
+
+
+def percentile(values: list, percent: float) -> float:
+    """
+    Computes a nearest-rank percentile.
+
+    Args:
+        values (list): The values.
+        percent (float): The percentile, from 0 to 100.
+
+    Returns:
+        float: The percentile of the values, 0 if there are none.
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
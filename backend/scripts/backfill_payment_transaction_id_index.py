@@ -0,0 +1,42 @@
+import argparse
+import os
+
+from dotenv import load_dotenv
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+args = argparse.ArgumentParser()
+args.add_argument('--env-file', type=str, default=os.path.join(script_dir, '..', '.env'), help='Path to the .env file')
+args.add_argument('--dry-run', action='store_true', help='Only log the payment transactions that would be updated')
+parsed_args = args.parse_args()
+load_dotenv(dotenv_path=parsed_args.env_file)
+
+from model.payments.payments import PaymentTransaction
+from utils.logger import logger
+
+
+def backfill_payment_transaction_id_index(dry_run: bool = False) -> None:
+    """
+    Sets paymentTransactionId on payment transactions created before the PaymentTransactionIdIndex existed.
+
+    Every version of a transaction is updated so historical versions can also be found by ID.
+
+    Args:
+        dry_run (bool): If True, only log the payment transactions that would be updated.
+    """
+    filter_condition = PaymentTransaction.paymentTransactionId.does_not_exist()
+
+    updated_count = 0
+    for payment_transaction in PaymentTransaction.scan(filter_condition=filter_condition):
+        logger.info(f'[{payment_transaction.rangeKey}] Adding payment transaction to PaymentTransactionIdIndex')
+        if not dry_run:
+            payment_transaction.update(
+                actions=[PaymentTransaction.paymentTransactionId.set(payment_transaction.entryId)],
+            )
+
+        updated_count += 1
+
+    logger.info(f'{"Found" if dry_run else "Backfilled"} {updated_count} payment transactions')
+
+
+if __name__ == '__main__':
+    backfill_payment_transaction_id_index(dry_run=parsed_args.dry_run)
@@ -0,0 +1,53 @@
+import argparse
+import os
+
+from dotenv import load_dotenv
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+args = argparse.ArgumentParser()
+args.add_argument('--env-file', type=str, default=os.path.join(script_dir, '..', '.env'), help='Path to the .env file')
+args.add_argument('--dry-run', action='store_true', help='Only log the payment transactions that would be updated')
+parsed_args = args.parse_args()
+load_dotenv(dotenv_path=parsed_args.env_file)
+
+from constants.common_constants import EntryStatus
+from model.payments.payments import PaymentTransaction, TransactionStatus
+from pynamodb.exceptions import UpdateError
+from utils.logger import logger
+
+
+def backfill_pending_payment_index(dry_run: bool = False) -> None:
+    """
+    Sets pendingStatus on PENDING payment transactions created before the PendingPaymentIndex existed.
+
+    Only the latest version (v0) of each transaction is indexed, historical versions are left untouched.
+
+    Args:
+        dry_run (bool): If True, only log the payment transactions that would be updated.
+    """
+    filter_condition = PaymentTransaction.transactionStatus == TransactionStatus.PENDING.value
+    filter_condition &= PaymentTransaction.entryStatus == EntryStatus.ACTIVE.value
+    filter_condition &= PaymentTransaction.rangeKey.startswith('v0#')
+    filter_condition &= PaymentTransaction.pendingStatus.does_not_exist()
+
+    updated_count = 0
+    for payment_transaction in PaymentTransaction.scan(filter_condition=filter_condition):
+        logger.info(f'[{payment_transaction.rangeKey}] Adding payment transaction to PendingPaymentIndex')
+        if not dry_run:
+            try:
+                # Only set it if the status is still PENDING, a concurrent update may have already resolved it
+                payment_transaction.update(
+                    actions=[PaymentTransaction.pendingStatus.set(TransactionStatus.PENDING.value)],
+                    condition=PaymentTransaction.transactionStatus == TransactionStatus.PENDING.value,
+                )
+            except UpdateError as e:
+                logger.warning(f'[{payment_transaction.rangeKey}] Skipped, status changed during backfill: {e}')
+                continue
+
+        updated_count += 1
+
+    logger.info(f'{"Found" if dry_run else "Backfilled"} {updated_count} pending payment transactions')
+
+
+if __name__ == '__main__':
+    backfill_pending_payment_index(dry_run=parsed_args.dry_run)
@@ -0,0 +1,263 @@
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+SCENARIOS = ['free', 'paid', 'multi_ticket', 'approval_flow', 'pycon']
+
+args = argparse.ArgumentParser(description='Benchmark the registration endpoints against in-memory AWS stand-ins')
+args.add_argument('--requests', type=int, default=200, help='Number of registrations sent per scenario')
+args.add_argument('--concurrency', type=int, default=16, help='Number of registrations sent at the same time')
+args.add_argument('--slots', type=int, default=150, help='Maximum slots of each event, keep it below --requests')
+args.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=SCENARIOS, help='Scenarios to run')
+args.add_argument('--json', action='store_true', help='Print the results as JSON instead of a table')
+parsed_args = args.parse_args()
+
+from scripts.aws_stand_ins import (
+    configure_environment,
+    get_slot_consistency,
+    percentile,
+    seed_event,
+    start_aws_stand_ins,
+)
+
+configure_environment('benchmark')
+aws_stand_ins = start_aws_stand_ins('benchmark')
+
+from constants.common_constants import EntryStatus
+from fastapi.testclient import TestClient
+from main import app
+from model.payments.payments import PaymentTransaction, TransactionStatus
+from model.preregistrations.preregistration import PreRegistrationIn, PreRegistrationPatch
+from model.preregistrations.preregistrations_constants import AcceptanceStatus
+from repository.preregistrations_repository import PreRegistrationsRepository
+from repository.repository_metrics import RepositoryMetrics
+from repository.repository_utils import RepositoryUtils
+from utils.registry import Registry
+
+request_metrics = []
+request_metrics_lock = threading.Lock()
+
+
+def collect_request_metrics(repository_metrics: RepositoryMetrics) -> None:
+    with request_metrics_lock:
+        request_metrics.append(repository_metrics.get_operations())
+
+
+# The benchmark reads the per-request DynamoDB metrics instead of printing them
+RepositoryMetrics.emit = collect_request_metrics
+
+
+def seed_payment_transaction(event_id: str, index: int) -> str:
+    """
+    Stores a successful payment transaction for a paid registration.
+
+    Args:
+        event_id (str): The event ID of the payment transaction.
+        index (int): The index of the registration.
+
+    Returns:
+        str: The payment transaction ID.
+    """
+    transaction_id = f'benchmark-transaction-{index}'
+    current_date = RepositoryUtils.get_current_date()
+    PaymentTransaction(
+        hashKey=f'PaymentTransaction#{event_id}',
+        rangeKey=f'v0#{transaction_id}',
+        latestVersion=0,
+        entryStatus=EntryStatus.ACTIVE.value,
+        entryId=transaction_id,
+        createDate=current_date,
+        updateDate=current_date,
+        price=500,
+        eventId=event_id,
+        transactionStatus=TransactionStatus.SUCCESS.value,
+        paymentTransactionId=transaction_id,
+    ).save()
+    return transaction_id
+
+
+def build_scenario(scenario: str) -> tuple:
+    """
+    Seeds the event of a scenario.
+
+    Args:
+        scenario (str): The scenario name.
+
+    Returns:
+        tuple: The event and a function building the path and body of the n-th registration request.
+    """
+    half_slots = parsed_args.slots // 2
+
+    def registration_body(event_id: str, index: int, **fields) -> dict:
+        return {
+            'eventId': event_id,
+            'email': f'{scenario}-{index}@example.com',
+            'firstName': 'Bench',
+            'lastName': f'Mark {index}',
+            'contactNumber': '09170000000',
+            **fields,
+        }
+
+    if scenario == 'free':
+        event = seed_event('Benchmark Free', parsed_args.slots, paidEvent=False)
+        return event, lambda index: ('/registrations', registration_body(event.eventId, index))
+
+    if scenario == 'paid':
+        event = seed_event('Benchmark Paid', parsed_args.slots, paidEvent=True, price=500)
+        transaction_ids = [seed_payment_transaction(event.eventId, index) for index in range(parsed_args.requests)]
+        return event, lambda index: (
+            '/registrations',
+            registration_body(event.eventId, index, transactionId=transaction_ids[index], amountPaid=500),
+        )
+
+    if scenario == 'multi_ticket':
+        event = seed_event(
+            'Benchmark Multi Ticket', parsed_args.slots, ticket_types=[('regular', half_slots), ('vip', half_slots)]
+        )
+        return event, lambda index: (
+            '/registrations',
+            registration_body(event.eventId, index, ticketTypeId='regular' if index % 2 else 'vip'),
+        )
+
+    if scenario == 'approval_flow':
+        event = seed_event('Benchmark Approval Flow', parsed_args.slots, isApprovalFlow=True)
+        preregistrations_repository = Registry.get_repository(PreRegistrationsRepository)
+        for index in range(parsed_args.requests):
+            _, preregistration, _ = preregistrations_repository.store_preregistration(
+                PreRegistrationIn(**registration_body(event.eventId, index))
+            )
+            preregistrations_repository.update_preregistration(
+                preregistration, PreRegistrationPatch(acceptanceStatus=AcceptanceStatus.ACCEPTED)
+            )
+
+        return event, lambda index: (
+            '/registrations',
+            {'eventId': event.eventId, 'email': f'{scenario}-{index}@example.com'},
+        )
+
+    event = seed_event(
+        'Benchmark PyCon',
+        parsed_args.slots,
+        ticket_types=[('coder', half_slots), ('kasosyo', half_slots)],
+        paidEvent=True,
+        price=500,
+        sprintDay=True,
+        sprintDayPrice=200,
+        maximumSprintDaySlots=max(1, parsed_args.slots // 4),
+    )
+    transaction_ids = [seed_payment_transaction(event.eventId, index) for index in range(parsed_args.requests)]
+    return event, lambda index: (
+        '/pycon/registrations',
+        {
+            'eventId': event.eventId,
+            'email': f'{scenario}-{index}@example.com',
+            'firstName': 'Bench',
+            'lastName': f'Mark {index}',
+            'nickname': 'Bench',
+            'pronouns': 'they/them',
+            'contactNumber': '09170000000',
+            'organization': 'Benchmark',
+            'jobTitle': 'Engineer',
+            'ticketType': 'coder' if index % 2 else 'kasosyo',
+            'sprintDay': index % 3 == 0,
+            'availTShirt': False,
+            'communityInvolvement': False,
+            'futureVolunteer': False,
+            'validIdObjectKey': f'benchmark/{index}.png',
+            'transactionId': transaction_ids[index],
+            'amountPaid': 500,
+        },
+    )
+
+
+def run_scenario(client: TestClient, scenario: str) -> dict:
+    """
+    Sends concurrent registrations for one scenario and measures them.
+
+    Args:
+        client (TestClient): The client of the FastAPI app.
+        scenario (str): The scenario name.
+
+    Returns:
+        dict: The results of the scenario.
+    """
+    event, build_request = build_scenario(scenario)
+    del request_metrics[:]
+
+    def send(index: int) -> tuple:
+        path, body = build_request(index)
+        start = time.perf_counter()
+        response = client.post(path, json=body)
+        return response.status_code, (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=parsed_args.concurrency) as executor:
+        responses = list(executor.map(send, range(parsed_args.requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for _, latency in responses]
+    calls = [sum(values['Pages'] for values in operations.values()) for operations in request_metrics]
+    capacity = [sum(values['ConsumedCapacity'] for values in operations.values()) for operations in request_metrics]
+    status_codes = {}
+    for status_code, _ in responses:
+        status_codes[str(status_code)] = status_codes.get(str(status_code), 0) + 1
+
+    return {
+        'scenario': scenario,
+        'requests': parsed_args.requests,
+        'concurrency': parsed_args.concurrency,
+        'throughput': round(parsed_args.requests / elapsed, 1),
+        'p50': round(percentile(latencies, 50), 1),
+        'p95': round(percentile(latencies, 95), 1),
+        'p99': round(percentile(latencies, 99), 1),
+        'dynamodbCallsPerRequest': round(sum(calls) / len(calls), 2) if calls else 0,
+        'dynamodbCallsMax': max(calls, default=0),
+        'capacityPerRequest': round(sum(capacity) / len(capacity), 2) if capacity else 0,
+        'statusCodes': status_codes,
+        'slots': event.maximumSlots,
+        **get_slot_consistency(event),
+    }
+
+
+def print_results(results: list) -> None:
+    """
+    Prints the results as a table.
+
+    Args:
+        results (list): The results of every scenario.
+    """
+    columns = [
+        ('scenario', 14),
+        ('throughput', 10),
+        ('p50', 8),
+        ('p95', 8),
+        ('p99', 8),
+        ('dynamodbCallsPerRequest', 10),
+        ('capacityPerRequest', 10),
+        ('registered', 11),
+        ('slots', 6),
+        ('oversoldSlots', 8),
+        ('oversoldTickets', 8),
+        ('oversoldSprintDay', 8),
+        ('counterDrift', 8),
+    ]
+    headers = ['scenario', 'req/s', 'p50 ms', 'p95 ms', 'p99 ms', 'ddb/req', 'rcu+wcu', 'registered', 'slots']
+    headers += ['oversold', 'tickets', 'sprint', 'drift', 'status codes']
+    print(' '.join(header.ljust(width) for header, (_, width) in zip(headers, columns + [('statusCodes', 0)])))
+    for result in results:
+        print(' '.join(str(result[key]).ljust(width) for key, width in columns) + f' {result["statusCodes"]}')
+
+
+if __name__ == '__main__':
+    with TestClient(app) as test_client:
+        benchmark_results = [run_scenario(test_client, scenario) for scenario in parsed_args.scenarios]
+
+    for aws_stand_in in aws_stand_ins:
+        aws_stand_in.stop()
+
+    if parsed_args.json:
+        print(json.dumps(benchmark_results, indent=2))
+    else:
+        print_results(benchmark_results)
@@ -0,0 +1,142 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from dotenv import load_dotenv
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.join(script_dir, '..')
+args = argparse.ArgumentParser(
+    description='Report the cold start import time of a module and check it against a budget'
+)
+args.add_argument('--env-file', type=str, default=os.path.join(backend_dir, '.env'), help='Path to the .env file')
+args.add_argument('--module', type=str, default='main', help='Module imported by the Lambda handler')
+args.add_argument('--budget-ms', type=float, default=1000, help='Maximum median import time in milliseconds')
+args.add_argument('--runs', type=int, default=5, help='Number of fresh interpreters to measure, the median is used')
+args.add_argument('--top', type=int, default=15, help='Number of slowest direct imports to report')
+args.add_argument(
+    '--forbid',
+    nargs='*',
+    default=['pandas', 'numpy', 'openpyxl', 'PIL', 'httpx'],
+    help='Packages that must not be imported by the module',
+)
+args.add_argument('--json', action='store_true', help='Print the report as JSON')
+parsed_args = args.parse_args()
+load_dotenv(dotenv_path=parsed_args.env_file)
+
+# Importing the app only needs these to be set, so the check also runs without a .env file (e.g. in CI)
+os.environ.setdefault('REGION', 'ap-southeast-1')
+os.environ.setdefault('USER_POOL_ID', 'ap-southeast-1_importtime')
+os.environ.setdefault('USER_POOL_CLIENT_ID', 'importtime')
+
+
+def measure_import(module: str) -> list:
+    """
+    Imports a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module (str): The module to import.
+
+    Returns:
+        list: The imports as (depth, name, self_us, cumulative_us), in the order Python finished them.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=backend_dir,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'Failed to import {module}:\n{result.stderr[-2000:]}')
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        self_us, cumulative_us, name = line[len('import time:') :].split('|', 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((depth, name.strip(), int(self_us), int(cumulative_us)))
+
+    return imports
+
+
+def get_import_report(module: str, imports: list) -> dict:
+    """
+    Summarizes one measurement of a module.
+
+    Args:
+        module (str): The measured module.
+        imports (list): The imports returned by measure_import.
+
+    Returns:
+        dict: The import time of the module, its slowest direct imports and the imported packages.
+    """
+    module_depth, _, _, total_us = next(entry for entry in imports if entry[1] == module)
+    module_index = next(index for index, entry in enumerate(imports) if entry[1] == module)
+
+    # The imports of a module are listed before it, the direct ones are one level deeper
+    direct_imports = []
+    for depth, name, _, cumulative_us in reversed(imports[:module_index]):
+        if depth <= module_depth:
+            break
+        if depth == module_depth + 1:
+            direct_imports.append({'module': name, 'ms': round(cumulative_us / 1000, 1)})
+
+    return {
+        'ms': total_us / 1000,
+        'directImports': sorted(direct_imports, key=lambda entry: entry['ms'], reverse=True),
+        'packages': {name.split('.')[0] for _, name, _, _ in imports},
+    }
+
+
+def check_import_time() -> dict:
+    """
+    Measures the module over several runs and checks the median against the budget and forbidden packages.
+
+    Returns:
+        dict: The report, with the failures that make the check exit with an error.
+    """
+    reports = [
+        get_import_report(parsed_args.module, measure_import(parsed_args.module)) for _ in range(parsed_args.runs)
+    ]
+    median_ms = statistics.median(report['ms'] for report in reports)
+    median_report = min(reports, key=lambda report: abs(report['ms'] - median_ms))
+    forbidden = sorted(set(parsed_args.forbid) & set().union(*(report['packages'] for report in reports)))
+
+    failures = []
+    if median_ms > parsed_args.budget_ms:
+        failures.append(f'Import time {median_ms:.1f} ms exceeds the budget of {parsed_args.budget_ms:.1f} ms')
+    if forbidden:
+        failures.append(f'Forbidden packages imported: {", ".join(forbidden)}')
+
+    return {
+        'module': parsed_args.module,
+        'runs': [round(report['ms'], 1) for report in reports],
+        'medianMs': round(median_ms, 1),
+        'budgetMs': parsed_args.budget_ms,
+        'slowestDirectImports': median_report['directImports'][: parsed_args.top],
+        'forbiddenImports': forbidden,
+        'failures': failures,
+    }
+
+
+if __name__ == '__main__':
+    import_report = check_import_time()
+    if parsed_args.json:
+        print(json.dumps(import_report, indent=2))
+    else:
+        print(f'{import_report["module"]}: median {import_report["medianMs"]} ms over {import_report["runs"]} ms')
+        print(f'budget: {import_report["budgetMs"]} ms')
+        print('slowest direct imports:')
+        for direct_import in import_report['slowestDirectImports']:
+            print(f'  {str(direct_import["ms"]).rjust(8)} ms  {direct_import["module"]}')
+
+        for failure in import_report['failures']:
+            print(f'FAILED: {failure}')
+
+    sys.exit(1 if import_report['failures'] else 0)
@@ -0,0 +1,189 @@
+import argparse
+import json
+import sys
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+args = argparse.ArgumentParser(description='Check the KonfHub gateway retries and circuit breaker against a local stub')
+args.add_argument('--read-timeout', type=float, default=1, help='Read timeout in seconds, instead of the deployed one')
+args.add_argument('--json', action='store_true', help='Print the report as JSON')
+parsed_args = args.parse_args()
+
+from constants.common_constants import CommonConstants
+from constants.konhub_constants import KonfHubConstants
+
+KonfHubConstants.READ_TIMEOUT_SECONDS = parsed_args.read_timeout
+KonfHubConstants.RETRY_BACKOFF_SECONDS = 0.05
+
+from external_gateway.konfhub_gateway import KonfHubGateway
+from model.konfhub.konfhub import KonfHubCaptureRegistrationIn, RegistrationDetail
+from utils.circuit_breaker import CircuitBreaker
+
+
+class StubKonfHub(BaseHTTPRequestHandler):
+    """Answers POST /<scenario> with the next response scripted for the scenario and records every request."""
+
+    protocol_version = 'HTTP/1.1'
+    responses = {}
+    requests_seen = []
+    lock = threading.Lock()
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        scenario = self.path.strip('/')
+        with self.lock:
+            self.requests_seen.append((scenario, self.client_address[1]))
+            scripted = self.responses.get(scenario, [])
+            status, delay = scripted.pop(0) if len(scripted) > 1 else scripted[0]
+
+        time.sleep(delay)
+        body = json.dumps({'scenario': scenario}).encode()
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:  # The client timed out and closed the connection
+            pass
+
+    def log_message(self, format: str, *log_args) -> None:
+        pass
+
+
+def capture(base_url: str, scenario: str) -> tuple:
+    """
+    Captures a registration through the gateway against a scenario of the stub.
+
+    Args:
+        base_url (str): The URL of the stub.
+        scenario (str): The scenario to call.
+
+    Returns:
+        tuple: The gateway status, the requests the stub received and the elapsed seconds.
+    """
+    capture_in = KonfHubCaptureRegistrationIn(
+        event_id='stub-event',
+        registration_tz=CommonConstants.PH_TIMEZONE,
+        registration_details={
+            'stub-ticket': [
+                RegistrationDetail(
+                    name='Stub Attendee',
+                    email_id='stub@example.com',
+                    quantity=1,
+                    phone_number='9170000000',
+                    dial_code=CommonConstants.PH_DIAL_CODE,
+                    country_code=CommonConstants.PH_COUNTRY_CODE,
+                )
+            ]
+        },
+    )
+    seen_before = len(StubKonfHub.requests_seen)
+    start = time.perf_counter()
+    status, _, _ = KonfHubGateway(capture_url=f'{base_url}/{scenario}').capture_registration(capture_in, 'stub-key')
+    elapsed = time.perf_counter() - start
+    return status, len(StubKonfHub.requests_seen) - seen_before, elapsed
+
+
+def reset_circuit_breaker() -> None:
+    """
+    Replaces the shared circuit breaker of the gateway so each check starts with a closed circuit.
+    """
+    KonfHubGateway.circuit_breaker = CircuitBreaker(
+        name='KonfHub',
+        failure_threshold=KonfHubConstants.CIRCUIT_FAILURE_THRESHOLD,
+        open_seconds=KonfHubConstants.CIRCUIT_OPEN_SECONDS,
+    )
+
+
+def run_checks(base_url: str) -> list:
+    """
+    Runs every scenario against the stub and compares the gateway behavior with the expected one.
+
+    Args:
+        base_url (str): The URL of the stub.
+
+    Returns:
+        list: The result of each check.
+    """
+    read_timeout = KonfHubConstants.READ_TIMEOUT_SECONDS
+    StubKonfHub.responses = {
+        'ok': [(200, 0)],
+        'flaky': [(503, 0), (200, 0)],
+        'throttled': [(429, 0), (200, 0)],
+        'down': [(503, 0)],
+        'error': [(500, 0)],
+        'slow': [(200, read_timeout + 1)],
+        'refused': [(400, 0)],
+    }
+    checks = []
+
+    def check(name: str, scenario: str, expected_status: HTTPStatus, expected_requests: int, max_seconds: float):
+        reset_circuit_breaker()
+        status, request_count, elapsed = capture(base_url, scenario)
+        passed = status == expected_status and request_count == expected_requests and elapsed <= max_seconds
+        checks.append(
+            {
+                'check': name,
+                'status': status.value,
+                'requests': request_count,
+                'seconds': round(elapsed, 2),
+                'passed': passed,
+            }
+        )
+
+    check('success', 'ok', HTTPStatus.OK, 1, 1)
+    check('retries 503', 'flaky', HTTPStatus.OK, 2, 2)
+    check('retries 429', 'throttled', HTTPStatus.OK, 2, 2)
+    check('retries are bounded', 'down', HTTPStatus.BAD_GATEWAY, KonfHubConstants.MAX_RETRIES + 1, 2)
+    check('other 5xx are not retried', 'error', HTTPStatus.BAD_GATEWAY, 1, 1)
+    check('read timeout is not retried', 'slow', HTTPStatus.GATEWAY_TIMEOUT, 1, read_timeout + 1)
+    check('4xx is not retried', 'refused', HTTPStatus.INTERNAL_SERVER_ERROR, 1, 1)
+
+    # Sequential calls must reuse the keep-alive connection of the shared session
+    reset_circuit_breaker()
+    seen_before = len(StubKonfHub.requests_seen)
+    for _ in range(5):
+        capture(base_url, 'ok')
+    client_ports = {port for _, port in StubKonfHub.requests_seen[seen_before:]}
+    checks.append({'check': 'connection reuse', 'connections': len(client_ports), 'passed': len(client_ports) == 1})
+
+    # Once open, the circuit fails fast without calling the stub, refusals do not count as failures
+    reset_circuit_breaker()
+    for _ in range(KonfHubConstants.CIRCUIT_FAILURE_THRESHOLD):
+        capture(base_url, 'refused')
+    refused_keeps_closed = not KonfHubGateway.circuit_breaker.is_open
+    for _ in range(KonfHubConstants.CIRCUIT_FAILURE_THRESHOLD):
+        capture(base_url, 'down')
+    status, request_count, elapsed = capture(base_url, 'ok')
+    checks.append(
+        {
+            'check': 'circuit breaker',
+            'status': status.value,
+            'requests': request_count,
+            'seconds': round(elapsed, 3),
+            'passed': refused_keeps_closed and status == HTTPStatus.SERVICE_UNAVAILABLE and request_count == 0,
+        }
+    )
+
+    return checks
+
+
+if __name__ == '__main__':
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubKonfHub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        results = run_checks(f'http://127.0.0.1:{server.server_port}')
+    finally:
+        server.shutdown()
+
+    if parsed_args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            details = ', '.join(f'{key}={value}' for key, value in result.items() if key not in ('check', 'passed'))
+            print(f'{"PASS" if result["passed"] else "FAIL"}  {result["check"].ljust(28)} {details}')
+
+    sys.exit(0 if all(result['passed'] for result in results) else 1)
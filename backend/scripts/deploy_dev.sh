@@ -2,5 +2,7 @@
 
 echo "Creating requirements file"
 uv export --format requirements-txt --no-hashes --output-file requirements.txt --no-dev
+echo "Bundling the Cognito JWKS"
+python -m scripts.download_cognito_jwks
 echo "Deploying with serverless framework"
 npx sls deploy --stage dev --verbose $1
@@ -0,0 +1,47 @@
+import argparse
+import json
+import os
+
+from dotenv import load_dotenv
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+args = argparse.ArgumentParser(description='Download the Cognito JWKS bundled with the API')
+args.add_argument('--env-file', type=str, default=os.path.join(script_dir, '..', '.env'), help='Path to the .env file')
+args.add_argument(
+    '--output',
+    type=str,
+    default=os.path.join(script_dir, '..', 'aws', 'cognito_jwks.json'),
+    help='Path of the bundled JWKS file',
+)
+parsed_args = args.parse_args()
+load_dotenv(dotenv_path=parsed_args.env_file)
+
+import requests
+
+
+def download_cognito_jwks(region: str, user_pool_id: str, output: str) -> int:
+    """
+    Downloads the JSON Web Key Set of a user pool.
+
+    Args:
+        region (str): The region of the user pool.
+        user_pool_id (str): The ID of the user pool.
+        output (str): Path of the JWKS file to write.
+
+    Returns:
+        int: The number of keys written.
+    """
+    url = f'https://cognito-idp.{region}.amazonaws.com/{user_pool_id}/.well-known/jwks.json'
+    response = requests.get(url, timeout=10)
+    response.raise_for_status()
+    jwks = response.json()
+
+    with open(output, 'w') as f:
+        json.dump(jwks, f, indent=2)
+
+    return len(jwks.get('keys', []))
+
+
+if __name__ == '__main__':
+    key_count = download_cognito_jwks(os.environ['REGION'], os.environ['USER_POOL_ID'], parsed_args.output)
+    print(f'Wrote {key_count} keys to {parsed_args.output}')
@@ -0,0 +1,316 @@
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+STEPS = ['getEvent', 'createPayment', 'paymentCallback', 'getRegistration']
+
+args = argparse.ArgumentParser(description='Replay a PyCon ticket drop against a local uvicorn server of main:app')
+args.add_argument('--clients', type=int, default=2000, help='Number of clients going through the ticket drop')
+args.add_argument('--concurrency', type=int, default=64, help='Number of clients active at the same time')
+args.add_argument('--slots', type=int, default=500, help='Maximum slots of the event, keep it below --clients')
+args.add_argument('--sprint-day-slots', type=int, default=100, help='Maximum sprint day slots of the event')
+args.add_argument('--ramp-up', type=float, default=0, help='Seconds over which the clients arrive, 0 for all at once')
+args.add_argument('--port', type=int, default=8765, help='Port of the local uvicorn server')
+args.add_argument('--json', action='store_true', help='Print the results as JSON instead of tables')
+parsed_args = args.parse_args()
+
+from scripts.aws_stand_ins import (
+    configure_environment,
+    get_slot_consistency,
+    percentile,
+    seed_event,
+    start_aws_stand_ins,
+)
+
+configure_environment('load-test')
+aws_stand_ins = start_aws_stand_ins('load-test')
+
+import requests
+import uvicorn
+from main import app
+from model.payments.payments import PaymentTransaction, TransactionStatus
+from repository.repository_metrics import RepositoryMetrics
+
+# The per-request DynamoDB metrics would flood stdout with thousands of EMF lines
+RepositoryMetrics.emit = lambda self: None
+
+TICKET_PRICE = 500
+SPRINT_DAY_PRICE = 200
+
+sessions = threading.local()
+
+
+def start_server(port: int) -> uvicorn.Server:
+    """
+    Starts uvicorn with main:app in a background thread of this process, so it shares the AWS stand-ins.
+
+    Args:
+        port (int): The port to listen on.
+
+    Returns:
+        uvicorn.Server: The started server, set should_exit to stop it.
+    """
+    server = uvicorn.Server(uvicorn.Config(app, host='127.0.0.1', port=port, log_level='warning', lifespan='off'))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    return server
+
+
+def get_session() -> requests.Session:
+    """
+    Gets the HTTP session of the current client thread, so connections are reused like a browser would.
+
+    Returns:
+        requests.Session: The session of the thread.
+    """
+    if not hasattr(sessions, 'session'):
+        sessions.session = requests.Session()
+
+    return sessions.session
+
+
+def send(step: str, method: str, url: str, expected_status: int, **kwargs) -> tuple:
+    """
+    Sends one request of a client journey.
+
+    Args:
+        step (str): The journey step.
+        method (str): The HTTP method.
+        url (str): The URL of the request.
+        expected_status (int): The status code of a successful response.
+        **kwargs: Additional requests arguments.
+
+    Returns:
+        tuple: The step result (step, status code, latency in ms, whether it failed) and the response or None.
+    """
+    start = time.perf_counter()
+    try:
+        response = get_session().request(method, url, timeout=60, allow_redirects=False, **kwargs)
+    except requests.RequestException:
+        return (step, 0, (time.perf_counter() - start) * 1000, True), None
+
+    latency_ms = (time.perf_counter() - start) * 1000
+    return (step, response.status_code, latency_ms, response.status_code != expected_status), response
+
+
+def run_client(base_url: str, event_id: str, index: int, start_at: float) -> dict:
+    """
+    Goes through the ticket drop as one attendee: view the event, pay, return from the payment provider, then look up
+    the registration.
+
+    Args:
+        base_url (str): The URL of the local server.
+        event_id (str): The event ID of the ticket drop.
+        index (int): The index of the client.
+        start_at (float): The perf_counter time the client arrives at.
+
+    Returns:
+        dict: The step results and whether the client got a ticket.
+    """
+    time.sleep(max(0.0, start_at - time.perf_counter()))
+    email = f'attendee-{index}@example.com'
+    sprint_day = index % 4 == 0
+    results = []
+
+    result, response = send('getEvent', 'GET', f'{base_url}/events/{event_id}', 200)
+    results.append(result)
+    if response is None or result[3]:
+        return {'results': results, 'outcome': 'failed'}
+
+    result, response = send(
+        'createPayment',
+        'POST',
+        f'{base_url}/payments',
+        200,
+        json={
+            'price': TICKET_PRICE + (SPRINT_DAY_PRICE if sprint_day else 0),
+            'transactionStatus': TransactionStatus.PENDING.value,
+            'eventId': event_id,
+            'registrationData': {
+                'firstName': 'Load',
+                'lastName': f'Test {index}',
+                'nickname': 'Load',
+                'pronouns': 'they/them',
+                'email': email,
+                'eventId': event_id,
+                'contactNumber': '09170000000',
+                'organization': 'Load Test',
+                'jobTitle': 'Engineer',
+                'ticketType': 'coder' if index % 2 else 'kasosyo',
+                'sprintDay': sprint_day,
+                'availTShirt': False,
+                'communityInvolvement': False,
+                'futureVolunteer': False,
+                'validIdObjectKey': f'load-test/{index}.png',
+            },
+        },
+    )
+    results.append(result)
+    if response is None or result[3]:
+        return {'results': results, 'outcome': 'failed'}
+
+    payment_transaction_id = response.json()['entryId']
+    result, response = send(
+        'paymentCallback',
+        'GET',
+        f'{base_url}/payments/callback',
+        302,
+        params={'paymentTransactionId': payment_transaction_id, 'eventId': event_id},
+    )
+    results.append(result)
+    if response is None or result[3]:
+        return {'results': results, 'outcome': 'failed'}
+
+    # The callback redirects to the error step when the registration is refused, e.g. once the event is full
+    if 'step=Success' not in response.headers.get('Location', ''):
+        return {'results': results, 'outcome': 'refused'}
+
+    result, response = send(
+        'getRegistration', 'GET', f'{base_url}/pycon/registrations/{email}/email', 200, params={'eventId': event_id}
+    )
+    results.append(result)
+    return {'results': results, 'outcome': 'failed' if result[3] else 'registered'}
+
+
+def get_payment_consistency(event_id: str, registered: int) -> dict:
+    """
+    Compares the successful payment transactions of an event with its registrations.
+
+    Args:
+        event_id (str): The event ID of the ticket drop.
+        registered (int): The number of active registrations of the event.
+
+    Returns:
+        dict: The successful and pending payment transactions, and the successful ones without a registration.
+    """
+    # Updates keep the previous versions of a payment transaction, v0 is the latest one
+    payment_transactions = list(
+        PaymentTransaction.query(
+            f'PaymentTransaction#{event_id}', range_key_condition=PaymentTransaction.rangeKey.startswith('v0#')
+        )
+    )
+    successful = len([p for p in payment_transactions if p.transactionStatus == TransactionStatus.SUCCESS.value])
+    pending = len([p for p in payment_transactions if p.transactionStatus == TransactionStatus.PENDING.value])
+    return {
+        'successfulPayments': successful,
+        'pendingPayments': pending,
+        'paidWithoutRegistration': max(0, successful - registered),
+    }
+
+
+def run_ticket_drop(base_url: str) -> dict:
+    """
+    Seeds the PyCon event and sends every client through the ticket drop.
+
+    Args:
+        base_url (str): The URL of the local server.
+
+    Returns:
+        dict: The results of the ticket drop.
+    """
+    event = seed_event(
+        'Load Test PyCon',
+        parsed_args.slots,
+        ticket_types=[('coder', parsed_args.slots // 2), ('kasosyo', parsed_args.slots - parsed_args.slots // 2)],
+        paidEvent=True,
+        price=TICKET_PRICE,
+        sprintDay=True,
+        sprintDayPrice=SPRINT_DAY_PRICE,
+        maximumSprintDaySlots=parsed_args.sprint_day_slots,
+    )
+
+    start = time.perf_counter()
+    arrival_gap = parsed_args.ramp_up / parsed_args.clients
+    with ThreadPoolExecutor(max_workers=parsed_args.concurrency) as executor:
+        clients = list(
+            executor.map(
+                lambda index: run_client(base_url, event.eventId, index, start + index * arrival_gap),
+                range(parsed_args.clients),
+            )
+        )
+    elapsed = time.perf_counter() - start
+
+    step_results = {step: [] for step in STEPS}
+    for client in clients:
+        for result in client['results']:
+            step_results[result[0]].append(result)
+
+    steps = []
+    for step, results in step_results.items():
+        latencies = [latency for _, _, latency, _ in results]
+        errors = len([result for result in results if result[3]])
+        status_codes = {}
+        for _, status_code, _, _ in results:
+            status_codes[str(status_code)] = status_codes.get(str(status_code), 0) + 1
+
+        steps.append(
+            {
+                'step': step,
+                'requests': len(results),
+                'throughput': round(len(results) / elapsed, 1),
+                'errors': errors,
+                'errorRate': round(errors / len(results), 4) if results else 0,
+                'p50': round(percentile(latencies, 50), 1),
+                'p95': round(percentile(latencies, 95), 1),
+                'p99': round(percentile(latencies, 99), 1),
+                'statusCodes': status_codes,
+            }
+        )
+
+    total_requests = sum(step['requests'] for step in steps)
+    total_errors = sum(step['errors'] for step in steps)
+    consistency = get_slot_consistency(event)
+    return {
+        'clients': parsed_args.clients,
+        'concurrency': parsed_args.concurrency,
+        'slots': event.maximumSlots,
+        'sprintDaySlots': event.maximumSprintDaySlots,
+        'durationSeconds': round(elapsed, 2),
+        'throughput': round(total_requests / elapsed, 1),
+        'errorRate': round(total_errors / total_requests, 4) if total_requests else 0,
+        'registeredClients': len([client for client in clients if client['outcome'] == 'registered']),
+        'refusedClients': len([client for client in clients if client['outcome'] == 'refused']),
+        'failedClients': len([client for client in clients if client['outcome'] == 'failed']),
+        'steps': steps,
+        **consistency,
+        **get_payment_consistency(event.eventId, consistency['registered']),
+    }
+
+
+def print_results(results: dict) -> None:
+    """
+    Prints the results as a table per step followed by the totals and consistency checks.
+
+    Args:
+        results (dict): The results of the ticket drop.
+    """
+    columns = [('step', 16), ('requests', 9), ('throughput', 8), ('errors', 7), ('errorRate', 10)]
+    columns += [('p50', 9), ('p95', 9), ('p99', 9)]
+    headers = ['step', 'requests', 'req/s', 'errors', 'error rate', 'p50 ms', 'p95 ms', 'p99 ms', 'status codes']
+    print(' '.join(header.ljust(width) for header, (_, width) in zip(headers, columns + [('statusCodes', 0)])))
+    for step in results['steps']:
+        print(' '.join(str(step[key]).ljust(width) for key, width in columns) + f' {step["statusCodes"]}')
+
+    print()
+    for key, value in results.items():
+        if key != 'steps':
+            print(f'{key.ljust(24)} {value}')
+
+
+if __name__ == '__main__':
+    local_server = start_server(parsed_args.port)
+    try:
+        ticket_drop_results = run_ticket_drop(f'http://127.0.0.1:{parsed_args.port}')
+    finally:
+        local_server.should_exit = True
+        for aws_stand_in in aws_stand_ins:
+            aws_stand_in.stop()
+
+    if parsed_args.json:
+        print(json.dumps(ticket_drop_results, indent=2))
+    else:
+        print_results(ticket_drop_results)
@@ -0,0 +1,136 @@
+import argparse
+import json
+import os
+import random
+
+from dotenv import load_dotenv
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+args = argparse.ArgumentParser(description='Replay DynamoDB stream records through the event aggregates handler')
+args.add_argument('--env-file', type=str, default=os.path.join(script_dir, '..', '.env'), help='Path to the .env file')
+args.add_argument('--records-file', type=str, help='JSON file with stream records, either a list or a Lambda event')
+args.add_argument('--event-id', type=str, help='Event ID of the synthetic records, or of the aggregate to rebuild')
+args.add_argument('--synthetic', type=int, default=0, help='Number of synthetic registration records to generate')
+args.add_argument('--rebuild', action='store_true', help='Rebuild the aggregate of --event-id from the source tables')
+args.add_argument('--dry-run', action='store_true', help='Only log the counter deltas that would be applied')
+parsed_args = args.parse_args()
+load_dotenv(dotenv_path=parsed_args.env_file)
+
+from constants.common_constants import EntryStatus
+from functions.event_aggregates_handler import handler
+from model.registrations.registration import Registration
+from repository.repository_utils import RepositoryUtils
+from usecase.event_aggregate_usecase import EventAggregateUsecase
+from utils.logger import logger
+
+
+def load_records(records_file: str) -> list:
+    """
+    Loads stream records from a JSON file.
+
+    Args:
+        records_file (str): Path to a JSON list of records or a Lambda event with a Records key.
+
+    Returns:
+        list: The stream records.
+    """
+    with open(records_file) as f:
+        data = json.load(f)
+
+    return data['Records'] if isinstance(data, dict) else data
+
+
+def generate_synthetic_records(event_id: str, count: int) -> list:
+    """
+    Generates INSERT stream records of active registrations with random attributes.
+
+    Args:
+        event_id (str): The event ID of the registrations.
+        count (int): The number of records to generate.
+
+    Returns:
+        list: The stream records.
+    """
+    event_source_arn = (
+        f'arn:aws:dynamodb:{os.getenv("REGION")}:000000000000:table/{Registration.Meta.table_name}/stream/synthetic'
+    )
+    current_date = RepositoryUtils.get_current_date()
+
+    records = []
+    for index in range(count):
+        registration = Registration(
+            hashKey=event_id,
+            rangeKey=f'synthetic-{index}',
+            registrationId=f'synthetic-{index}',
+            entryStatus=EntryStatus.ACTIVE.value,
+            createDate=current_date,
+            updateDate=current_date,
+            eventId=event_id,
+            email=f'synthetic-{index}@example.com',
+            careerStatus=random.choice(['Student', 'Professional', 'Unemployed']),
+            shirtSize=random.choice(['S', 'M', 'L', 'XL']),
+            shirtType=random.choice(['Unisex', 'Female']),
+            ticketType=random.choice(['regular', 'student']),
+            sprintDay=random.random() < 0.3,
+            discountCode=random.choice([None, 'SYNTHETIC']),
+        )
+        new_image = registration.serialize()
+        records.append(
+            {
+                'eventID': f'synthetic-{index}',
+                'eventName': 'INSERT',
+                'eventSource': 'aws:dynamodb',
+                'eventSourceARN': event_source_arn,
+                'dynamodb': {
+                    'Keys': {'hashKey': new_image['hashKey'], 'rangeKey': new_image['rangeKey']},
+                    'NewImage': new_image,
+                    'SequenceNumber': str(index + 1),
+                    'StreamViewType': 'NEW_AND_OLD_IMAGES',
+                },
+            }
+        )
+
+    return records
+
+
+def replay_event_aggregate_stream(records: list, dry_run: bool = False) -> None:
+    """
+    Passes stream records to the event aggregates handler, exactly as Lambda would.
+
+    Args:
+        records (list): The stream records to replay.
+        dry_run (bool): If True, only log the counter deltas per event.
+    """
+    if dry_run:
+        records_per_event = {}
+        for record in records:
+            records_per_event.setdefault(record['dynamodb']['Keys']['hashKey']['S'], []).append(record)
+
+        event_aggregate_uc = EventAggregateUsecase()
+        for event_id, event_records in records_per_event.items():
+            delta = event_aggregate_uc.get_stream_records_delta(event_records)
+            logger.info(f'[{event_id}] {len(event_records)} records, delta: {json.dumps(delta, sort_keys=True)}')
+        return
+
+    response = handler({'Records': records}, None)
+    logger.info(f'Replayed {len(records)} stream records, batch item failures: {response["batchItemFailures"]}')
+
+
+if __name__ == '__main__':
+    if parsed_args.rebuild:
+        if not parsed_args.event_id:
+            args.error('--rebuild requires --event-id')
+
+        event_aggregate = EventAggregateUsecase().rebuild_event_aggregate(parsed_args.event_id)
+        logger.info(f'Rebuilt event aggregate: {event_aggregate}')
+    else:
+        stream_records = []
+        if parsed_args.records_file:
+            stream_records.extend(load_records(parsed_args.records_file))
+        if parsed_args.synthetic:
+            if not parsed_args.event_id:
+                args.error('--synthetic requires --event-id')
+
+            stream_records.extend(generate_synthetic_records(parsed_args.event_id, parsed_args.synthetic))
+
+        replay_event_aggregate_stream(stream_records, dry_run=parsed_args.dry_run)
@@ -4,7 +4,7 @@ from datetime import datetime
 from http import HTTPStatus
 from typing import Tuple, Union
 
-from boto3 import client as boto3_client
+from constants.common_constants import CommonConstants
 from model.certificates.certificate import CertificateIn, CertificateOut
 from model.events.events_constants import EventStatus
 from model.registrations.registration import RegistrationPatch
@@ -13,15 +13,20 @@ from repository.registrations_repository import RegistrationsRepository
 from starlette.responses import JSONResponse
 from usecase.file_s3_usecase import FileS3Usecase
 from utils.logger import logger
+from utils.registry import Registry
+from utils.utils import Utils
 
 
 class CertificateUsecase:
     def __init__(self):
-        self.__registrations_repository = RegistrationsRepository()
-        self.__events_repository = EventsRepository()
+        self.__registrations_repository = Registry.get_repository(RegistrationsRepository)
+        self.__events_repository = Registry.get_repository(EventsRepository)
         self.__file_s3_usecase = FileS3Usecase()
-        self.__sqs_client = boto3_client('sqs', region_name=os.getenv('REGION', 'ap-southeast-1'))
+        self.__sqs_client = Registry.get_boto3_client('sqs')
         self.__sqs_url = os.getenv('CERTIFICATE_QUEUE')
+        self.__group_shards = int(
+            os.getenv('CERTIFICATE_QUEUE_GROUP_SHARDS', CommonConstants.CERTIFICATE_QUEUE_GROUP_SHARDS)
+        )
 
     def generate_certificates(self, event_id: str, registration_id: str = None) -> Tuple[HTTPStatus, str]:
         """Generate certificates for an event
@@ -40,14 +45,17 @@ class CertificateUsecase:
         try:
             timestamp = datetime.utcnow().isoformat(timespec='seconds')
             payload = {'eventId': event_id}
-            message_group_id = f'sparcs-certificates-{event_id}'
             message_dedup_id = f'sparcs-certificates-{event_id}-{timestamp}'
 
             if registration_id:
                 payload['registrationId'] = registration_id
-                message_group_id += f'-{registration_id}'
                 message_dedup_id += f'-{registration_id}'
 
+            # The jobs of a registration stay in order, the other message groups are consumed in parallel
+            message_group_id = Utils.get_message_group_id(
+                prefix=f'sparcs-certificates-{event_id}', shard_key=registration_id, shard_count=self.__group_shards
+            )
+
             response = self.__sqs_client.send_message(
                 QueueUrl=self.__sqs_url,
                 MessageBody=json.dumps(payload),
@@ -1,9 +1,10 @@
 import random
 import string
 from http import HTTPStatus
-from typing import List, Union
+from typing import List, Tuple, Union
 
 from model.discount.discount import (
+    Discount,
     DiscountDBIn,
     DiscountIn,
     DiscountOrganization,
@@ -13,14 +14,15 @@ from repository.discount_repository import DiscountsRepository
 from repository.events_repository import EventsRepository
 from repository.registrations_repository import RegistrationsRepository
 from starlette.responses import JSONResponse
+from utils.registry import Registry
 from utils.utils import Utils
 
 
 class DiscountUsecase:
     def __init__(self):
-        self.__discounts_repository = DiscountsRepository()
-        self.__events_repository = EventsRepository()
-        self.__registrations_repository = RegistrationsRepository()
+        self.__discounts_repository = Registry.get_repository(DiscountsRepository)
+        self.__events_repository = Registry.get_repository(EventsRepository)
+        self.__registrations_repository = Registry.get_repository(RegistrationsRepository)
 
     def get_discount(self, event_id: str, entry_id: str) -> DiscountOut:
         """Get a discount.
@@ -76,22 +78,26 @@ class DiscountUsecase:
         if status != HTTPStatus.OK:
             return JSONResponse(status_code=status, content={'message': message})
 
+        registration_ids = [discount.registrationId for discount in discounts if discount.registrationId]
+        registration_map = {}
+        if registration_ids:
+            status, registrations, message = self.__registrations_repository.batch_get_registrations(
+                event_id=event_id, registration_ids=registration_ids
+            )
+            if status != HTTPStatus.OK:
+                return JSONResponse(status_code=status, content={'message': message})
+
+            registration_map = {registration.registrationId: registration for registration in registrations}
+
         discount_map = {}
         for discount in discounts:
             discount_data = self.__convert_data_entry_to_dict(discount)
             discount_out = DiscountOut(**discount_data)
 
-            if discount.registrationId:
-                (
-                    _,
-                    registration_entry,
-                    _,
-                ) = self.__registrations_repository.query_registration_with_registration_id(
-                    event_id=event_id, registration_id=discount.registrationId
-                )
-                if registration_entry:
-                    registration_data = self.__convert_data_entry_to_dict(registration_entry)
-                    discount_out.registration = registration_data
+            registration_entry = registration_map.get(discount.registrationId)
+            if registration_entry:
+                registration_data = self.__convert_data_entry_to_dict(registration_entry)
+                discount_out.registration = registration_data
 
             discount_out_list = discount_map.get(discount_out.organizationId) or []
             discount_out_list.append(discount_out)
@@ -105,8 +111,10 @@ class DiscountUsecase:
             for organization_id, discount_out_list in discount_map.items()
         ]
 
-    def claim_discount(self, event_id: str, entry_id: str, registration_id: str):
-        """Claim a discount.
+    def get_claimable_discount(
+        self, event_id: str, entry_id: str, registration_id: str
+    ) -> Union[Discount, JSONResponse]:
+        """Get a discount and check that it can still be claimed, without claiming it.
 
         :param event_id: The event ID.
         :type event_id: str
@@ -117,8 +125,8 @@ class DiscountUsecase:
         :param registration_id: The registration ID.
         :type registration_id: str
 
-        :return: DiscountOut object or JSONResponse in case of error.
-        :rtype: Union[DiscountOut, JSONResponse]
+        :return: Discount object or JSONResponse in case of error.
+        :rtype: Union[Discount, JSONResponse]
 
         """
         status, discount_entry, message = self.__discounts_repository.query_discount_with_discount_id(
@@ -136,9 +144,6 @@ class DiscountUsecase:
                 content={'message': 'Discount already claimed'},
             )
 
-        discount_data = self.__convert_data_entry_to_dict(discount_entry)
-
-        # reusable discount code
         if discount_entry.isReusable:
             if (
                 discount_entry.maxDiscountUses is not None
@@ -150,6 +155,40 @@ class DiscountUsecase:
                     content={'message': 'Discount has no remaining uses'},
                 )
 
+        elif discount_entry.claimed:
+            return JSONResponse(
+                status_code=HTTPStatus.BAD_REQUEST,
+                content={'message': 'Discount already claimed'},
+            )
+
+        return discount_entry
+
+    def claim_discount(self, event_id: str, entry_id: str, registration_id: str):
+        """Claim a discount.
+
+        :param event_id: The event ID.
+        :type event_id: str
+
+        :param entry_id: The entry ID.
+        :type entry_id: str
+
+        :param registration_id: The registration ID.
+        :type registration_id: str
+
+        :return: DiscountOut object or JSONResponse in case of error.
+        :rtype: Union[DiscountOut, JSONResponse]
+
+        """
+        discount_entry = self.get_claimable_discount(
+            event_id=event_id, entry_id=entry_id, registration_id=registration_id
+        )
+        if isinstance(discount_entry, JSONResponse):
+            return discount_entry
+
+        discount_data = self.__convert_data_entry_to_dict(discount_entry)
+
+        # reusable discount code
+        if discount_entry.isReusable:
             status, updated_discount, message = self.__discounts_repository.append_claim_discount(
                 discount_entry=discount_entry, append_count=1
             )
@@ -168,12 +207,6 @@ class DiscountUsecase:
 
         # for single-use discount code
         else:
-            if discount_entry.claimed:
-                return JSONResponse(
-                    status_code=HTTPStatus.BAD_REQUEST,
-                    content={'message': 'Discount already claimed'},
-                )
-
             discount_data.update(claimed=True)
             discount_data.update(registrationId=registration_id)
 
@@ -227,26 +260,80 @@ class DiscountUsecase:
             discount_list.append(discount_out)
 
         else:
-            for _ in range(discount_in.quantity):
-                discount_db_in = DiscountDBIn(
+            status, discount_codes, message = self.__generate_unique_discount_codes(
+                event_id=discount_in.eventId, quantity=discount_in.quantity or 0
+            )
+            if status != HTTPStatus.OK:
+                return JSONResponse(status_code=status, content={'message': message})
+
+            discounts_db_in = [
+                DiscountDBIn(
                     organizationId=organization_id,
                     eventId=discount_in.eventId,
                     claimed=False,
                     registrationId=None,
                     discountPercentage=discount_in.discountPercentage,
-                    entryId=self.__generate_discount_code(),
+                    entryId=discount_code,
                     isReusable=False,
                 )
-                status, discount, message = self.__discounts_repository.store_discount(discount_in=discount_db_in)
-                if status != HTTPStatus.OK:
-                    return JSONResponse(status_code=status, content={'message': message})
+                for discount_code in discount_codes
+            ]
+            status, discounts, message = self.__discounts_repository.store_discounts(discounts_in=discounts_db_in)
+            if status != HTTPStatus.OK:
+                return JSONResponse(status_code=status, content={'message': message})
 
+            for discount in discounts:
                 discount_data = self.__convert_data_entry_to_dict(discount)
                 discount_out = DiscountOut(**discount_data)
                 discount_list.append(discount_out)
 
         return discount_list
 
+    def __generate_unique_discount_codes(
+        self, event_id: str, quantity: int, max_attempts: int = 5
+    ) -> Tuple[HTTPStatus, List[str], str]:
+        """Generate discount codes that are unique within the batch and not yet used in the event.
+
+        Codes are deduplicated in memory, then checked against the stored discounts in one batch get.
+        Codes that are already taken are regenerated and only the new codes are checked again.
+
+        :param event_id: The event ID.
+        :type event_id: str
+
+        :param quantity: The number of discount codes to generate.
+        :type quantity: int
+
+        :param max_attempts: The number of times to regenerate taken codes (default is 5).
+        :type max_attempts: int
+
+        :return: The HTTP status, the generated discount codes or None, and a message. No codes are generated for
+            a quantity of 0.
+        :rtype: Tuple[HTTPStatus, List[str], str]
+
+        """
+        if quantity <= 0:
+            return HTTPStatus.OK, [], None
+
+        discount_codes = set()
+        for _ in range(max_attempts):
+            new_codes = set()
+            while len(discount_codes) + len(new_codes) < quantity:
+                discount_code = self.__generate_discount_code()
+                if discount_code not in discount_codes:
+                    new_codes.add(discount_code)
+
+            status, existing_codes, message = self.__discounts_repository.query_existing_discount_codes(
+                event_id=event_id, entry_ids=list(new_codes)
+            )
+            if status != HTTPStatus.OK:
+                return status, None, message
+
+            discount_codes.update(new_codes - existing_codes)
+            if len(discount_codes) == quantity:
+                return HTTPStatus.OK, list(discount_codes), None
+
+        return HTTPStatus.INTERNAL_SERVER_ERROR, None, 'Failed to generate unique discount codes'
+
     def __generate_discount_code(self, length=8):
         """Generate a discount code.
 
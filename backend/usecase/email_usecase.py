@@ -1,12 +1,12 @@
 import json
 import os
+import time
 from datetime import datetime, timezone
 from http import HTTPStatus
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import ulid
-from boto3 import client as boto3_client
-from constants.common_constants import EmailType, SpecialEmails, SpecialSenders
+from constants.common_constants import CommonConstants, EmailType, SpecialEmails, SpecialSenders
 from model.email.email import EmailIn
 from model.events.event import Event
 from model.preregistrations.preregistration import PreRegistration, PreRegistrationPatch
@@ -14,13 +14,16 @@ from model.preregistrations.preregistrations_constants import AcceptanceStatus
 from model.registrations.registration import Registration
 from repository.preregistrations_repository import PreRegistrationsRepository
 from utils.logger import logger
+from utils.registry import Registry
+from utils.utils import Utils
 
 
 class EmailUsecase:
     def __init__(self) -> None:
-        self.__sqs_client = boto3_client('sqs', region_name=os.getenv('REGION', 'ap-southeast-1'))
+        self.__sqs_client = Registry.get_boto3_client('sqs')
         self.__sqs_url = os.getenv('EMAIL_QUEUE')
-        self.__preregistration_repository = PreRegistrationsRepository()
+        self.__group_shards = int(os.getenv('EMAIL_QUEUE_GROUP_SHARDS', CommonConstants.EMAIL_QUEUE_GROUP_SHARDS))
+        self.__preregistration_repository = Registry.get_repository(PreRegistrationsRepository)
         self.__sender_name_map = {
             SpecialEmails.DURIAN_PY.value: SpecialSenders.DURIAN_PY.value,
             SpecialEmails.AWSUG_DAVAO.value: SpecialSenders.AWSUG_DAVAO.value,
@@ -28,39 +31,174 @@ class EmailUsecase:
         }
         self.__event_email = None
 
-    def __send_email_handler(self, email_in_list: List[EmailIn], event: Event) -> Tuple[HTTPStatus, str]:
-        """Send an email to the queue
+    def __send_email_handler(self, email_in_list: List[EmailIn], event: Event) -> List[dict]:
+        """Send emails to the queue, packed into as few messages and SendMessageBatch calls as the SQS limits allow
 
         :param email_in_list: The email list to be sent
-        :type Event: EmailIn
+        :type email_in_list: List[EmailIn]
 
         :param event: The event to be sent
         :type event: Event
 
-        :return: The status and message
-        :rtype: Tuple[HTTPStatus, str]
+        :return: The result of each message, with the indexes of the emails it holds and its message ID or error
+        :rtype: List[dict]
 
         """
 
-        # Check if event has konfhub and exclude it from the Email Service
-        if self.__event_email and event.konfhubId and event.konfhubApiKey:
-            logger.info(f'Skipping sending email to {self.__event_email} because it is a special email')
-            return
-
         timestamp = datetime.now(timezone.utc).isoformat(timespec='seconds')
-        payload = [email_in.dict() for email_in in email_in_list]
         event_id = email_in_list[0].eventId
-        message_id = ulid.ulid()
 
-        response = self.__sqs_client.send_message(
-            QueueUrl=self.__sqs_url,
-            MessageBody=json.dumps(payload),
-            MessageDeduplicationId=f'durianpy-event-{event_id}-{timestamp}-{message_id}',
-            MessageGroupId=f'durianpy-event-{event_id}',
-        )
-        message_id = response.get('MessageId')
-        message = f'Queue message success: {message_id}'
-        logger.info(message)
+        # Only the emails of the same recipients must stay in order, the other message groups are consumed in parallel
+        payloads_per_group = {}
+        indexes_per_group = {}
+        for index, email_in in enumerate(email_in_list):
+            message_group_id = Utils.get_message_group_id(
+                prefix=f'durianpy-event-{event_id}',
+                shard_key=','.join(email_in.to or []),
+                shard_count=self.__group_shards,
+            )
+            payloads_per_group.setdefault(message_group_id, []).append(json.dumps(email_in.dict()))
+            indexes_per_group.setdefault(message_group_id, []).append(index)
+
+        entries = []
+        chunk_results = []
+        for message_group_id, payloads in payloads_per_group.items():
+            # The chunks keep the order of the payloads, so the email indexes are sliced the same way
+            remaining_indexes = indexes_per_group[message_group_id]
+            for chunk in self.__chunk_email_payloads(payloads):
+                email_indexes, remaining_indexes = remaining_indexes[: len(chunk)], remaining_indexes[len(chunk) :]
+                chunk_result = {
+                    'chunk': len(chunk_results),
+                    'emails': len(chunk),
+                    'emailIndexes': email_indexes,
+                    'messageId': None,
+                    'error': None,
+                }
+                chunk_results.append(chunk_result)
+                message_body = f'[{", ".join(chunk)}]'
+                if len(message_body.encode()) > CommonConstants.SQS_MAX_MESSAGE_SIZE_BYTES:
+                    chunk_result['error'] = 'Email is larger than the maximum SQS message size'
+                    continue
+
+                entries.append(
+                    {
+                        'Id': str(chunk_result['chunk']),
+                        'MessageBody': message_body,
+                        'MessageDeduplicationId': f'durianpy-event-{event_id}-{timestamp}-{ulid.ulid()}',
+                        'MessageGroupId': message_group_id,
+                    }
+                )
+
+        for batch in self.__batch_entries(entries):
+            for entry_id, result in self.__send_message_batch(batch).items():
+                chunk_results[int(entry_id)].update(result)
+
+        for chunk_result in chunk_results:
+            if chunk_result['error']:
+                logger.error(f'[{event_id}] Email chunk {chunk_result["chunk"]} failed: {chunk_result["error"]}')
+            else:
+                logger.info(f'[{event_id}] Email chunk {chunk_result["chunk"]} queued: {chunk_result["messageId"]}')
+
+        return chunk_results
+
+    @staticmethod
+    def __chunk_email_payloads(payloads: List[str]) -> List[List[str]]:
+        """Group serialized emails into JSON list bodies that fit in one SQS message
+
+        :param payloads: The serialized emails
+        :type payloads: List[str]
+
+        :return: The emails of each message, an email too large for any message gets a chunk of its own
+        :rtype: List[List[str]]
+
+        """
+        chunks = []
+        chunk = []
+        chunk_size = 2  # The enclosing brackets
+        for payload in payloads:
+            payload_size = len(payload.encode()) + (2 if chunk else 0)  # The separating comma and space
+            if chunk and chunk_size + payload_size > CommonConstants.SQS_MAX_MESSAGE_SIZE_BYTES:
+                chunks.append(chunk)
+                chunk, chunk_size = [], 2
+                payload_size = len(payload.encode())
+
+            chunk.append(payload)
+            chunk_size += payload_size
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+    @staticmethod
+    def __batch_entries(entries: List[dict]) -> List[List[dict]]:
+        """Group messages into SendMessageBatch calls under the entry count and total size limits
+
+        :param entries: The SendMessageBatch entries
+        :type entries: List[dict]
+
+        :return: The entries of each call
+        :rtype: List[List[dict]]
+
+        """
+        batches = []
+        batch = []
+        batch_size = 0
+        for entry in entries:
+            entry_size = len(entry['MessageBody'].encode())
+            is_full = len(batch) == CommonConstants.SQS_MAX_BATCH_ENTRIES
+            if batch and (is_full or batch_size + entry_size > CommonConstants.SQS_MAX_BATCH_SIZE_BYTES):
+                batches.append(batch)
+                batch, batch_size = [], 0
+
+            batch.append(entry)
+            batch_size += entry_size
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def __send_message_batch(self, entries: List[dict]) -> Dict[str, dict]:
+        """Send a SendMessageBatch call, retrying only the entries that failed
+
+        Entries that failed because of the request itself (SenderFault) are not retried. The deduplication IDs stay
+        the same across attempts, so a retried message that did reach the queue is not delivered twice.
+
+        :param entries: The SendMessageBatch entries
+        :type entries: List[dict]
+
+        :return: The message ID or error of each entry, keyed by entry ID
+        :rtype: Dict[str, dict]
+
+        """
+        results = {}
+        pending_entries = entries
+        for attempt in range(CommonConstants.SQS_SEND_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(CommonConstants.SQS_SEND_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1))
+
+            try:
+                response = self.__sqs_client.send_message_batch(QueueUrl=self.__sqs_url, Entries=pending_entries)
+            except Exception as e:
+                for entry in pending_entries:
+                    results[entry['Id']] = {'messageId': None, 'error': str(e)}
+                continue
+
+            for successful in response.get('Successful', []):
+                results[successful['Id']] = {'messageId': successful['MessageId'], 'error': None}
+
+            retry_entry_ids = set()
+            for failed in response.get('Failed', []):
+                results[failed['Id']] = {'messageId': None, 'error': f'{failed["Code"]}: {failed.get("Message")}'}
+                if not failed.get('SenderFault'):
+                    retry_entry_ids.add(failed['Id'])
+
+            pending_entries = [entry for entry in pending_entries if entry['Id'] in retry_entry_ids]
+            if not pending_entries:
+                break
+
+        return results
 
     def send_batch_email(self, email_in_list: List[EmailIn], event: Event) -> Tuple[HTTPStatus, str]:
         """Send an email to the queue
@@ -75,17 +213,62 @@ class EmailUsecase:
         :rtype: Tuple[HTTPStatus, str]
 
         """
-        message = None
+        status, message, _ = self.__queue_batch_email(email_in_list=email_in_list, event=event)
+        return status, message
+
+    def __queue_batch_email(self, email_in_list: List[EmailIn], event: Event) -> Tuple[HTTPStatus, str, List[int]]:
+        """Send an email list to the queue, keeping track of the emails that were queued
+
+        :param email_in_list: The email list to be sent
+        :type email_in_list: List[EmailIn]
+
+        :param event: The event to be sent
+        :type event: Event
+
+        :return: The status, message and the indexes in email_in_list of the handled emails, i.e. queued or skipped
+        :rtype: Tuple[HTTPStatus, str, List[int]]
+
+        """
+        if not email_in_list:
+            return HTTPStatus.OK, 'No emails to send', []
+
+        # Check if event has konfhub and exclude it from the Email Service, the emails are handled without queueing
+        if self.__event_email and event.konfhubId and event.konfhubApiKey:
+            message = f'Skipped {len(email_in_list)} emails to {self.__event_email} because it is a special email'
+            logger.info(message)
+            return HTTPStatus.OK, message, list(range(len(email_in_list)))
+
         try:
-            self.__send_email_handler(email_in_list=email_in_list, event=event)
+            chunk_results = self.__send_email_handler(email_in_list=email_in_list, event=event)
 
         except Exception as e:
             message = f'Failed to send email: {str(e)}'
             logger.error(message)
-            return HTTPStatus.INTERNAL_SERVER_ERROR, message
+            return HTTPStatus.INTERNAL_SERVER_ERROR, message, []
 
-        else:
-            return HTTPStatus.OK, message
+        if not chunk_results:
+            message = f'Failed to send email: no message was built for {len(email_in_list)} emails'
+            logger.error(message)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, message, []
+
+        failed_chunks = [chunk_result for chunk_result in chunk_results if chunk_result['error']]
+        queued_indexes = sorted(
+            index
+            for chunk_result in chunk_results
+            if not chunk_result['error']
+            for index in chunk_result['emailIndexes']
+        )
+        failed_emails = sum(chunk_result['emails'] for chunk_result in failed_chunks)
+        message = (
+            f'Queued {len(email_in_list) - failed_emails} of {len(email_in_list)} emails '
+            f'in {len(chunk_results) - len(failed_chunks)} of {len(chunk_results)} messages'
+        )
+        if failed_chunks:
+            logger.error(message)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, message, queued_indexes
+
+        logger.info(message)
+        return HTTPStatus.OK, message, queued_indexes
 
     def send_email(self, email_in: EmailIn, event: Event) -> Tuple[HTTPStatus, str]:
         """Send an email to the queue
@@ -191,8 +374,12 @@ class EmailUsecase:
         :param event: The event to be sent
         :type event: Event
 
+        :return: The status and message
+        :rtype: Tuple[HTTPStatus, str]
+
         """
         emails = []
+        email_preregistrations = []
         self.__event_email = event.email
         for preregistration in preregistrations:
             if preregistration.acceptanceEmailSent:
@@ -209,12 +396,20 @@ class EmailUsecase:
                 logger.info(f'Rejection email sent to {preregistration.email} for event {event.eventId}')
 
             emails.append(email)
-
-            self.__preregistration_repository.update_preregistration(
-                preregistration_entry=preregistration, preregistration_in=PreRegistrationPatch(acceptanceEmailSent=True)
+            email_preregistrations.append(preregistration)
+
+        # Only the preregistrations whose emails were queued or skipped are marked, the others are sent again next time
+        status, message, queued_indexes = self.__queue_batch_email(email_in_list=emails, event=event)
+        queued_preregistrations = [email_preregistrations[index] for index in queued_indexes]
+        if queued_preregistrations:
+            update_status, _, update_message = self.__preregistration_repository.update_preregistrations(
+                preregistration_entries=queued_preregistrations,
+                preregistration_in=PreRegistrationPatch(acceptanceEmailSent=True),
             )
+            if update_status != HTTPStatus.OK:
+                return update_status, f'{message}. {update_message}'
 
-        return self.send_batch_email(email_in_list=emails, event=event)
+        return status, message
 
     def send_preregistration_creation_email(
         self, preregistration: PreRegistration, event: Event
@@ -1,5 +1,5 @@
 from http import HTTPStatus
-from typing import List, Union
+from typing import Dict, List, Set, Union
 
 from model.evaluations.evaluation import (
     EvaluationListIn,
@@ -12,13 +12,14 @@ from repository.evaluations_repository import EvaluationRepository
 from repository.events_repository import EventsRepository
 from repository.registrations_repository import RegistrationsRepository
 from starlette.responses import JSONResponse
+from utils.registry import Registry
 
 
 class EvaluationUsecase:
     def __init__(self):
-        self.__evaluations_repository = EvaluationRepository()
-        self.__registrations_repository = RegistrationsRepository()
-        self.__events_repository = EventsRepository()
+        self.__evaluations_repository = Registry.get_repository(EvaluationRepository)
+        self.__registrations_repository = Registry.get_repository(RegistrationsRepository)
+        self.__events_repository = Registry.get_repository(EventsRepository)
 
     def create_evaluation(self, evaluation_list_in: EvaluationListIn) -> Union[JSONResponse, List[EvaluationOut]]:
         """Create evaluations for a registration
@@ -172,25 +173,21 @@ class EvaluationUsecase:
             return JSONResponse(status_code=status, content={'message': message})
 
         evaluation_out_dict = {}
+        event_registration_ids = {}
         for evaluation in evaluations:
             registration_id = evaluation.registrationId
             evealuation_dict = self.__convert_data_entry_to_dict(evaluation)
             evaluation_out = EvaluationOut(**evealuation_dict)
 
             evaluation_out_dict.setdefault(registration_id, []).append(evaluation_out)
+            event_registration_ids.setdefault(evaluation.eventId, set()).add(registration_id)
+
+        registration_map = self.__get_registration_previews(event_registration_ids)
 
         evaluations_return = []
         for registration_id, evaluation_out_list in evaluation_out_dict.items():
             evaluations_return_entry = EvaluationListOut(evaluationList=evaluation_out_list)
-
-            _, registration, _ = self.__registrations_repository.query_registration_with_registration_id(
-                event_id=event_id, registration_id=registration_id
-            )
-            if registration:
-                registration_data = self.__convert_data_entry_to_dict(registration)
-                registration_out = RegistrationPreviewOut(**registration_data)
-                evaluations_return_entry.registration = registration_out
-
+            evaluations_return_entry.registration = registration_map.get(registration_id)
             evaluations_return.append(evaluations_return_entry)
 
         return evaluations_return
@@ -228,6 +225,33 @@ class EvaluationUsecase:
 
         return evaluation_out_list
 
+    def __get_registration_previews(
+        self, event_registration_ids: Dict[str, Set[str]]
+    ) -> Dict[str, RegistrationPreviewOut]:
+        """Get the registration previews of the evaluations in bulk
+
+        :param event_registration_ids: The registration IDs to get, grouped by event ID
+        :type event_registration_ids: Dict[str, Set[str]]
+
+        :return: The registration previews keyed by registration ID
+        :rtype: Dict[str, RegistrationPreviewOut]
+
+        """
+        preview_fields = list(RegistrationPreviewOut.__fields__.keys())
+        registration_map = {}
+        for event_id, registration_ids in event_registration_ids.items():
+            status, registrations, _ = self.__registrations_repository.batch_get_registrations(
+                event_id=event_id, registration_ids=list(registration_ids), attributes_to_get=preview_fields
+            )
+            if status != HTTPStatus.OK:
+                continue
+
+            for registration in registrations:
+                registration_data = self.__convert_data_entry_to_dict(registration)
+                registration_map[registration.registrationId] = RegistrationPreviewOut(**registration_data)
+
+        return registration_map
+
     @staticmethod
     def __convert_data_entry_to_dict(data_entry):
         """Convert a data entry to a dictionary
@@ -0,0 +1,195 @@
+from http import HTTPStatus
+from itertools import groupby
+from typing import Dict, List, Union
+
+from constants.common_constants import EntryStatus
+from model.event_aggregates.event_aggregate import EventAggregateOut
+from model.preregistrations.preregistration import PreRegistration
+from model.preregistrations.preregistrations_constants import AcceptanceStatus
+from model.registrations.registration import Registration
+from repository.event_aggregates_repository import EventAggregatesRepository
+from repository.events_repository import EventsRepository
+from repository.preregistrations_repository import PreRegistrationsRepository
+from repository.registrations_repository import RegistrationsRepository
+from starlette.responses import JSONResponse
+from utils.logger import logger
+from utils.registry import Registry
+
+
+class EventAggregateUsecase:
+    def __init__(self):
+        self.__event_aggregates_repository = Registry.get_repository(EventAggregatesRepository)
+        self.__events_repository = Registry.get_repository(EventsRepository)
+        self.__registrations_repository = Registry.get_repository(RegistrationsRepository)
+        self.__preregistrations_repository = Registry.get_repository(PreRegistrationsRepository)
+
+    def get_event_aggregate(self, event_id: str) -> Union[JSONResponse, EventAggregateOut]:
+        """Get the registration breakdowns of an event.
+
+        :param event_id: The ID of the event.
+        :type event_id: str
+
+        :return: The event aggregate or an error message.
+        :rtype: Union[JSONResponse, EventAggregateOut]
+
+        """
+        status, event_aggregate, message = self.__event_aggregates_repository.query_event_aggregate(event_id)
+        if status == HTTPStatus.NOT_FOUND:
+            # The aggregate is only created on the first registration of the event
+            status, _, message = self.__events_repository.query_events(event_id)
+            if status != HTTPStatus.OK:
+                return JSONResponse(status_code=status, content={'message': message})
+
+            return EventAggregateOut(eventId=event_id)
+
+        if status != HTTPStatus.OK:
+            return JSONResponse(status_code=status, content={'message': message})
+
+        return EventAggregateOut(**event_aggregate.to_simple_dict())
+
+    def process_stream_records(self, records: List[dict]) -> List[dict]:
+        """Apply registration and pre-registration stream records to the event aggregates, in stream order.
+
+        Consecutive records of the same event are summed up into a single update. The counters are incremented with
+        ADD, so the records are applied in order and processing stops at the first failed update: Lambda redelivers
+        the shard from that record, and nothing after it has been applied yet.
+
+        :param records: The DynamoDB stream records.
+        :type records: List[dict]
+
+        :return: The batch item failures, Lambda resumes the shard from the earliest failed record.
+        :rtype: List[dict]
+
+        """
+        for event_id, event_records in groupby(records, key=lambda record: record['dynamodb']['Keys']['hashKey']['S']):
+            event_records = list(event_records)
+            delta = self.get_stream_records_delta(event_records)
+            if not delta:
+                continue
+
+            status, _, message = self.__event_aggregates_repository.apply_event_aggregate_delta(
+                event_id=event_id, delta=delta
+            )
+            if status != HTTPStatus.OK:
+                logger.error(f'Failed to apply {len(event_records)} stream records to event {event_id}: {message}')
+                return [{'itemIdentifier': event_records[0]['dynamodb']['SequenceNumber']}]
+
+        return []
+
+    def get_stream_records_delta(self, records: List[dict]) -> dict:
+        """Compute how much a list of stream records changes the event aggregate counters.
+
+        An item counts towards the aggregate while it is active, so every record adds the counts of its new image and
+        subtracts the counts of its old image. Soft deletes, restores and field changes are handled the same way.
+
+        :param records: The DynamoDB stream records of one event.
+        :type records: List[dict]
+
+        :return: The counter deltas, empty if the records do not change any counter.
+        :rtype: dict
+
+        """
+        delta = {}
+        for record in records:
+            table_name = record['eventSourceARN'].split(':table/', 1)[-1].split('/', 1)[0]
+            if table_name == Registration.Meta.table_name:
+                model, get_counts = Registration, self.__get_registration_counts
+            elif table_name == PreRegistration.Meta.table_name:
+                model, get_counts = PreRegistration, self.__get_preregistration_counts
+            else:
+                logger.warning(f'Skipping stream record {record.get("eventID")} from unknown table {table_name}')
+                continue
+
+            stream_data = record['dynamodb']
+            if 'NewImage' in stream_data:
+                self.__add_counts(delta, get_counts(model.from_raw_data(stream_data['NewImage'])), 1)
+            if 'OldImage' in stream_data:
+                self.__add_counts(delta, get_counts(model.from_raw_data(stream_data['OldImage'])), -1)
+
+        return self.__prune_counts(delta)
+
+    def rebuild_event_aggregate(self, event_id: str) -> Union[JSONResponse, EventAggregateOut]:
+        """Recompute the aggregate of an event from its registrations and pre-registrations.
+
+        Stream records are delivered at least once, this reconciles an aggregate that drifted after a retried batch.
+
+        :param event_id: The ID of the event.
+        :type event_id: str
+
+        :return: The rebuilt event aggregate or an error message.
+        :rtype: Union[JSONResponse, EventAggregateOut]
+
+        """
+        status, registrations, message = self.__registrations_repository.query_registrations(event_id=event_id)
+        if status not in (HTTPStatus.OK, HTTPStatus.NOT_FOUND):
+            return JSONResponse(status_code=status, content={'message': message})
+
+        status, preregistrations, message = self.__preregistrations_repository.query_preregistrations(event_id=event_id)
+        if status not in (HTTPStatus.OK, HTTPStatus.NOT_FOUND):
+            return JSONResponse(status_code=status, content={'message': message})
+
+        counts = {}
+        for registration in registrations or []:
+            self.__add_counts(counts, self.__get_registration_counts(registration), 1)
+        for preregistration in preregistrations or []:
+            self.__add_counts(counts, self.__get_preregistration_counts(preregistration), 1)
+
+        status, event_aggregate, message = self.__event_aggregates_repository.store_event_aggregate(
+            event_id=event_id, counts=self.__prune_counts(counts)
+        )
+        if status != HTTPStatus.OK:
+            return JSONResponse(status_code=status, content={'message': message})
+
+        return EventAggregateOut(**event_aggregate.to_simple_dict())
+
+    @staticmethod
+    def __get_registration_counts(registration: Registration) -> dict:
+        if registration.entryStatus != EntryStatus.ACTIVE.value:
+            return {}
+
+        counts = {
+            'registrationCount': 1,
+            'sprintDayRegistrationCount': 1 if registration.sprintDay else 0,
+            'discountUsageCount': 1 if registration.discountCode else 0,
+        }
+        breakdown_keys = {
+            'ticketTypeCounts': registration.ticketTypeId or registration.ticketType,
+            'shirtSizeCounts': registration.shirtSize,
+            'shirtTypeCounts': registration.shirtType,
+            'careerStatusCounts': registration.careerStatus,
+        }
+        for attribute_name, key in breakdown_keys.items():
+            if key:
+                counts[attribute_name] = {key: 1}
+
+        return counts
+
+    @staticmethod
+    def __get_preregistration_counts(preregistration: PreRegistration) -> dict:
+        if preregistration.entryStatus != EntryStatus.ACTIVE.value:
+            return {}
+
+        acceptance_status = preregistration.acceptanceStatus or AcceptanceStatus.PENDING.value
+        return {'preregistrationCount': 1, 'acceptanceStatusCounts': {acceptance_status: 1}}
+
+    @staticmethod
+    def __add_counts(total: dict, counts: dict, sign: int) -> None:
+        for attribute_name, value in counts.items():
+            if isinstance(value, dict):
+                breakdown = total.setdefault(attribute_name, {})
+                for key, count in value.items():
+                    breakdown[key] = breakdown.get(key, 0) + sign * count
+            else:
+                total[attribute_name] = total.get(attribute_name, 0) + sign * value
+
+    @staticmethod
+    def __prune_counts(counts: dict) -> Dict[str, Union[int, Dict[str, int]]]:
+        pruned = {}
+        for attribute_name, value in counts.items():
+            if isinstance(value, dict):
+                value = {key: count for key, count in value.items() if count}
+
+            if value:
+                pruned[attribute_name] = value
+
+        return pruned
@@ -6,8 +6,9 @@ from typing import List, Union
 from urllib.parse import unquote_plus
 
 from constants.common_constants import CommonConstants
-from model.events.event import EventAdminOut, EventIn, EventOut
+from model.events.event import EventAdminOut, EventIn, EventOut, EventStatsOut
 from model.events.events_constants import EventStatus
+from model.preregistrations.preregistrations_constants import AcceptanceStatus
 from model.ticket_types.ticket_types import TicketTypeOut
 from repository.events_repository import EventsRepository
 from repository.faqs_repository import FAQsRepository
@@ -17,18 +18,19 @@ from repository.ticket_type_repository import TicketTypeRepository
 from starlette.responses import JSONResponse
 from usecase.email_usecase import EmailUsecase
 from usecase.file_s3_usecase import FileS3Usecase
+from utils.registry import Registry
 from utils.utils import Utils
 
 
 class EventUsecase:
     def __init__(self):
-        self.__events_repository = EventsRepository()
+        self.__events_repository = Registry.get_repository(EventsRepository)
         self.__email_usecase = EmailUsecase()
         self.__file_s3_usecase = FileS3Usecase()
-        self.__registration_repository = RegistrationsRepository()
-        self.__preregistration_repository = PreRegistrationsRepository()
-        self.__faqs_repository = FAQsRepository()
-        self.__ticket_type_repository = TicketTypeRepository()
+        self.__registration_repository = Registry.get_repository(RegistrationsRepository)
+        self.__preregistration_repository = Registry.get_repository(PreRegistrationsRepository)
+        self.__faqs_repository = Registry.get_repository(FAQsRepository)
+        self.__ticket_type_repository = Registry.get_repository(TicketTypeRepository)
 
     def create_event(self, event_in: EventIn) -> Union[JSONResponse, EventOut]:
         """Create a new event
@@ -88,7 +90,7 @@ class EventUsecase:
         :rtype: Union[JSONResponse, EventOut]
 
         """
-        status, event, message = self.__events_repository.query_events(event_id)
+        status, event, message = self.__events_repository.query_events(event_id, use_cache=False)
         if status != HTTPStatus.OK:
             return JSONResponse(status_code=status, content={'message': message})
 
@@ -96,10 +98,11 @@ class EventUsecase:
         original_status = original_event.status
 
         if event_in.maximumSprintDaySlots:
-            status, registrations, _ = self.__registration_repository.query_registrations(event_id)
-            if registrations not in (None, []):
-                eventSprintCount = len([reg for reg in registrations if reg.sprintDay])
-                event_in.sprintDayRegistrationCount = eventSprintCount
+            status, sprint_day_count, _ = self.__registration_repository.count_registrations(
+                event_id=event_id, sprint_day=True
+            )
+            if status == HTTPStatus.OK:
+                event_in.sprintDayRegistrationCount = sprint_day_count
 
         status, update_event, message = self.__events_repository.update_event(event_entry=event, event_in=event_in)
         if status != HTTPStatus.OK:
@@ -203,6 +206,50 @@ class EventUsecase:
 
         return self.collect_pre_signed_url(event_out)
 
+    def get_event_stats(self, event_id: str) -> Union[JSONResponse, EventStatsOut]:
+        """Get the registration and pre-registration counts of an event
+
+        :param event_id: The ID of the event.
+        :type event_id: str
+
+        :return: The event stats or an error message.
+        :rtype: Union[JSONResponse, EventStatsOut]
+
+        """
+        status, _, message = self.__events_repository.query_events(event_id)
+        if status != HTTPStatus.OK:
+            return JSONResponse(status_code=status, content={'message': message})
+
+        status, registration_count, message = self.__registration_repository.count_registrations(event_id=event_id)
+        if status != HTTPStatus.OK:
+            return JSONResponse(status_code=status, content={'message': message})
+
+        status, sprint_day_count, message = self.__registration_repository.count_registrations(
+            event_id=event_id, sprint_day=True
+        )
+        if status != HTTPStatus.OK:
+            return JSONResponse(status_code=status, content={'message': message})
+
+        status, preregistration_count, message = self.__preregistration_repository.count_preregistrations(
+            event_id=event_id
+        )
+        if status != HTTPStatus.OK:
+            return JSONResponse(status_code=status, content={'message': message})
+
+        status, accepted_count, message = self.__preregistration_repository.count_preregistrations(
+            event_id=event_id, acceptance_status=AcceptanceStatus.ACCEPTED
+        )
+        if status != HTTPStatus.OK:
+            return JSONResponse(status_code=status, content={'message': message})
+
+        return EventStatsOut(
+            eventId=event_id,
+            registrationCount=registration_count,
+            sprintDayRegistrationCount=sprint_day_count,
+            preregistrationCount=preregistration_count,
+            acceptedPreregistrationCount=accepted_count,
+        )
+
     def get_events(self, admin_id: str = None) -> Union[JSONResponse, List[EventOut]]:
         """Get all events or all events for a specific admin
 
@@ -237,7 +284,7 @@ class EventUsecase:
         :rtype: Union[None, JSONResponse]
 
         """
-        status, event, message = self.__events_repository.query_events(event_id)
+        status, event, message = self.__events_repository.query_events(event_id, use_cache=False)
         if status != HTTPStatus.OK:
             return JSONResponse(status_code=status, content={'message': message})
 
@@ -266,7 +313,7 @@ class EventUsecase:
         decoded_object_key = unquote_plus(object_key)
         event_id, upload_type = self.__file_s3_usecase.get_values_from_object_key(decoded_object_key)
 
-        status, event, message = self.__events_repository.query_events(event_id)
+        status, event, message = self.__events_repository.query_events(event_id, use_cache=False)
         if status != HTTPStatus.OK:
             return JSONResponse(status_code=status, content={'message': message})
 
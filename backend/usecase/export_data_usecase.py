@@ -1,23 +1,29 @@
+from __future__ import annotations
+
 import asyncio
 import os
 from http import HTTPStatus
 from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import httpx
-import pandas as pd
 from fastapi.responses import JSONResponse
 from model.pycon_registrations.pycon_registration import PyconExportData
-from openpyxl.drawing.image import Image
-from PIL import Image as PilImage
 from repository.registrations_repository import RegistrationsRepository
 from usecase.pycon_registration_usecase import PyconRegistrationUsecase
 from utils.logger import logger
+from utils.registry import Registry
+
+# pandas, openpyxl, Pillow and httpx are only needed for exports, so they are imported when an export runs
+if TYPE_CHECKING:
+    import httpx
+    import pandas as pd
+    from openpyxl.drawing.image import Image
 
 
 class ExportDataUsecase:
     def __init__(self):
-        self.__registrations_repository = RegistrationsRepository()
+        self.__registrations_repository = Registry.get_repository(RegistrationsRepository)
         self.__pycon_registration_usecase = PyconRegistrationUsecase()
         self.__FIXED_IMAGE_WIDTH_PX = 400
         self.__EXCEL_COLUMN_WIDTH_FACTOR = 0.15
@@ -80,6 +86,8 @@ class ExportDataUsecase:
         return export_data
 
     def _create_dataframe(self, data: list[PyconExportData]) -> tuple[pd.DataFrame, dict]:
+        import pandas as pd
+
         column_mapping = {
             field.name: field.field_info.title
             for field in PyconExportData.__fields__.values()
@@ -97,6 +105,8 @@ class ExportDataUsecase:
         return df, column_mapping
 
     async def _write_excel_with_images_async(self, df: pd.DataFrame, file_name: str, column_mapping: dict) -> str:
+        import pandas as pd
+
         output_file_name = Path(file_name).with_suffix('.xlsx').name
         output_path = os.path.join(os.getcwd(), output_file_name)
 
@@ -112,6 +122,10 @@ class ExportDataUsecase:
         return output_path
 
     async def _download_and_process_image_async(self, client: httpx.AsyncClient, url: str) -> Image | str | None:
+        import httpx
+        from openpyxl.drawing.image import Image
+        from PIL import Image as PilImage
+
         if not url or not isinstance(url, str) or not url.strip():
             return None
 
@@ -149,6 +163,9 @@ class ExportDataUsecase:
             return 'Error: Corrupt image'
 
     async def _embed_images_async(self, worksheet, source_df: pd.DataFrame, final_columns: pd.Index):
+        import httpx
+        from openpyxl.drawing.image import Image
+
         image_column_idx = final_columns.get_loc('ID Image') + 1
         image_column_letter = chr(64 + image_column_idx)
         worksheet.column_dimensions[image_column_letter].width = (
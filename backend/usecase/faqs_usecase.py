@@ -5,12 +5,13 @@ from model.faqs.faqs import FAQsIn, FAQsOut
 from repository.events_repository import EventsRepository
 from repository.faqs_repository import FAQsRepository
 from starlette.responses import JSONResponse
+from utils.registry import Registry
 
 
 class FAQsUsecase:
     def __init__(self):
-        self.__faqs_repository = FAQsRepository()
-        self.__events_repository = EventsRepository()
+        self.__faqs_repository = Registry.get_repository(FAQsRepository)
+        self.__events_repository = Registry.get_repository(EventsRepository)
 
     def create_update_faqs(self, faqs_in: FAQsIn, event_id: str) -> Union[JSONResponse, FAQsOut]:
         """Create or update FAQs for an event
@@ -4,23 +4,18 @@ from datetime import datetime
 from http import HTTPStatus
 from typing import Tuple
 
-from boto3 import client as boto3_client
-from botocore.config import Config
 from botocore.exceptions import ClientError
 from model.events.events_constants import EventUploadField, EventUploadType
 from model.file_uploads.file_upload import FileDownloadOut, FileUploadOut
 from model.file_uploads.file_upload_constants import ClientMethods
 from starlette.responses import JSONResponse
 from utils.logger import logger
+from utils.registry import Registry
 
 
 class FileS3Usecase:
     def __init__(self):
-        self.__s3_client = boto3_client(
-            's3',
-            region_name=os.getenv('REGION', 'ap-southeast-1'),
-            config=Config(signature_version='s3v4'),
-        )
+        self.__s3_client = Registry.get_boto3_client('s3', signature_version='s3v4')
         self.__bucket = os.getenv('S3_BUCKET')
         self.__presigned_url_expiration_time = 30
 
@@ -1,14 +1,14 @@
 import json
 import os
 
-import boto3
 from usecase.payment_tracking_usecase import PaymentTrackingUsecase
 from utils.logger import logger
+from utils.registry import Registry
 
 
 class PaymentTrackingSQSUsecase:
     def __init__(self):
-        self.SQS_CLIENT = boto3.client('sqs')
+        self.SQS_CLIENT = Registry.get_boto3_client('sqs')
         self.PAYMENT_QUEUE = os.environ.get('PAYMENT_QUEUE')
         self.payment_tracking_usecase = PaymentTrackingUsecase()
 
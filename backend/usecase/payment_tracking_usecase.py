@@ -13,15 +13,16 @@ from repository.payment_transaction_repository import PaymentTransactionReposito
 from repository.registrations_repository import RegistrationsRepository
 from usecase.email_usecase import EmailUsecase
 from utils.logger import logger
+from utils.registry import Registry
 
 
 class PaymentTrackingUsecase:
     def __init__(self):
-        self.registration_repository = RegistrationsRepository()
+        self.registration_repository = Registry.get_repository(RegistrationsRepository)
         self.email_usecase = EmailUsecase()
-        self.event_repository = EventsRepository()
-        self.payment_transaction_repository = PaymentTransactionRepository()
-        self.registration_repository = RegistrationsRepository()
+        self.event_repository = Registry.get_repository(EventsRepository)
+        self.payment_transaction_repository = Registry.get_repository(PaymentTransactionRepository)
+        self.registration_repository = Registry.get_repository(RegistrationsRepository)
 
     def process_payment_event(self, message_body: dict) -> None:
         """
@@ -60,11 +61,11 @@ class PaymentTrackingUsecase:
 
             logger.info(f'Payment transaction status updated to {transaction_status} for entryId {entry_id}')
 
-            status, registration_details, _ = self.registration_repository.query_registrations_with_email(
+            status, registration_exists, _ = self.registration_repository.exists_by_email(
                 event_id=event_id, email=registration_data.email
             )
 
-            if status == HTTPStatus.OK and registration_details:
+            if status == HTTPStatus.OK and registration_exists:
                 logger.info(
                     f'Skipping duplicate email for {registration_data.email} - user already has existing registration'
                 )
@@ -77,16 +78,6 @@ class PaymentTrackingUsecase:
                 if not recorded_registration_data:
                     logger.error(f'Failed to save registration for entryId {entry_id}')
 
-            elif transaction_status == TransactionStatus.FAILED:
-                status, registrations, msg = self.registration_repository.query_registrations_with_email(
-                    event_id=event_id, email=registration_data.email
-                )
-                if status == HTTPStatus.OK and registrations:
-                    logger.info(
-                        f'Skipping failed payment email for {registration_data.email} - user already has existing registration'
-                    )
-                    return
-
             self._send_email_notification(
                 first_name=registration_data.firstName,
                 email=registration_data.email,
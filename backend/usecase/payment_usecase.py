@@ -17,16 +17,18 @@ from model.pycon_registrations.pycon_registration import (
 from pydantic import ValidationError
 from repository.events_repository import EventsRepository
 from repository.payment_transaction_repository import PaymentTransactionRepository
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from usecase.email_usecase import EmailUsecase
 from usecase.pycon_registration_usecase import PyconRegistrationUsecase
 from utils.logger import logger
+from utils.registry import Registry
+from utils.utils import Utils
 
 
 class PaymentUsecase:
     def __init__(self):
-        self.payment_repo = PaymentTransactionRepository()
-        self.events_repo = EventsRepository()
+        self.payment_repo = Registry.get_repository(PaymentTransactionRepository)
+        self.events_repo = Registry.get_repository(EventsRepository)
         self.pycon_registration_usecase = PyconRegistrationUsecase()
         self.email_usecase = EmailUsecase()
 
@@ -84,18 +86,35 @@ class PaymentUsecase:
         payment_transaction_dict = self.__convert_data_entry_to_dict(updated_payment_transaction)
         return PaymentTransactionOut(**payment_transaction_dict)
 
-    def query_pending_payment_transactions(self) -> list[PaymentTransactionOut]:
+    def query_pending_payment_transactions(
+        self, limit: int = None, cursor: str = None, response: Response = None
+    ) -> list[PaymentTransactionOut]:
         """
         Query all pending payment transactions
 
+        Keyword Arguments:
+            limit -- The maximum number of payment transactions to return (default: {None})
+            cursor -- The cursor of the page to return, from the X-Next-Cursor header (default: {None})
+            response -- The response where the cursor of the next page is set (default: {None})
+
         Returns:
             list[PaymentTransactionOut] -- The list of payment transactions
         """
-        status, payment_transactions, message = self.payment_repo.query_pending_payment_transactions()
+        scope = 'payments#pending'
+        try:
+            last_evaluated_key = Utils.decode_cursor(cursor, scope=scope)
+        except ValueError as e:
+            return JSONResponse(status_code=HTTPStatus.BAD_REQUEST, content={'message': str(e)})
+
+        status, payment_transactions, next_key, message = self.payment_repo.query_pending_payment_transactions(
+            limit=limit, last_evaluated_key=last_evaluated_key
+        )
         if status != HTTPStatus.OK:
             logger.error(f'[{message}]')
             return JSONResponse(status_code=status, content={'message': message})
 
+        Utils.set_next_cursor(response, Utils.encode_cursor(next_key, scope=scope))
+
         payment_transaction_list = []
         for payment_transaction in payment_transactions:
             payment_transaction_data = self.__convert_data_entry_to_dict(payment_transaction)
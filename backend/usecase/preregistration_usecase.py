@@ -14,10 +14,12 @@ from model.preregistrations.preregistration import (
 )
 from repository.events_repository import EventsRepository
 from repository.preregistrations_repository import PreRegistrationsRepository
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from usecase.email_usecase import EmailUsecase
 from usecase.file_s3_usecase import FileS3Usecase
 from utils.logger import logger
+from utils.registry import Registry
+from utils.utils import Utils
 
 
 class PreRegistrationUsecase:
@@ -31,8 +33,8 @@ class PreRegistrationUsecase:
     """
 
     def __init__(self):
-        self.__preregistrations_repository = PreRegistrationsRepository()
-        self.__events_repository = EventsRepository()
+        self.__preregistrations_repository = Registry.get_repository(PreRegistrationsRepository)
+        self.__events_repository = Registry.get_repository(EventsRepository)
         self.__email_usecase = EmailUsecase()
         self.__file_s3_usecase = FileS3Usecase()
 
@@ -61,12 +63,10 @@ class PreRegistrationUsecase:
         # Check if the pre-registration with the same email already exists
         event_id = preregistration_in.eventId
         email = preregistration_in.email
-        (
-            status,
-            preregistrations,
-            message,
-        ) = self.__preregistrations_repository.query_preregistrations_with_email(event_id=event_id, email=email)
-        if status == HTTPStatus.OK and preregistrations:
+        status, preregistration_exists, message = self.__preregistrations_repository.exists_by_email(
+            event_id=event_id, email=email
+        )
+        if status == HTTPStatus.OK and preregistration_exists:
             return JSONResponse(
                 status_code=HTTPStatus.CONFLICT,
                 content={'message': f'Pre-registration with email {email} already exists'},
@@ -195,12 +195,23 @@ class PreRegistrationUsecase:
 
         return PreRegistrationOut(**preregistration_data)
 
-    def get_preregistrations(self, event_id: str = None) -> Union[JSONResponse, List[PreRegistrationOut]]:
+    def get_preregistrations(
+        self, event_id: str = None, limit: int = None, cursor: str = None, response: Response = None
+    ) -> Union[JSONResponse, List[PreRegistrationOut]]:
         """Retrieves a list of pre-registration preregistration_entries.
 
         :param event_id: If provided, only retrieves pre-registration entries for the specified event. If not provided, retrieves all pre-registration entries.
         :type event_id: str, optional
 
+        :param limit: If provided, only retrieves up to this number of pre-registration entries.
+        :type limit: int, optional
+
+        :param cursor: The cursor of the page to retrieve, as returned in the X-Next-Cursor header of the previous page.
+        :type cursor: str, optional
+
+        :param response: The response where the cursor of the next page is set.
+        :type response: Response, optional
+
         :return: If successful, returns a list of pre-registration entries. If unsuccessful, returns a JSONResponse with an error message.
         :rtype: Union[JSONResponse, List[PreRegistrationOut]]
 
@@ -209,14 +220,27 @@ class PreRegistrationUsecase:
         if status != HTTPStatus.OK:
             return JSONResponse(status_code=status, content={'message': message})
 
+        scope = f'preregistrations#{event_id}'
+        try:
+            last_evaluated_key = Utils.decode_cursor(cursor, scope=scope)
+        except ValueError as e:
+            return JSONResponse(status_code=HTTPStatus.BAD_REQUEST, content={'message': str(e)})
+
         (
             status,
             preregistrations,
+            next_key,
             message,
-        ) = self.__preregistrations_repository.query_preregistrations(event_id=event_id)
+        ) = self.__preregistrations_repository.query_preregistrations_page(
+            event_id=event_id, limit=limit, last_evaluated_key=last_evaluated_key
+        )
         if status != HTTPStatus.OK:
             return JSONResponse(status_code=status, content={'messsage': message})
 
+        if not preregistrations and not last_evaluated_key:
+            return JSONResponse(status_code=HTTPStatus.NOT_FOUND, content={'message': 'No pre-registration found'})
+
+        Utils.set_next_cursor(response, Utils.encode_cursor(next_key, scope=scope))
         return [
             PreRegistrationOut(**self.__convert_data_entry_to_dict(preregistration))
             for preregistration in preregistrations
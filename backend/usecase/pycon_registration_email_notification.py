@@ -9,13 +9,14 @@ from repository.events_repository import EventsRepository
 from repository.registrations_repository import RegistrationsRepository
 from usecase.email_usecase import EmailUsecase
 from utils.logger import logger
+from utils.registry import Registry
 
 
 class PyConRegistrationEmailNotification:
     def __init__(self):
         self.__email_usecase = EmailUsecase()
-        self.__registrations_repository = RegistrationsRepository()
-        self.__events_repository = EventsRepository()
+        self.__registrations_repository = Registry.get_repository(RegistrationsRepository)
+        self.__events_repository = Registry.get_repository(EventsRepository)
 
     def send_registration_success_email(self, email: str, event: Event, is_pycon_event: bool = True) -> None:
         logger.info(f'Preparing to send registration success email to {email} for event {event.name}')
@@ -7,6 +7,7 @@ from typing import List, Union
 import ulid
 from model.events.events_constants import EventStatus
 from model.file_uploads.file_upload import FileDownloadOut
+from model.outbox.registration_outbox import OutboxEffect
 from model.pycon_registrations.pycon_registration import (
     PyconRegistrationIn,
     PyconRegistrationOut,
@@ -14,13 +15,16 @@ from model.pycon_registrations.pycon_registration import (
 )
 from repository.events_repository import EventsRepository
 from repository.payment_transaction_repository import PaymentTransactionRepository
+from repository.registration_outbox_repository import RegistrationOutboxRepository
 from repository.registrations_repository import RegistrationsRepository
 from repository.ticket_type_repository import TicketTypeRepository
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from usecase.discount_usecase import DiscountUsecase
 from usecase.email_usecase import EmailUsecase
 from usecase.file_s3_usecase import FileS3Usecase
 from utils.logger import logger
+from utils.registry import Registry
+from utils.utils import Utils
 
 
 class PyconRegistrationUsecase:
@@ -35,13 +39,14 @@ class PyconRegistrationUsecase:
     """
 
     def __init__(self):
-        self.__registrations_repository = RegistrationsRepository()
-        self.__events_repository = EventsRepository()
+        self.__registrations_repository = Registry.get_repository(RegistrationsRepository)
+        self.__events_repository = Registry.get_repository(EventsRepository)
         self.__email_usecase = EmailUsecase()
         self.__discount_usecase = DiscountUsecase()
         self.__file_s3_usecase = FileS3Usecase()
-        self.__ticket_type_repository = TicketTypeRepository()
-        self.__payment_transaction_repository = PaymentTransactionRepository()
+        self.__ticket_type_repository = Registry.get_repository(TicketTypeRepository)
+        self.__payment_transaction_repository = Registry.get_repository(PaymentTransactionRepository)
+        self.__registration_outbox_repository = Registry.get_repository(RegistrationOutboxRepository)
 
     def create_pycon_registration(
         self, registration_in: PyconRegistrationIn
@@ -113,13 +118,19 @@ class PyconRegistrationUsecase:
 
         # Check if the registration with the same email already exists
         email = registration_in.email
-        (
-            status,
-            registrations,
-            message,
-        ) = self.__registrations_repository.query_registrations_with_email(event_id=event_id, email=email)
-        if status == HTTPStatus.OK and registrations:
+        status, registration_exists, message = self.__registrations_repository.exists_by_email(
+            event_id=event_id, email=email
+        )
+        if status == HTTPStatus.OK and registration_exists:
             logger.info(f'Registration with email {email} already exists, returning existing registration')
+            (
+                status,
+                registrations,
+                message,
+            ) = self.__registrations_repository.query_registrations_with_email(event_id=event_id, email=email)
+            if status != HTTPStatus.OK:
+                return JSONResponse(status_code=status, content={'message': message})
+
             registration = registrations[0]
             registration_data = self.__convert_data_entry_to_dict(registration)
             registration_out = PyconRegistrationOut(**registration_data)
@@ -162,44 +173,43 @@ class PyconRegistrationUsecase:
                 )
 
         registration_id = ulid.ulid()
+        discount_entry = None
         discount_code = registration_in.discountCode
         if discount_code:
-            claimed_discount = self.__discount_usecase.claim_discount(
+            discount_entry = self.__discount_usecase.get_claimable_discount(
                 entry_id=discount_code,
                 registration_id=registration_id,
                 event_id=event_id,
             )
-            if isinstance(claimed_discount, JSONResponse):
-                return claimed_discount
+            if isinstance(discount_entry, JSONResponse):
+                return discount_entry
+
+        # The confirmation email is recorded in the outbox and sent by the registration outbox handler, so it is retried
+        # if sending fails
+        outbox_entries = self.__registration_outbox_repository.build_outbox_entries(
+            event_id=event_id, registration_id=registration_id, effects=[OutboxEffect.REGISTRATION_EMAIL]
+        )
 
+        # The registration, event counters, ticket sales, discount claim and outbox are written in one transaction
         (
             status,
             registration,
             message,
-        ) = self.__registrations_repository.store_registration(
-            registration_in=registration_in, registration_id=registration_id
+        ) = self.__registrations_repository.commit_registration(
+            registration_in=registration_in,
+            registration_id=registration_id,
+            event_entry=event,
+            registration_sprint_day=registration_in.sprintDay,
+            ticket_type_entry=ticket_type_entry,
+            discount_entry=discount_entry,
+            outbox_entries=outbox_entries,
         )
         if status != HTTPStatus.OK:
             return JSONResponse(status_code=status, content={'message': message})
 
-        status, __, message = self.__events_repository.append_event_registration_count(
-            event_entry=event, registration_sprint_day=registration_in.sprintDay
-        )
-        if status != HTTPStatus.OK:
-            return JSONResponse(status_code=status, content={'message': message})
-
-        if ticket_type_entry:
-            status, __, message = self.__ticket_type_repository.append_ticket_type_sales(
-                ticket_type_entry=ticket_type_entry
-            )
-            if status != HTTPStatus.OK:
-                return JSONResponse(status_code=status, content={'message': message})
+        self.__events_repository.cache_event(event_entry=event)
 
         registration_data = self.__convert_data_entry_to_dict(registration)
-
-        if not registration.registrationEmailSent:
-            self.__email_usecase.send_registration_creation_email(registration=registration, event=event)
-
         registration_out = PyconRegistrationOut(**registration_data)
         return self.collect_pre_signed_url_pycon(registration_out)
 
@@ -309,13 +319,27 @@ class PyconRegistrationUsecase:
         return self.collect_pre_signed_url_pycon(registration_out)
 
     def get_pycon_registrations(
-        self, event_id: str = None, is_deleted: bool = False
+        self,
+        event_id: str = None,
+        is_deleted: bool = False,
+        limit: int = None,
+        cursor: str = None,
+        response: Response = None,
     ) -> Union[JSONResponse, List[PyconRegistrationOut]]:
         """Retrieves a list of PyCon registration entries.
 
         :param event_id: If provided, only retrieves registration entries for the specified event. If not provided, retrieves all registration entries.
         :type event_id: str, optional
 
+        :param limit: If provided, only retrieves up to this number of registration entries.
+        :type limit: int, optional
+
+        :param cursor: The cursor of the page to retrieve, as returned in the X-Next-Cursor header of the previous page.
+        :type cursor: str, optional
+
+        :param response: The response where the cursor of the next page is set.
+        :type response: Response, optional
+
         :return: If successful, returns a list of registration entries. If unsuccessful, returns a JSONResponse with an error message.
         :rtype: Union[JSONResponse, List[PyconRegistrationOut]]
 
@@ -324,14 +348,27 @@ class PyconRegistrationUsecase:
         if status != HTTPStatus.OK:
             return JSONResponse(status_code=status, content={'message': message})
 
+        scope = f'registrations#{event_id}'
+        try:
+            last_evaluated_key = Utils.decode_cursor(cursor, scope=scope)
+        except ValueError as e:
+            return JSONResponse(status_code=HTTPStatus.BAD_REQUEST, content={'message': str(e)})
+
         (
             status,
             registrations,
+            next_key,
             message,
-        ) = self.__registrations_repository.query_registrations(event_id=event_id, is_deleted=is_deleted)
+        ) = self.__registrations_repository.query_registrations_page(
+            event_id=event_id, limit=limit, last_evaluated_key=last_evaluated_key, is_deleted=is_deleted
+        )
         if status != HTTPStatus.OK:
             return JSONResponse(status_code=status, content={'message': message})
 
+        if not registrations and not last_evaluated_key:
+            return JSONResponse(status_code=HTTPStatus.NOT_FOUND, content={'message': 'No registration found'})
+
+        Utils.set_next_cursor(response, Utils.encode_cursor(next_key, scope=scope))
         return [
             self.collect_pre_signed_url_pycon(PyconRegistrationOut(**self.__convert_data_entry_to_dict(registration)))
             for registration in registrations
@@ -0,0 +1,176 @@
+from http import HTTPStatus
+from typing import Callable, List, Tuple
+
+from constants.common_constants import CommonConstants
+from constants.konhub_constants import KonfHubConstants
+from model.outbox.registration_outbox import OutboxEffect, RegistrationOutbox
+from repository.events_repository import EventsRepository
+from repository.registration_outbox_repository import RegistrationOutboxRepository
+from repository.registrations_repository import RegistrationsRepository
+from starlette.responses import JSONResponse
+from usecase.email_usecase import EmailUsecase
+from usecase.registration_usecase import RegistrationUsecase
+from utils.logger import logger
+from utils.registry import Registry
+
+
+class RegistrationOutboxUsecase:
+    """
+    Carries out the side effects of registrations recorded in the outbox, outside of the registration request.
+
+    Each outbox entry is claimed with a lease before its side effect runs, so the stream and the scheduled sweep can
+    both drain the outbox without running a side effect twice at the same time.
+    """
+
+    def __init__(self):
+        self.__registration_outbox_repository = Registry.get_repository(RegistrationOutboxRepository)
+        self.__registrations_repository = Registry.get_repository(RegistrationsRepository)
+        self.__events_repository = Registry.get_repository(EventsRepository)
+        self.__email_usecase = EmailUsecase()
+        self.__registration_usecase = RegistrationUsecase()
+
+    def process_stream_records(self, records: List[dict]) -> List[dict]:
+        """Carry out the side effects of the outbox entries inserted in the stream records.
+
+        :param records: The DynamoDB stream records of the inserted outbox entries.
+        :type records: List[dict]
+
+        :return: The batch item failures, Lambda resumes the shard from the earliest failed record.
+        :rtype: List[dict]
+
+        """
+        failed_sequence_numbers = []
+        for record in records:
+            keys = record['dynamodb']['Keys']
+            status, _ = self.process_outbox_entry(hash_key=keys['hashKey']['S'], range_key=keys['rangeKey']['S'])
+            if status != HTTPStatus.OK:
+                failed_sequence_numbers.append(record['dynamodb']['SequenceNumber'])
+
+        if not failed_sequence_numbers:
+            return []
+
+        return [{'itemIdentifier': failed_sequence_numbers[0]}]
+
+    def process_pending_outbox_entries(self, get_remaining_time_in_millis: Callable[[], int]) -> Tuple[int, int]:
+        """Carry out the side effects of the outbox entries left pending, e.g. after the stream gave up on them.
+
+        Only entries older than OUTBOX_SWEEP_DELAY_SECONDS are picked up, newer ones are still handled by the stream.
+        The sweep stops before the invocation runs out of time, the remaining entries are left for the next one.
+
+        :param get_remaining_time_in_millis: Returns the milliseconds left in the invocation, e.g. from the context.
+        :type get_remaining_time_in_millis: Callable[[], int]
+
+        :return: The number of processed and failed outbox entries.
+        :rtype: Tuple[int, int]
+
+        """
+        status, outbox_entries, _ = self.__registration_outbox_repository.query_pending_outbox_entries(
+            older_than_seconds=CommonConstants.OUTBOX_SWEEP_DELAY_SECONDS,
+            limit=CommonConstants.OUTBOX_SWEEP_LIMIT,
+        )
+        if status != HTTPStatus.OK:
+            return 0, 0
+
+        processed_count = 0
+        failed_count = 0
+        for outbox_entry in outbox_entries:
+            if get_remaining_time_in_millis() < CommonConstants.OUTBOX_SWEEP_MIN_REMAINING_MS:
+                logger.info(f'Stopping the outbox sweep, {len(outbox_entries) - processed_count} entries left')
+                break
+
+            status, _ = self.process_outbox_entry(hash_key=outbox_entry.hashKey, range_key=outbox_entry.rangeKey)
+            processed_count += 1
+            if status != HTTPStatus.OK:
+                failed_count += 1
+
+        return processed_count, failed_count
+
+    def process_outbox_entry(self, hash_key: str, range_key: str) -> Tuple[HTTPStatus, str]:
+        """Claim an outbox entry, carry out its side effect and release it.
+
+        :param hash_key: The hash key of the outbox entry.
+        :type hash_key: str
+
+        :param range_key: The range key of the outbox entry.
+        :type range_key: str
+
+        :return: The status and message. The status is OK if the entry needs no further attempt now, including when
+            it is handled by another worker, has run out of attempts or was deferred for the scheduled sweep.
+        :rtype: Tuple[HTTPStatus, str]
+
+        """
+        status, outbox_entry, message = self.__registration_outbox_repository.claim_outbox_entry(
+            hash_key=hash_key, range_key=range_key
+        )
+        if status == HTTPStatus.CONFLICT:
+            return HTTPStatus.OK, message
+        if status != HTTPStatus.OK:
+            return status, message
+
+        try:
+            effect_status, effect_message = self.__carry_out_effect(outbox_entry)
+        except Exception as e:
+            effect_status, effect_message = HTTPStatus.INTERNAL_SERVER_ERROR, f'Unexpected error: {str(e)}'
+
+        # KonfHub was not called because its circuit is open, the sweep tries again once it may have recovered
+        if effect_status == HTTPStatus.SERVICE_UNAVAILABLE:
+            status, _, message = self.__registration_outbox_repository.defer_outbox_entry(
+                outbox_entry=outbox_entry, delay_seconds=KonfHubConstants.CIRCUIT_OPEN_SECONDS, reason=effect_message
+            )
+            return status, message or effect_message
+
+        error = None
+        if effect_status != HTTPStatus.OK:
+            error = effect_message or f'Failed with status {effect_status.value}'
+            logger.error(
+                f'[{outbox_entry.rangeKey}] {outbox_entry.effect} attempt {outbox_entry.attempts} failed: {error}'
+            )
+
+        status, outbox_entry, message = self.__registration_outbox_repository.release_outbox_entry(
+            outbox_entry=outbox_entry, error=error
+        )
+        if status != HTTPStatus.OK:
+            return status, message
+
+        if error and outbox_entry.attempts < CommonConstants.OUTBOX_MAX_ATTEMPTS:
+            return effect_status, error
+
+        return HTTPStatus.OK, error
+
+    def __carry_out_effect(self, outbox_entry: RegistrationOutbox) -> Tuple[HTTPStatus, str]:
+        """Carry out the side effect of an outbox entry.
+
+        :param outbox_entry: The claimed outbox entry.
+        :type outbox_entry: RegistrationOutbox
+
+        :return: The status and message
+        :rtype: Tuple[HTTPStatus, str]
+
+        """
+        event_id = outbox_entry.eventId
+        status, event, message = self.__events_repository.query_events(event_id=event_id)
+        if status != HTTPStatus.OK:
+            return status, message
+
+        status, registration, message = self.__registrations_repository.query_registration_with_registration_id(
+            registration_id=outbox_entry.registrationId, event_id=event_id
+        )
+        if status != HTTPStatus.OK:
+            return status, message
+
+        if outbox_entry.effect == OutboxEffect.REGISTRATION_EMAIL.value:
+            if registration.registrationEmailSent:
+                return HTTPStatus.OK, 'Registration email already sent'
+
+            return self.__email_usecase.send_registration_creation_email(registration=registration, event=event)
+
+        if outbox_entry.effect == OutboxEffect.KONFHUB_REGISTRATION.value:
+            konfhub_response = self.__registration_usecase.register_konfhub(
+                registration_in=registration, event_id=event_id, event=event
+            )
+            if isinstance(konfhub_response, JSONResponse):
+                return HTTPStatus(konfhub_response.status_code), konfhub_response.body.decode()
+
+            return HTTPStatus.OK, None
+
+        return HTTPStatus.BAD_REQUEST, f'Unknown outbox effect {outbox_entry.effect}'
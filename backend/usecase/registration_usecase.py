@@ -12,6 +12,7 @@ from model.events.event import Event
 from model.events.events_constants import EventStatus
 from model.file_uploads.file_upload import FileDownloadOut
 from model.konfhub.konfhub import KonfHubCaptureRegistrationIn, RegistrationDetail
+from model.outbox.registration_outbox import OutboxEffect
 from model.registrations.registration import (
     PreRegistrationToRegistrationIn,
     Registration,
@@ -20,14 +21,17 @@ from model.registrations.registration import (
 )
 from repository.events_repository import EventsRepository
 from repository.payment_transaction_repository import PaymentTransactionRepository
+from repository.registration_outbox_repository import RegistrationOutboxRepository
 from repository.registrations_repository import RegistrationsRepository
 from repository.ticket_type_repository import TicketTypeRepository
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from usecase.discount_usecase import DiscountUsecase
 from usecase.email_usecase import EmailUsecase
 from usecase.file_s3_usecase import FileS3Usecase
 from usecase.preregistration_usecase import PreRegistrationUsecase
 from utils.logger import logger
+from utils.registry import Registry
+from utils.utils import Utils
 
 
 class RegistrationUsecase:
@@ -41,15 +45,16 @@ class RegistrationUsecase:
     """
 
     def __init__(self):
-        self.__registrations_repository = RegistrationsRepository()
-        self.__events_repository = EventsRepository()
+        self.__registrations_repository = Registry.get_repository(RegistrationsRepository)
+        self.__events_repository = Registry.get_repository(EventsRepository)
         self.__email_usecase = EmailUsecase()
         self.__discount_usecase = DiscountUsecase()
         self.__file_s3_usecase = FileS3Usecase()
         self.__preregistration_usecase = PreRegistrationUsecase()
-        self.__ticket_type_repository = TicketTypeRepository()
+        self.__ticket_type_repository = Registry.get_repository(TicketTypeRepository)
         self.__konfhub_gateway = KonfHubGateway()
-        self.__payment_transaction_repository = PaymentTransactionRepository()
+        self.__payment_transaction_repository = Registry.get_repository(PaymentTransactionRepository)
+        self.__registration_outbox_repository = Registry.get_repository(RegistrationOutboxRepository)
 
     def create_registration(self, registration_in: RegistrationIn) -> Union[JSONResponse, RegistrationOut]:
         """Creates a new registration entry.
@@ -95,15 +100,81 @@ class RegistrationUsecase:
             if status != HTTPStatus.OK:
                 return JSONResponse(status_code=status, content={'message': message})
 
+        return self.__commit_registration(event=event, registration_in=registration_in, registration_id=ulid.ulid())
+
+    def create_registration_approval_flow(
+        self, event: Event, registration_in: RegistrationIn
+    ) -> Union[JSONResponse, RegistrationOut]:
+        """Creates a new registration entry for an event with approval flow.
+
+        The registration is built from the preregistration with the same email and keeps its ID, then committed like
+        any other registration so slots, tickets and discounts cannot be oversold.
+
+        :param event: The event for which the registration is being created.
+        :type event: Event
+
+        :param registration_in: The data for creating the new registration.
+        :type registration_in: RegistrationIn
+
+        :return: If successful, returns the created registration entry. If unsuccessful, returns a JSONResponse with an error message.
+        :rtype: Union[JSONResponse, RegistrationOut]
+
+        """
+        event_id = registration_in.eventId
+        email = registration_in.email
+        preregistration = self.__preregistration_usecase.get_preregistration_by_email(event_id=event_id, email=email)
+
+        if isinstance(preregistration, JSONResponse):
+            return preregistration
+
+        registration_data = PreRegistrationToRegistrationIn(**preregistration.dict()).dict()
+        registration_data.update(
+            ticketTypeId=registration_in.ticketTypeId,
+            discountCode=registration_in.discountCode,
+            referenceNumber=registration_in.referenceNumber,
+            amountPaid=registration_in.amountPaid,
+        )
+        return self.__commit_registration(
+            event=event,
+            registration_in=RegistrationIn(**registration_data),
+            registration_id=preregistration.preRegistrationId,
+        )
+
+    def __commit_registration(
+        self, event: Event, registration_in: RegistrationIn, registration_id: str
+    ) -> Union[JSONResponse, RegistrationOut]:
+        """Checks the slots, ticket type and discount of a new registration and commits it in one transaction.
+
+        :param event: The event for which the registration is being created.
+        :type event: Event
+
+        :param registration_in: The data of the new registration.
+        :type registration_in: RegistrationIn
+
+        :param registration_id: The ID of the new registration.
+        :type registration_id: str
+
+        :return: If successful, returns the created registration entry, or the existing one with the same email. If unsuccessful, returns a JSONResponse with an error message.
+        :rtype: Union[JSONResponse, RegistrationOut]
+
+        """
+        event_id = registration_in.eventId
+
         # Check if the registration with the same email already exists
         email = registration_in.email
-        (
-            status,
-            registrations,
-            message,
-        ) = self.__registrations_repository.query_registrations_with_email(event_id=event_id, email=email)
-        if status == HTTPStatus.OK and registrations:
+        status, registration_exists, message = self.__registrations_repository.exists_by_email(
+            event_id=event_id, email=email
+        )
+        if status == HTTPStatus.OK and registration_exists:
             logger.info(f'Registration with email {email} already exists, returning existing registration')
+            (
+                status,
+                registrations,
+                message,
+            ) = self.__registrations_repository.query_registrations_with_email(event_id=event_id, email=email)
+            if status != HTTPStatus.OK:
+                return JSONResponse(status_code=status, content={'message': message})
+
             registration = registrations[0]
             registration_data = self.__convert_data_entry_to_dict(registration)
             registration_out = RegistrationOut(**registration_data)
@@ -139,108 +210,46 @@ class RegistrationUsecase:
                     content={'message': f'Ticket type {ticket_type_entry.name} is sold out'},
                 )
 
-        registration_id = ulid.ulid()
+        discount_entry = None
         discount_code = registration_in.discountCode
         if discount_code:
-            claimed_discount = self.__discount_usecase.claim_discount(
+            discount_entry = self.__discount_usecase.get_claimable_discount(
                 entry_id=discount_code,
                 registration_id=registration_id,
                 event_id=event_id,
             )
-            if isinstance(claimed_discount, JSONResponse):
-                return claimed_discount
+            if isinstance(discount_entry, JSONResponse):
+                return discount_entry
 
-        (
-            status,
-            registration,
-            message,
-        ) = self.__registrations_repository.store_registration(
-            registration_in=registration_in, registration_id=registration_id
-        )
-        if status != HTTPStatus.OK:
-            return JSONResponse(status_code=status, content={'message': message})
-
-        status, __, message = self.__events_repository.append_event_registration_count(event_entry=event)
-        if status != HTTPStatus.OK:
-            return JSONResponse(status_code=status, content={'message': message})
-
-        if ticket_type_entry:
-            status, __, message = self.__ticket_type_repository.append_ticket_type_sales(
-                ticket_type_entry=ticket_type_entry
-            )
-            if status != HTTPStatus.OK:
-                return JSONResponse(status_code=status, content={'message': message})
-
-        # Capture registration to KonfHub
+        # The KonfHub capture and confirmation email are recorded in the outbox and carried out by the
+        # registration outbox handler, so the request only waits for the transaction
+        outbox_effects = [OutboxEffect.REGISTRATION_EMAIL]
         if event.konfhubId:
-            konfhub_response = self.register_konfhub(registration_in=registration_in, event_id=event_id, event=event)
-            if konfhub_response != HTTPStatus.OK:
-                return konfhub_response
-
-        registration_data = self.__convert_data_entry_to_dict(registration)
+            outbox_effects.append(OutboxEffect.KONFHUB_REGISTRATION)
 
-        if not registration.registrationEmailSent:
-            self.__email_usecase.send_registration_creation_email(registration=registration, event=event)
-
-        registration_out = RegistrationOut(**registration_data)
-        return self.collect_pre_signed_url(registration_out)
-
-    def create_registration_approval_flow(
-        self, event: Event, registration_in: RegistrationIn
-    ) -> Union[JSONResponse, RegistrationOut]:
-        """Creates a new registration entry for an event with approval flow.
-
-        :param event: The event for which the registration is being created.
-        :type event: Event
-
-        :param registration_in: The data for creating the new registration.
-        :type registration_in: RegistrationIn
-
-        :return: If successful, returns the created registration entry. If unsuccessful, returns a JSONResponse with an error message.
-        :rtype: Union[JSONResponse, RegistrationOut]
-
-        """
-        event_id = registration_in.eventId
-        email = registration_in.email
-        preregistration = self.__preregistration_usecase.get_preregistration_by_email(event_id=event_id, email=email)
-
-        if isinstance(preregistration, JSONResponse):
-            return preregistration
-
-        registration_data = preregistration.dict()
-        registration_data_in = PreRegistrationToRegistrationIn(
-            **registration_data,
-            discountCode=registration_in.discountCode,
-            referenceNumber=registration_in.referenceNumber,
-            amountPaid=registration_in.amountPaid,
+        outbox_entries = self.__registration_outbox_repository.build_outbox_entries(
+            event_id=event_id, registration_id=registration_id, effects=outbox_effects
         )
 
-        registration_id = preregistration.preRegistrationId
+        # The registration, event counters, ticket sales, discount claim and outbox are written in one transaction
         (
             status,
             registration,
             message,
-        ) = self.__registrations_repository.store_registration(
-            registration_in=registration_data_in,
+        ) = self.__registrations_repository.commit_registration(
+            registration_in=registration_in,
             registration_id=registration_id,
+            event_entry=event,
+            ticket_type_entry=ticket_type_entry,
+            discount_entry=discount_entry,
+            outbox_entries=outbox_entries,
         )
         if status != HTTPStatus.OK:
             return JSONResponse(status_code=status, content={'message': message})
 
-        status, __, message = self.__events_repository.append_event_registration_count(event_entry=event)
-        if status != HTTPStatus.OK:
-            return JSONResponse(status_code=status, content={'message': message})
-
-        if event.konfhubId:
-            konfhub_response = self.register_konfhub(registration_in=registration_in, event_id=event_id, event=event)
-            if konfhub_response != HTTPStatus.OK:
-                return konfhub_response
+        self.__events_repository.cache_event(event_entry=event)
 
         registration_data = self.__convert_data_entry_to_dict(registration)
-
-        if not registration.registrationEmailSent:
-            self.__email_usecase.send_registration_creation_email(registration=registration, event=event)
-
         registration_out = RegistrationOut(**registration_data)
         return self.collect_pre_signed_url(registration_out)
 
@@ -346,13 +355,27 @@ class RegistrationUsecase:
         return self.collect_pre_signed_url(registration_out)
 
     def get_registrations(
-        self, event_id: str = None, is_deleted: bool = False
+        self,
+        event_id: str = None,
+        is_deleted: bool = False,
+        limit: int = None,
+        cursor: str = None,
+        response: Response = None,
     ) -> Union[JSONResponse, List[RegistrationOut]]:
         """Retrieves a list of registration eregistration_idntries.
 
         :param event_id: If provided, only retrieves registration entries for the specified event. If not provided, retrieves all registration entries.
         :type event_id: str, optional
 
+        :param limit: If provided, only retrieves up to this number of registration entries.
+        :type limit: int, optional
+
+        :param cursor: The cursor of the page to retrieve, as returned in the X-Next-Cursor header of the previous page.
+        :type cursor: str, optional
+
+        :param response: The response where the cursor of the next page is set.
+        :type response: Response, optional
+
         :return: If successful, returns a list of registration entries. If unsuccessful, returns a JSONResponse with an error message.
         :rtype: Union[JSONResponse, List[RegistrationOut]
 
@@ -361,14 +384,27 @@ class RegistrationUsecase:
         if status != HTTPStatus.OK:
             return JSONResponse(status_code=status, content={'message': message})
 
+        scope = f'registrations#{event_id}'
+        try:
+            last_evaluated_key = Utils.decode_cursor(cursor, scope=scope)
+        except ValueError as e:
+            return JSONResponse(status_code=HTTPStatus.BAD_REQUEST, content={'message': str(e)})
+
         (
             status,
             registrations,
+            next_key,
             message,
-        ) = self.__registrations_repository.query_registrations(event_id=event_id, is_deleted=is_deleted)
+        ) = self.__registrations_repository.query_registrations_page(
+            event_id=event_id, limit=limit, last_evaluated_key=last_evaluated_key, is_deleted=is_deleted
+        )
         if status != HTTPStatus.OK:
             return JSONResponse(status_code=status, content={'message': message})
 
+        if not registrations and not last_evaluated_key:
+            return JSONResponse(status_code=HTTPStatus.NOT_FOUND, content={'message': 'No registration found'})
+
+        Utils.set_next_cursor(response, Utils.encode_cursor(next_key, scope=scope))
         return [
             self.collect_pre_signed_url(RegistrationOut(**self.__convert_data_entry_to_dict(registration)))
             for registration in registrations
@@ -476,8 +512,8 @@ class RegistrationUsecase:
         :rtype: RegistrationOut
 
         """
-        if registration.gcashPaymentId:
-            image_id_url = self.__file_s3_usecase.create_download_url(registration.gcashPaymentId)
+        if registration.gcashPayment:
+            image_id_url = self.__file_s3_usecase.create_download_url(registration.gcashPayment)
             registration.gcashPaymentUrl = image_id_url.downloadLink
 
         return registration
@@ -498,7 +534,7 @@ class RegistrationUsecase:
 
         return registration
 
-    def register_konfhub(self, registration_in: RegistrationIn, event_id: str, event: Event):
+    def register_konfhub(self, registration_in: Union[RegistrationIn, Registration], event_id: str, event: Event):
         ticket_type_id = registration_in.ticketTypeId
         if not ticket_type_id:
             _, ticket_types_entries, _ = self.__ticket_type_repository.query_ticket_types(event_id=event_id)
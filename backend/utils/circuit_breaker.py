@@ -0,0 +1,68 @@
+import threading
+import time
+from typing import Optional
+
+from utils.logger import logger
+
+
+class CircuitBreaker:
+    """In-process circuit breaker for calls to an external service.
+
+    After failure_threshold consecutive failures the circuit opens and calls fail fast for open_seconds. Then a single
+    call is let through to probe the service: a success closes the circuit, a failure keeps it open for another
+    open_seconds. The state lives as long as the Lambda container, it is not shared between containers.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, open_seconds: float) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.__lock = threading.Lock()
+        self.__failures = 0
+        self.__opened_at: Optional[float] = None
+
+    def allow_request(self) -> bool:
+        """Check if a call may be made.
+
+        :return: False while the circuit is open, True when it is closed or for the probe of a half-open circuit.
+        :rtype: bool
+
+        """
+        with self.__lock:
+            if self.__opened_at is None:
+                return True
+
+            now = time.monotonic()
+            if now - self.__opened_at < self.open_seconds:
+                return False
+
+            # The other calls keep failing fast until the probe reports back, or for another open_seconds
+            self.__opened_at = now
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        with self.__lock:
+            if self.__opened_at is not None:
+                logger.info(f'{self.name} circuit closed')
+
+            self.__failures = 0
+            self.__opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit once there are failure_threshold in a row."""
+        with self.__lock:
+            self.__failures += 1
+            if self.__failures < self.failure_threshold:
+                return
+
+            if self.__opened_at is None:
+                logger.error(f'{self.name} circuit opened after {self.__failures} failures in a row')
+
+            self.__opened_at = time.monotonic()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently failing fast."""
+        with self.__lock:
+            return self.__opened_at is not None and time.monotonic() - self.__opened_at < self.open_seconds
@@ -0,0 +1,95 @@
+import os
+import threading
+from typing import Any, Dict, Type, TypeVar
+
+from boto3 import client as boto3_client
+from botocore.config import Config
+from pynamodb.connection import Connection
+
+T = TypeVar('T')
+
+
+class Registry:
+    """Process-wide cache of repositories, PynamoDB connections and boto3 clients.
+
+    Module state survives between warm Lambda invocations, so everything stored here is built
+    once per container instead of once per request. Only stateless objects may be registered,
+    values that change per request (e.g. the current date) must be computed on every call.
+    """
+
+    __lock = threading.RLock()
+    __instances: Dict[Any, Any] = {}
+
+    @classmethod
+    def get_repository(cls, repository_cls: Type[T]) -> T:
+        """Get the shared instance of a repository, creating it on first use.
+
+        :param repository_cls: The repository class to be instantiated.
+        :type repository_cls: Type[T]
+
+        :return: The shared repository instance.
+        :rtype: T
+
+        """
+        return cls.__get_or_create(('repository', repository_cls), repository_cls)
+
+    @classmethod
+    def get_connection(cls, region: str = None) -> Connection:
+        """Get the shared PynamoDB connection used for transactions.
+
+        :param region: The AWS region, defaults to the REGION environment variable.
+        :type region: str
+
+        :return: The shared PynamoDB connection.
+        :rtype: Connection
+
+        """
+        region = region or os.getenv('REGION')
+        return cls.__get_or_create(('connection', region), lambda: Connection(region=region))
+
+    @classmethod
+    def get_boto3_client(cls, service_name: str, region_name: str = None, signature_version: str = None) -> Any:
+        """Get the shared boto3 client for a service.
+
+        :param service_name: The AWS service name (e.g. sqs, s3).
+        :type service_name: str
+
+        :param region_name: The AWS region, defaults to the REGION environment variable.
+        :type region_name: str
+
+        :param signature_version: The signature version of the client (optional).
+        :type signature_version: str
+
+        :return: The shared boto3 client.
+        :rtype: Any
+
+        """
+        region_name = region_name or os.getenv('REGION', 'ap-southeast-1')
+        key = ('boto3', service_name, region_name, signature_version)
+
+        def create_client():
+            config = Config(signature_version=signature_version) if signature_version else None
+            return boto3_client(service_name, region_name=region_name, config=config)
+
+        return cls.__get_or_create(key, create_client)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every cached object, forcing them to be rebuilt on next use."""
+        with cls.__lock:
+            cls.__instances.clear()
+
+    @classmethod
+    def __get_or_create(cls, key: Any, factory) -> Any:
+        instance = cls.__instances.get(key)
+        if instance is not None:
+            return instance
+
+        # boto3 client creation is not thread-safe, so creation is serialized
+        with cls.__lock:
+            instance = cls.__instances.get(key)
+            if instance is None:
+                instance = factory()
+                cls.__instances[key] = instance
+
+        return instance
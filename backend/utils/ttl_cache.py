@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """In-process LRU cache whose entries expire after a fixed number of seconds.
+
+    Values are deep copied on the way in and out, so callers can freely mutate what they get back.
+    The cache lives as long as the Lambda container, it is not shared between containers.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.__lock = threading.Lock()
+        self.__entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value from the cache.
+
+        :param key: The cache key.
+        :type key: Hashable
+
+        :return: A copy of the cached value, or None if it is missing or expired.
+        :rtype: Optional[Any]
+
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self.__entries[key]
+                return None
+
+            self.__entries.move_to_end(key)
+
+        return deepcopy(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value in the cache, evicting the least recently used entry when full.
+
+        :param key: The cache key.
+        :type key: Hashable
+
+        :param value: The value to cache.
+        :type value: Any
+
+        """
+        entry = (time.monotonic() + self.ttl_seconds, deepcopy(value))
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a value from the cache.
+
+        :param key: The cache key.
+        :type key: Hashable
+
+        """
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every value from the cache."""
+        with self.__lock:
+            self.__entries.clear()
@@ -1,3 +1,14 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+from typing import Optional
+
+from constants.common_constants import CommonConstants
+from starlette.responses import Response
+
+
 class Utils:
     @staticmethod
     def convert_to_slug(name: str):
@@ -11,3 +22,117 @@ class Utils:
 
         """
         return name.lower().replace(' ', '-')
+
+    @staticmethod
+    def encode_cursor(last_evaluated_key: dict, scope: str) -> Optional[str]:
+        """Encode a DynamoDB last evaluated key into an opaque, signed cursor.
+
+        :param last_evaluated_key: The last evaluated key returned by DynamoDB
+        :type last_evaluated_key: dict
+
+        :param scope: The listing the cursor belongs to, a cursor is only valid for the same scope
+        :type scope: str
+
+        :raises RuntimeError: If PAGINATION_SECRET is not set, cursors are never signed with an empty key
+
+        :return: The cursor, or None if there are no more pages
+        :rtype: Optional[str]
+
+        """
+        if not last_evaluated_key:
+            return None
+
+        payload = json.dumps({'key': last_evaluated_key, 'scope': scope}, separators=(',', ':'), sort_keys=True)
+        payload_b64 = base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+        return f'{payload_b64}.{Utils.__sign_cursor(payload_b64)}'
+
+    @staticmethod
+    def decode_cursor(cursor: str, scope: str) -> Optional[dict]:
+        """Decode and verify a cursor created by encode_cursor.
+
+        :param cursor: The cursor sent by the client
+        :type cursor: str
+
+        :param scope: The listing the cursor is expected to belong to
+        :type scope: str
+
+        :raises ValueError: If the cursor is malformed, tampered with, or belongs to another scope
+        :raises RuntimeError: If PAGINATION_SECRET is not set, cursors are never accepted without a key
+
+        :return: The DynamoDB last evaluated key, or None if no cursor is given
+        :rtype: Optional[dict]
+
+        """
+        if not cursor:
+            return None
+
+        payload_b64, _, signature = cursor.partition('.')
+        if not signature or not hmac.compare_digest(signature, Utils.__sign_cursor(payload_b64)):
+            raise ValueError('Invalid cursor')
+
+        try:
+            padding = '=' * (-len(payload_b64) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(payload_b64 + padding))
+        except ValueError as e:
+            raise ValueError('Invalid cursor') from e
+
+        if payload.get('scope') != scope or not isinstance(payload.get('key'), dict):
+            raise ValueError('Invalid cursor')
+
+        return payload['key']
+
+    @staticmethod
+    def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+        """Expose the cursor of the next page in the response headers.
+
+        :param response: The response of the current request
+        :type response: Response
+
+        :param next_cursor: The cursor of the next page
+        :type next_cursor: Optional[str]
+
+        """
+        if response is None or not next_cursor:
+            return
+
+        response.headers[CommonConstants.NEXT_CURSOR_HEADER] = next_cursor
+        response.headers['Access-Control-Expose-Headers'] = CommonConstants.NEXT_CURSOR_HEADER
+
+    @staticmethod
+    def get_message_group_id(prefix: str, shard_key: Optional[str], shard_count: int) -> str:
+        """Get the SQS FIFO message group of a message, sharding the messages of a prefix into a fixed number of groups.
+
+        Messages with the same shard key always land in the same group, so they keep their order, while the other
+        groups are consumed in parallel.
+
+        :param prefix: The message group of the unsharded messages, e.g. one per event
+        :type prefix: str
+
+        :param shard_key: The key whose messages must stay in order, e.g. the recipient, None to use the prefix
+        :type shard_key: Optional[str]
+
+        :param shard_count: The number of groups per prefix, 1 to disable sharding, 0 for one group per shard key
+        :type shard_count: int
+
+        :return: The message group ID
+        :rtype: str
+
+        """
+        if not shard_key or shard_count == 1:
+            return prefix
+
+        if shard_count <= 0:
+            return f'{prefix}-{shard_key}'
+
+        # A stable hash, Python's hash() changes between processes
+        shard = int(hashlib.sha256(shard_key.encode()).hexdigest(), 16) % shard_count
+        return f'{prefix}-{shard}'
+
+    @staticmethod
+    def __sign_cursor(payload_b64: str) -> str:
+        secret = os.getenv('PAGINATION_SECRET')
+        if not secret:
+            raise RuntimeError('PAGINATION_SECRET is not set, refusing to sign or verify cursors')
+
+        digest = hmac.new(secret.encode(), payload_b64.encode(), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).decode().rstrip('=')